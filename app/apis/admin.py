@@ -0,0 +1,30 @@
+import asyncio
+import threading
+
+from fastapi import APIRouter, Query
+from fastapi.responses import PlainTextResponse
+
+from app.config import settings
+from app.deps import ADMIN_USER
+from app.handlers.diagnostics import StackSampler
+
+admin_router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@admin_router.get("/profile", response_class=PlainTextResponse)
+async def profile(
+    user: ADMIN_USER,
+    seconds: float = Query(default=10, gt=0, le=settings.PROFILER_MAX_SECONDS),
+    interval_ms: float = Query(default=5, ge=1, le=1000, description="sampling 간격"),
+    all_threads: bool = Query(default=False, description="False면 event loop thread만"),
+) -> PlainTextResponse:
+    """### 이 worker의 stack을 seconds 동안 sampling (관리자 전용)
+
+    collapsed stack 형식으로 반환 (flamegraph.pl, speedscope 등에서 사용).
+    이미 실행 중이면 409.
+    """
+
+    # * 이 handler는 event loop thread에서 실행되므로 여기서 loop thread id를 얻음
+    thread_id = None if all_threads else threading.get_ident()
+    stacks = await asyncio.to_thread(StackSampler.sample, seconds, interval_ms / 1000, thread_id)
+    return PlainTextResponse(StackSampler.collapse(stacks))
@@ -1,10 +1,15 @@
-import asyncio
-from datetime import datetime
-
-from fastapi import FastAPI, WebSocket
+from fastapi import APIRouter, Path, Query, WebSocket, status
 from fastapi.responses import HTMLResponse
 from starlette.websockets import WebSocketDisconnect
 
+from app.exceptions import NotFoundException
+from app.handlers.chat import CHAT_HUB, ChatConnection
+from app.schemas.chats import ChatHistorySchema, ChatMessageSchema
+
+STREAM_ID_PATTERN = r"^\d+-\d+$"
+
+chat_router = APIRouter(prefix="/chats", tags=["Chats"])
+
 HTML = """
 <!DOCTYPE html>
 <html>
@@ -20,14 +25,27 @@ HTML = """
         <ul id='messages'>
         </ul>
         <script>
-            var ws = new WebSocket("ws://localhost:8000/ws");
-            ws.onmessage = function(event) {
+            var lastId = null
+            var ws = null
+            function addMessage(data) {
                 var messages = document.getElementById('messages')
                 var message = document.createElement('li')
-                var content = document.createTextNode(event.data)
+                var content = document.createTextNode(data.text)
                 message.appendChild(content)
                 messages.appendChild(message)
-            };
+                if (data.id) lastId = data.id
+            }
+            function connect() {
+                var url = "ws://localhost:8000/chats/ws/lobby"
+                ws = new WebSocket(lastId ? url + "?last_id=" + lastId : url)
+                ws.onmessage = function(event) {
+                    var data = JSON.parse(event.data)
+                    if (data.type === "history") data.messages.forEach(addMessage)
+                    else addMessage(data)
+                };
+                ws.onclose = function() { setTimeout(connect, 1000) };
+            }
+            connect()
             function sendMessage(event) {
                 var input = document.getElementById("messageText")
                 ws.send(input.value)
@@ -40,50 +58,55 @@ HTML = """
 """
 
 
-async def echo_message(websocket: WebSocket) -> None:
-    msg = await websocket.receive_text()
-    await websocket.send_text(f"Message: {msg}")
+@chat_router.get("", include_in_schema=False)
+async def chat_page() -> HTMLResponse:
+    return HTMLResponse(HTML)
 
 
-async def send_time(websocket: WebSocket) -> None:
-    await asyncio.sleep(5)
-    await websocket.send_text(f"time now: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+@chat_router.get("/{room}/history")
+async def chat_history(
+    room: str = Path(..., max_length=50),
+    before: str | None = Query(default=None, pattern=STREAM_ID_PATTERN),
+    limit: int = Query(default=50, ge=1, le=200),
+) -> ChatHistorySchema:
+    """room의 지난 메시지를 최신순으로 조회. 다음 페이지는 next_cursor를 before로 전달
 
+    CHAT_ROOMS에 없는 room은 404, redis 장애 시 503
+    """
 
-# * 실행: uvicorn apps.chat.test:app
-app = FastAPI()
+    if not CHAT_HUB.is_allowed(room):
+        raise NotFoundException
+    items = [ChatMessageSchema(**item) for item in await CHAT_HUB.history(room, before, limit)]
+    next_cursor = items[-1].id if len(items) == limit else None
+    return ChatHistorySchema(items=items, next_cursor=next_cursor)
 
 
-@app.get("/")
-async def get() -> HTMLResponse:
-    return HTMLResponse(HTML)
+@chat_router.websocket("/ws/{room}")
+async def chat_websocket(
+    websocket: WebSocket,
+    room: str = Path(..., max_length=50),
+    last_id: str | None = Query(default=None, pattern=STREAM_ID_PATTERN),
+) -> None:
+    """room에 접속한 모든 클라이언트(다른 worker 포함)에게 받은 메시지를 broadcast
 
+    재접속 시 마지막으로 받은 메시지 id(last_id)를 넘기면 그 이후 메시지를
+    {"type": "history", "messages": [...], "complete": bool} 프레임으로 먼저 보냄.
+    CHAT_ROOMS에 없는 room은 accept 전에 닫음 (handshake 거절)
+    """
 
-@app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket) -> None:
+    if not CHAT_HUB.is_allowed(room):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
     await websocket.accept()  # * 클라이언트에게 서버가 tunnel을 여는 것을 동의한다고 알림 (필수)
+    conn = ChatConnection(websocket, room)
+    # * 송신은 연결별 task가 대기열에서 꺼내서 처리. 여기서는 수신만 담당
     try:
+        await CHAT_HUB.join(conn, last_id)
         while True:
-            # * create_task: coroutine을 Task 객체로 변환
-            # * Task 객체는 asyncio.wait 메서드를 사용하기 위해 필수적임.
-            # * asyncio.wait 메서드는 coroutine을 동시에 실행할 때 매우 유용함.
-            echo_msg_task = asyncio.create_task(echo_message(websocket))
-            send_time_task = asyncio.create_task(send_time(websocket))
-
-            # * 첫 번째 인자로 실행할 Task들의 set을 받음.
-            # * 기본 설정에 의하면 이 함수는 인자로 제공된 Task들이 모두 완료될 때까지 blocking 됨.
-            # * 그러나 return_when 인자를 설정하여 Task 중 1개가 끝나면 blocking된 상태에서 벗어나서 이후의 코드를 수행할 수 있음.
-            # * 반환 값으로는 done, pending 상태에 맞는 Task set을 반환하게 됨.
-            # * pending: 각 set 내에 Task 각각에 대해서 완료가 안된 경우, iteration 마다의 coroutine이 쌓여서 문제가 생길 수 있기 때문에 task.cancel() 수행
-            # * done: 완료된 경우 task.result() 수행. 이는 coroutine 수행 결과물을 반환하고, exception을 re-raise하는 역할을 함. 클라이언트 쪽에서 연결이 끊기는 경우를 다룰 때 유용.
-            done, pending = await asyncio.wait(
-                {echo_msg_task, send_time_task}, return_when=asyncio.FIRST_COMPLETED
-            )
-            for task in pending:
-                task.cancel()
-            for task in done:
-                task.result()
-
+            text = await websocket.receive_text()
+            await CHAT_HUB.send(room, text)
     # * 클라이언트가 연결을 끊으면, receive_text 메서드가 error(WebSocketDisconnect) 발생시킴.
     except WebSocketDisconnect:
-        await websocket.close()
+        pass
+    finally:
+        CHAT_HUB.unregister(conn)
@@ -1,11 +1,74 @@
-from fastapi import APIRouter, Path, Query
+from typing import Annotated, Any, AsyncGenerator, Literal
 
-from app.deps import CURR_USER, DB_SESSION
-from app.models.events import Event
-from app.schemas.events import CreateEventSchema, ReadEventSchema, UpdateEventSchema
+from aioredis import Redis, RedisError
+from fastapi import APIRouter, Body, Header, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+
+from app.config import settings
+from app.deps import CURR_USER, DB_SESSION, READ_DB_SESSION, REDIS
+from app.exceptions import CustomException
+from app.handlers.cursor import CursorHandler
+from app.handlers.db import LazySession, ReadSession, read_session
+from app.handlers.etag import ETagHandler
+from app.handlers.serializer import RowSerializer
+from app.handlers.stats import EventStats
+from app.models.events import STATS_COLUMNS, Event
+from app.schemas.events import (
+    BatchDeleteEventSchema,
+    BatchItemResultSchema,
+    BatchResultSchema,
+    BatchUpdateEventSchema,
+    CreateEventSchema,
+    EventStatsSchema,
+    ReadEventSchema,
+    UpdateEventSchema,
+)
 
 event_router = APIRouter(prefix="/events", tags=["Events"])
 
+EVENT_SERIALIZER = RowSerializer(ReadEventSchema)
+
+# * 통계 계산 중 쓰기가 계속 끼어들면 이 횟수만큼만 다시 계산 (마지막 값은 저장하지 않고 반환)
+STATS_SNAPSHOT_ATTEMPTS = 3
+
+BATCH_BODY = Annotated[list[dict[str, Any]], Body(min_length=1, max_length=settings.BATCH_MAX_SIZE)]
+
+
+async def etag_headers(
+    request: Request, redis: Redis, db: ReadSession, user_id: str
+) -> dict[str, str]:
+    """ETag 헤더. If-None-Match가 현재 ETag와 같으면 NotModifiedException(304)
+
+    version은 primary commit 직후 올라가므로 replica에서 읽은 응답에는 마지막 쓰기가
+    REPLICA_STICKY_SECONDS(복제 지연 상한으로 가정하는 시간)보다 오래됐을 때만 붙임
+    (복제 전 데이터가 새 ETag로 cache되어 다음 쓰기까지 304로 재사용되는 것 방지)
+    """
+
+    min_age = settings.REPLICA_STICKY_SECONDS if db.on_replica else 0
+    if etag := await ETagHandler.check(request, redis, user_id, min_age):
+        return {"ETag": etag}
+    return {}
+
+
+def validate_batch(
+    schema: type[BaseModel], items: list[dict[str, Any]]
+) -> tuple[dict[int, Any], list[BatchItemResultSchema]]:
+    """항목별 검증. (index별 검증 통과 항목, 실패 항목 결과) 반환"""
+
+    valid, errors = {}, []
+    for index, item in enumerate(items):
+        try:
+            valid[index] = schema.model_validate(item)
+        except ValidationError as e:
+            error = [{"loc": err["loc"], "msg": err["msg"]} for err in e.errors()]
+            errors.append(BatchItemResultSchema(index=index, status=422, error=error))
+    return valid, errors
+
+
+def batch_result(results: list[BatchItemResultSchema]) -> BatchResultSchema:
+    return BatchResultSchema(results=sorted(results, key=lambda r: r.index))
+
 
 @event_router.post("", status_code=201, response_model=ReadEventSchema)
 async def create_event(body: CreateEventSchema, user: CURR_USER, db: DB_SESSION):
@@ -15,22 +78,244 @@ async def create_event(body: CreateEventSchema, user: CURR_USER, db: DB_SESSION)
 
 @event_router.get("", status_code=200, response_model=list[ReadEventSchema])
 async def list_events(
-    user: CURR_USER, db: DB_SESSION, offset: int = 0, limit: int = Query(default=20)
+    request: Request,
+    user: CURR_USER,
+    db: READ_DB_SESSION,
+    redis: REDIS,
+    offset: int = 0,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    tag: list[str] | None = Query(default=None, max_length=10, description="tag 필터 (여러 개 가능)"),
+    tag_match: Literal["any", "all"] = Query(default="any", description="tag 중 하나/모두 일치"),
+):
+    """### cursor가 있으면 offset 무시 (keyset pagination), 다음 페이지가 있으면 X-Next-Cursor 헤더 반환
+
+    tag=a&tag=b: a 또는 b tag를 가진 event (tag_match=all이면 둘 다 가진 event)
+    If-None-Match가 현재 ETag와 같으면 304 (MySQL 조회 없음)
+    """
+
+    headers = await etag_headers(request, redis, db, user.id)
+    last_id = CursorHandler.decode(cursor, "id")["id"] if cursor else None
+    conditions = [Event.user_id == user.id]
+    if tag:
+        conditions.append(Event.tag_condition(user.id, tag, tag_match == "all"))
+    events = await Event.list(db, conditions, offset, limit, last_id)
+    if events and len(events) == limit:
+        headers["X-Next-Cursor"] = CursorHandler.encode(id=events[-1].id)
+    return EVENT_SERIALIZER.response(list(events), headers=headers)
+
+
+@event_router.post("/batch", status_code=200, response_model=BatchResultSchema)
+async def create_events_batch(body: BATCH_BODY, user: CURR_USER, db: DB_SESSION):
+    """### 검증 통과 항목을 하나의 트랜잭션으로 생성, 결과는 항목별 status(201/409/422)로 반환
+
+    DB에서 거절된 항목(중복 409, 길이 초과 등 422)만 실패로 보고 나머지는 생성
+    """
+
+    valid, results = validate_batch(CreateEventSchema, body)
+    rows = [{**item.model_dump(), "user_id": user.id} for item in valid.values()]
+    created = await Event.bulk_create(db, rows, [Event.user_id == user.id])
+    for index, event in zip(valid, created):
+        if isinstance(event, CustomException):
+            results.append(
+                BatchItemResultSchema(index=index, status=event.status_code, error=event.detail)
+            )
+            continue
+        data = ReadEventSchema.model_validate(event, from_attributes=True)
+        results.append(BatchItemResultSchema(index=index, status=201, data=data))
+    return batch_result(results)
+
+
+@event_router.put("/batch", status_code=200, response_model=BatchResultSchema)
+async def update_events_batch(body: BATCH_BODY, user: CURR_USER, db: DB_SESSION):
+    """### 검증 통과 항목을 UPDATE 1회로 수정, 결과는 항목별 status(200/404/409/422)로 반환
+
+    같은 id가 여러 번 오면 첫 번째 항목만 반영하고 나머지는 409
+    """
+
+    valid, results = validate_batch(BatchUpdateEventSchema, body)
+    index_by_id: dict[int, int] = {}
+    values_by_id: dict[int, dict[str, Any]] = {}
+    for index, item in valid.items():
+        if item.id in index_by_id:
+            results.append(
+                BatchItemResultSchema(index=index, status=409, error="Duplicated id in batch.")
+            )
+            continue
+        index_by_id[item.id] = index
+        values_by_id[item.id] = item.model_dump(exclude_unset=True, exclude={"id"})
+
+    events = await Event.bulk_update(db, [Event.user_id == user.id], values_by_id)
+    updated = {event.id: event for event in events}
+    for id, index in index_by_id.items():
+        if (event := updated.get(id)) is None:
+            results.append(BatchItemResultSchema(index=index, status=404, error="Not Found."))
+            continue
+        data = ReadEventSchema.model_validate(event, from_attributes=True)
+        results.append(BatchItemResultSchema(index=index, status=200, data=data))
+    return batch_result(results)
+
+
+@event_router.delete("/batch", status_code=200, response_model=BatchResultSchema)
+async def delete_events_batch(body: BatchDeleteEventSchema, user: CURR_USER, db: DB_SESSION):
+    """### DELETE 1회로 삭제, 결과는 항목별 status(204/404)로 반환"""
+
+    conditions = [Event.id.in_(body.ids), Event.user_id == user.id]
+    deleted = {event.id for event in await Event.bulk_delete(db, conditions)}
+    return batch_result(
+        [
+            BatchItemResultSchema(index=index, status=204)
+            if id in deleted
+            else BatchItemResultSchema(index=index, status=404, error="Not Found.")
+            for index, id in enumerate(body.ids)
+        ]
+    )
+
+
+async def export_ndjson(request: Request, user_id: str) -> AsyncGenerator[bytes, None]:
+    # * StreamingResponse는 의존성(DB_SESSION)이 정리된 뒤에 전송되므로 session을 직접 열어서 사용
+    columns = [getattr(Event, field) for field in ReadEventSchema.model_fields]
+    async with read_session(request) as db:
+        async for rows in Event.stream(
+            db, columns, [Event.user_id == user_id], settings.EXPORT_CHUNK_SIZE
+        ):
+            yield RowSerializer.dumps_lines(rows)
+
+
+@event_router.get(
+    "/export",
+    status_code=200,
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def export_events(request: Request, user: CURR_USER) -> StreamingResponse:
+    """### 유저의 전체 이벤트를 NDJSON(한 줄에 ReadEventSchema 하나)으로 스트리밍"""
+
+    return StreamingResponse(export_ndjson(request, user.id), media_type="application/x-ndjson")
+
+
+async def compute_event_stats(db: LazySession, redis: Redis, user_id: str) -> dict[str, int]:
+    """MySQL에서 통계를 계산해 redis hash를 채움
+
+    계산 전에 읽은 event version이 저장 시점에도 같을 때만 저장 (그 사이 쓰기가 있으면 다시 계산).
+    """
+
+    for _ in range(STATS_SNAPSHOT_ATTEMPTS):
+        try:
+            version = await ETagHandler.get_version(redis, user_id)
+        except RedisError:
+            version = None
+        fields = EventStats.fields((await Event.stats(db, [user_id]))[user_id])
+        # * 다음 계산은 새 트랜잭션(새 snapshot)에서
+        await db.release()
+        if version is None:
+            break
+        try:
+            if await EventStats.replace_if_version(
+                user_id, fields, ETagHandler.key(user_id), version
+            ):
+                break
+        except RedisError:
+            break
+    return fields
+
+
+@event_router.get("/stats", status_code=200, response_model=EventStatsSchema)
+async def event_stats(user: CURR_USER, db: DB_SESSION, redis: REDIS) -> EventStatsSchema:
+    """### 전체/체크/미체크/tag별 event 수
+
+    redis에 집계된 값을 바로 반환. 집계된 적 없으면(첫 조회 등) MySQL에서 계산해 채운 뒤 반환
+    (이후 증감분을 더해 가므로 복제 지연이 없는 primary에서 계산)
+    """
+
+    if (fields := await EventStats.get(user.id)) is None:
+        fields = await compute_event_stats(db, redis, user.id)
+    prefix = EventStats.TAG_PREFIX
+    tags = {k[len(prefix) :]: n for k, n in fields.items() if k.startswith(prefix) and n > 0}
+    return EventStatsSchema(
+        total=fields["total"],
+        checked=fields["checked"],
+        unchecked=fields["total"] - fields["checked"],
+        tags=dict(sorted(tags.items(), key=lambda item: (-item[1], item[0]))),
+    )
+
+
+@event_router.get("/search", status_code=200, response_model=list[ReadEventSchema])
+async def search_events(
+    request: Request,
+    user: CURR_USER,
+    db: READ_DB_SESSION,
+    redis: REDIS,
+    q: str = Query(..., min_length=2, max_length=100, description="검색어"),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="이전 응답의 X-Next-Cursor 헤더 값"),
 ):
-    return await Event.list(db, [Event.user_id == user.id], offset, limit)
+    """### title, description, location 전문 검색 (관련도 순), 다음 페이지가 있으면 X-Next-Cursor 헤더 반환
+
+    관련도는 전체 문서 통계로 계산되므로 페이지를 넘기는 사이 이벤트가 바뀌면 순서가 달라질 수 있음
+    """
+
+    headers = await etag_headers(request, redis, db, user.id)
+    after = None
+    if cursor:
+        values = CursorHandler.decode(cursor, "score", "id")
+        after = (values["score"], values["id"])
+    found = await Event.search(db, [Event.user_id == user.id], q, limit, after)
+    if len(found) == limit:
+        last, score = found[-1]
+        headers["X-Next-Cursor"] = CursorHandler.encode(score=score, id=last.id)
+    return EVENT_SERIALIZER.response([event for event, _ in found], headers=headers)
 
 
 @event_router.get("/{id}", status_code=200, response_model=ReadEventSchema)
-async def detail_event(user: CURR_USER, db: DB_SESSION, id: int = Path(..., ge=1)):
-    return await Event.get(db, [Event.id == id, Event.user_id == user.id])
+async def detail_event(
+    request: Request,
+    user: CURR_USER,
+    db: READ_DB_SESSION,
+    redis: REDIS,
+    id: int = Path(..., ge=1),
+):
+    """### If-None-Match가 현재 ETag와 같으면 304 (MySQL 조회 없음)"""
+
+    headers = await etag_headers(request, redis, db, user.id)
+    event = await Event.get(db, [Event.id == id, Event.user_id == user.id])
+    return EVENT_SERIALIZER.response(event, headers=headers)
 
 
-@event_router.put("/{id}", status_code=200, response_model=ReadEventSchema)
+def prefers_minimal(prefer: str | None) -> bool:
+    """Prefer 헤더(RFC 7240)에 return=minimal이 있는지"""
+
+    if not prefer:
+        return False
+    return any(token.strip() == "return=minimal" for token in prefer.split(","))
+
+
+@event_router.put(
+    "/{id}",
+    status_code=200,
+    response_model=ReadEventSchema,
+    responses={204: {"description": "`Prefer: return=minimal` 요청 시 (본문 없음)"}},
+)
 async def update_event(
-    body: UpdateEventSchema, user: CURR_USER, db: DB_SESSION, id: int = Path(..., ge=1)
+    body: UpdateEventSchema,
+    user: CURR_USER,
+    db: DB_SESSION,
+    id: int = Path(..., ge=1),
+    prefer: str | None = Header(None),
 ):
+    """### `Prefer: return=minimal`이면 조회 없이 조건부 UPDATE 1회 후 204
+
+    - is_checked, tags 수정은 통계/tag index에 바뀌기 전 값이 필요해 조회 후 수정 (SELECT + UPDATE)
+    - 그 외 기본 응답도 조회 후 수정 (refresh 없음)
+    """
+
+    values = body.model_dump(exclude_unset=True)
+    if values and prefers_minimal(prefer) and not STATS_COLUMNS & values.keys():
+        await Event.update_owned(db, id, user.id, **values)
+        return Response(status_code=204, headers={"Preference-Applied": "return=minimal"})
+
     event = await Event.get(db, [Event.id == id, Event.user_id == user.id])
-    return await Event.update(db, event, **body.model_dump(exclude_unset=True))
+    return await Event.update(db, event, **values)
 
 
 @event_router.delete("/{id}", status_code=204)
@@ -0,0 +1,74 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.handlers.auth import PasswordHandler
+from app.handlers.cache import UserCache
+from app.handlers.chat import CHAT_HUB
+from app.handlers.metrics import METRICS, CollectedCounter, Gauge
+from app.handlers.redis import REDIS_BREAKER
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+# * 다른 handler가 이미 모으고 있는 통계를 조회 시점에 읽어서 노출
+METRICS.register(
+    Gauge(
+        "password_hash_executor_tasks",
+        "bcrypt tasks waiting or running in the executor",
+        ("state",),
+        lambda: [
+            (("queued",), PasswordHandler.EXECUTOR.stats.queued),
+            (("running",), PasswordHandler.EXECUTOR.stats.running),
+        ],
+    )
+)
+METRICS.register(
+    CollectedCounter(
+        "password_hash_executor_rejected_total",
+        "bcrypt tasks rejected because the executor queue was full",
+        (),
+        lambda: [((), PasswordHandler.EXECUTOR.stats.rejected)],
+    )
+)
+METRICS.register(
+    CollectedCounter(
+        "user_cache_lookups_total",
+        "Authenticated user cache lookups by result",
+        ("result",),
+        lambda: [
+            (("local_hit",), UserCache.stats.local_hits),
+            (("redis_hit",), UserCache.stats.redis_hits),
+            (("miss",), UserCache.stats.misses),
+        ],
+    )
+)
+METRICS.register(
+    Gauge(
+        "redis_circuit_breaker_open",
+        "1 if the Redis circuit breaker is not closed",
+        ("state",),
+        lambda: [((REDIS_BREAKER.state,), int(REDIS_BREAKER.state != REDIS_BREAKER.CLOSED))],
+    )
+)
+METRICS.register(
+    CollectedCounter(
+        "redis_circuit_breaker_transitions_total",
+        "Redis circuit breaker state transitions",
+        ("transition",),
+        lambda: [((transition,), n) for transition, n in REDIS_BREAKER.transitions.items()],
+    )
+)
+METRICS.register(
+    Gauge(
+        "chat_connections",
+        "WebSocket chat connections on this worker",
+        (),
+        lambda: [((), CHAT_HUB.connections)],
+    )
+)
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """worker별 metric (Prometheus text exposition format)"""
+
+    return PlainTextResponse(METRICS.render(), media_type=METRICS.CONTENT_TYPE)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Request, Response
 from pydantic_core import ValidationError
 
-from app.deps import CURR_USER, DB_SESSION, REDIS
+from app.deps import CURR_USER, DB_SESSION, REDIS, SIGN_IN_RATE_LIMIT, SIGN_UP_RATE_LIMIT
 from app.exceptions import NotFoundException, SignInException
 from app.handlers.auth import PasswordHandler
 from app.handlers.jwt import TokenIssuer
@@ -11,14 +11,22 @@ from app.schemas.users import JWTSchema, ReadUserSchema, SignInData, SignInSchem
 users_router = APIRouter(prefix="/users", tags=["users"])
 
 
-@users_router.post("/signup", summary="회원 가입", status_code=201, response_model=ReadUserSchema)
+@users_router.post(
+    "/signup",
+    summary="회원 가입",
+    status_code=201,
+    response_model=ReadUserSchema,
+    dependencies=[SIGN_UP_RATE_LIMIT],
+)
 async def sign_up(body: SignUpSchema, db: DB_SESSION) -> User:
     user = User(**body.model_dump())
-    user.password = PasswordHandler.hash_password(user.password)
+    user.password = await PasswordHandler.hash_password_async(user.password)
     return await User.create(db, user)
 
 
-@users_router.post("/signin", summary="로그인", status_code=200)
+@users_router.post(
+    "/signin", summary="로그인", status_code=200, dependencies=[SIGN_IN_RATE_LIMIT]
+)
 async def sign_in(
     request: Request,
     response: Response,
@@ -29,7 +37,9 @@ async def sign_in(
     try:
         user_body = SignInSchema(email=body.email, password=body.password)
         user = await User.get(db, [User.email == user_body.email])
-        if not PasswordHandler.verify_password(body.password, user.password):
+        # * bcrypt 검증 동안 connection을 쥐고 있지 않도록 반납
+        await db.release()
+        if not await PasswordHandler.verify_password_async(body.password, user.password):
             raise SignInException
 
         issuer = TokenIssuer(request, response, redis)
@@ -16,22 +16,92 @@ def get_settings(env_file: str = ".env"):
         MYSQL_DATABASE: str
         MYSQL_USER: str
         MYSQL_PASSWORD: str
+        MYSQL_REPLICA_URLS: list[str] = []  # 읽기 전용 replica (비어 있으면 primary만 사용)
+        REPLICA_STICKY_SECONDS: int = 5  # 쓰기 요청 후 읽기를 primary로 보내는 시간
+        REPLICA_RETRY_SECONDS: int = 30  # 연결 실패한 replica를 제외하는 시간
+        DB_POOL_WARM_SIZE: int = 5  # 부팅 시 미리 열어 둘 연결 수 (engine별, 최대 pool_size)
+        SCHEMA_AUTO_MIGRATE: bool = True  # False면 schema가 뒤처졌을 때 부팅 실패
 
         # Redis
         REDIS_SCHEME: str
         REDIS_HOST: str
         REDIS_PORT: int
         REDIS_DATABASE: str
+        REDIS_MAX_CONNECTIONS: int = 20
+        REDIS_POOL_TIMEOUT: int = 5  # pool 연결 대기 (retry_on_redis_error 안에서는 deadline까지 남은 시간 이하)
+        REDIS_SOCKET_TIMEOUT: float = 0.5  # 명령 1회 응답 대기. 넘으면 연결을 끊고 TimeoutError
+        REDIS_POOL_WARM_SIZE: int = 5  # 부팅 시 미리 열어 둘 연결 수
+        REDIS_RETRY_MAX_ATTEMPTS: int = 3
+        REDIS_RETRY_BASE_DELAY: float = 0.05
+        REDIS_RETRY_MAX_DELAY: float = 0.5
+        REDIS_RETRY_DEADLINE_SECONDS: float = 1.0  # 이 시간이 지나면 더 재시도하지 않음
+        REDIS_BREAKER_FAILURE_THRESHOLD: int = 5  # 연속 실패 횟수
+        REDIS_BREAKER_RECOVERY_SECONDS: float = 10.0  # open 후 시험 요청까지 대기
 
         # Auth
         JWT_SECRET_KEY: str
         JWT_ALGORITHM: str
+        JWT_BACKEND: str = "jose"  # jose | hmac (HS* 전용, 표준 라이브러리)
+        TOKEN_CACHE_MAX_SIZE: int = 10_000
+        TOKEN_CACHE_TTL_SECONDS: int = 60
         TOKEN_TYPE: str = "Bearer"
         ACCESS_TOKEN_EXPIRES_SECONDS: int = 15 * 60  # 15분
         REFRESH_TOKEN_EXPIRES_SECONDS: int = 7 * 24 * 60 * 60  # 7일
         REFRESH_TOKEN_COOKIE_KEY: str = "refresh_token"
         REDIS_BLACKLIST_KEY: str = "blacklist"
         REDIS_TOKEN_KEY: str = "token"
+        REDIS_REVOCATION_CHANNEL: str = "revocations"
+        REVOCATION_BLOOM_CAPACITY: int = 1_000_000
+        REVOCATION_BLOOM_ERROR_RATE: float = 0.01
+        REVOCATION_BLOOM_REBUILD_SECONDS: int = 60 * 60
+
+        # Rate limit (sign in, sign up)
+        REDIS_RATE_LIMIT_KEY: str = "ratelimit"
+        AUTH_RATE_LIMIT_IP_CAPACITY: int = 20  # 최대 연속 요청 수
+        AUTH_RATE_LIMIT_IP_PER_SECOND: float = 0.5  # 초당 충전량 (분당 30회)
+        AUTH_RATE_LIMIT_EMAIL_CAPACITY: int = 5
+        AUTH_RATE_LIMIT_EMAIL_PER_SECOND: float = 0.1  # 분당 6회
+
+        # Password hashing
+        PASSWORD_HASH_EXECUTOR: str = "thread"  # thread | process
+        PASSWORD_HASH_MAX_WORKERS: int = 4
+        PASSWORD_HASH_MAX_QUEUE_SIZE: int = 64
+
+        # User cache
+        REDIS_USER_CACHE_KEY: str = "user"
+        USER_CACHE_MAX_SIZE: int = 10_000
+        USER_CACHE_LOCAL_TTL_SECONDS: int = 5  # 다른 worker에서 변경된 유저 정보가 반영되기까지 최대 지연
+        USER_CACHE_REDIS_TTL_SECONDS: int = 60
+
+        # Events
+        BATCH_MAX_SIZE: int = 500
+        EXPORT_CHUNK_SIZE: int = 1000
+        REDIS_EVENT_VERSION_KEY: str = "event_version"
+        EVENT_VERSION_TTL_SECONDS: int = 7 * 24 * 60 * 60  # 7일
+        REDIS_EVENT_STATS_KEY: str = "event_stats"
+
+        # Chat
+        REDIS_CHAT_KEY: str = "chat"
+        CHAT_SEND_QUEUE_SIZE: int = 100  # 연결별 송신 대기열 크기
+        CHAT_SLOW_CONSUMER_POLICY: str = "drop"  # drop | disconnect
+        REDIS_CHAT_HISTORY_KEY: str = "chat_history"
+        CHAT_HISTORY_MAX_LEN: int = 1000  # room별 보관 메시지 수 (근사값, XADD MAXLEN ~)
+        CHAT_REPLAY_MAX_MESSAGES: int = 200  # 재접속 시 한 번에 다시 보내는 최대 메시지 수
+        CHAT_ROOMS: list[str] = ["lobby"]  # 접속 가능한 room (room마다 redis stream key가 생김)
+        CHAT_HISTORY_TTL_SECONDS: int = 7 * 24 * 60 * 60  # 마지막 메시지 후 history 보관 (7일)
+
+        # Metrics
+        METRICS_ENABLED: bool = True  # /metrics endpoint, route별 latency 기록
+
+        # SQL profiling
+        DEBUG: bool = False  # 응답 헤더에 요청별 쿼리 수/시간 추가
+        SLOW_QUERY_SECONDS: float = 0.2  # 이 시간 이상 걸린 쿼리는 app.slow_query 로그
+        N_PLUS_ONE_THRESHOLD: int = 10  # 한 요청에서 같은 쿼리가 이 횟수 이상이면 경고
+
+        # Diagnostics
+        LOOP_LAG_INTERVAL_SECONDS: float = 0.05  # event loop 지연 측정 간격
+        LOOP_LAG_WARN_SECONDS: float = 0.1  # 이 시간 이상 막히면 경고 로그
+        PROFILER_MAX_SECONDS: int = 60
 
         @property
         def MYSQL_URL(self) -> str:
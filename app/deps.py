@@ -2,15 +2,23 @@ from typing import Annotated
 
 from aioredis import Redis
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from .handlers.auth import AuthHandler
-from .handlers.db import get_db_session
+from .handlers.db import LazySession, ReadSession, get_db_session, get_read_db_session
+from .handlers.ratelimit import RateLimiter
 from .handlers.redis import get_redis
 from .models.users import User
 
-DB_SESSION = Annotated[AsyncSession, Depends(get_db_session)]
+DB_SESSION = Annotated[LazySession, Depends(get_db_session)]
+
+READ_DB_SESSION = Annotated[ReadSession, Depends(get_read_db_session)]
 
 REDIS = Annotated[Redis, Depends(get_redis)]
 
 CURR_USER = Annotated[User, Depends(AuthHandler.get_curr_user)]
+
+ADMIN_USER = Annotated[User, Depends(AuthHandler.get_admin_user)]
+
+SIGN_IN_RATE_LIMIT = Depends(RateLimiter("signin"))
+
+SIGN_UP_RATE_LIMIT = Depends(RateLimiter("signup"))
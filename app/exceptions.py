@@ -14,6 +14,11 @@ class CustomException(HTTPException):
         super().__init__(self.status_code, detail or self.detail, headers or self.headers)
 
 
+class NotModifiedException(CustomException):
+    detail = "Not Modified."
+    status_code = 304
+
+
 class SignInException(CustomException):
     detail = "Email not existed or password not matched."
     status_code = 401
@@ -50,6 +55,11 @@ class UnProcessableException(CustomException):
     status_code = 422
 
 
+class TooManyRequestsException(CustomException):
+    detail = "Too Many Requests."
+    status_code = 429
+
+
 class ServiceUnavailableException(CustomException):
     detail = "There was a problem processing your request, please try again later."
     status_code = 503
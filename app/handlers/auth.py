@@ -15,8 +15,11 @@ from app.exceptions import (
 )
 from app.models.users import User
 
-from .db import get_db_session
+from .cache import UserCache
+from .db import LazySession, get_db_session
+from .executor import BoundedExecutor
 from .jwt import TokenHandler
+from .revocation import RevocationRegistry
 
 
 class CustomHTTPAuth(HTTPBearer):
@@ -46,17 +49,47 @@ class AuthHandler:
     async def get_curr_user(
         cls,
         token: HTTPAuthorizationCredentials = Depends(CustomHTTPAuth()),
-        db: AsyncSession = Depends(get_db_session),
+        db: LazySession = Depends(get_db_session),
     ) -> User:
         payload = TokenHandler.decode_token(token.credentials)
-        user = await cls.get_user([User.id == payload.sub], db)
+        if await RevocationRegistry.is_revoked(
+            TokenHandler.revocation_id(token.credentials, payload)
+        ):
+            raise InvalidTokenException
+        if (cached := await UserCache.get(payload.sub)) is not None:
+            user = User(**cached)
+        else:
+            # * is_disabled 변경이 바로 반영되도록 primary에서 조회. route 실행 전이므로 바로 connection 반납
+            user = await cls.get_user([User.id == payload.sub], db)
+            await db.release()
+            await UserCache.set(user)
         if user.is_disabled:
             raise ForbiddenException
         return user
 
+    @classmethod
+    async def get_admin_user(
+        cls,
+        token: HTTPAuthorizationCredentials = Depends(CustomHTTPAuth()),
+        db: LazySession = Depends(get_db_session),
+    ) -> User:
+        """JWT의 is_admin claim과 현재 유저 정보 모두 관리자여야 통과 (권한 회수 즉시 반영)"""
+
+        user = await cls.get_curr_user(token, db)
+        if not (TokenHandler.decode_token(token.credentials).is_admin and user.is_admin):
+            raise ForbiddenException
+        return user
+
 
 class PasswordHandler:
     PW_CONTEXT = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    # * bcrypt는 요청당 수십 ms CPU를 쓰므로 event loop 밖에서 실행 (pyca bcrypt는 GIL 해제)
+    EXECUTOR = BoundedExecutor(
+        "password_hash",
+        settings.PASSWORD_HASH_EXECUTOR,
+        settings.PASSWORD_HASH_MAX_WORKERS,
+        settings.PASSWORD_HASH_MAX_QUEUE_SIZE,
+    )
 
     @classmethod
     def hash_password(cls, password: str) -> str:
@@ -85,6 +118,18 @@ class PasswordHandler:
 
         return cls.PW_CONTEXT.verify(plain_password, hashed_password)
 
+    @classmethod
+    async def hash_password_async(cls, password: str) -> str:
+        """hash_password를 worker pool에서 실행 (대기열이 가득 차면 ServiceUnavailableException)"""
+
+        return await cls.EXECUTOR.run(cls.hash_password, password)
+
+    @classmethod
+    async def verify_password_async(cls, plain_password: str, hashed_password: str) -> bool:
+        """verify_password를 worker pool에서 실행 (대기열이 가득 차면 ServiceUnavailableException)"""
+
+        return await cls.EXECUTOR.run(cls.verify_password, plain_password, hashed_password)
+
     @staticmethod
     def validate_password(password: str) -> bool:
         """비밀번호 정규식 검사 (pydantic Field에선 전방 탐색과 후방 탐색 동시에 지원 하지 않음.)
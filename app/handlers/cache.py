@@ -0,0 +1,137 @@
+import json
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from time import monotonic
+from typing import Any, Generic, Hashable, TypeVar
+
+from aioredis import Redis, RedisError
+
+from app.config import settings
+
+from .redis import RedisUnavailableError, get_redis_pool, retry_on_redis_error
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """process 내 LRU + TTL cache (asyncio 단일 스레드 전용, lock 없음)"""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: Hashable) -> V | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._data[key] = (monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+@dataclass
+class CacheStats:
+    local_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    def snapshot(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class UserCache:
+    """인증된 유저 정보 2단 cache (process LRU/TTL -> redis)
+
+    - 같은 worker의 cache는 User.update/User.delete 시 즉시 무효화
+    - 다른 worker의 process cache는 최대 USER_CACHE_LOCAL_TTL_SECONDS 만큼 오래된 값을 볼 수 있음
+    - redis 장애 시 cache miss로 취급하고 DB 조회 (breaker가 open이면 redis 호출 없이)
+    """
+
+    FIELDS = ("id", "email", "is_disabled", "is_admin")
+    LOCAL: TTLCache[dict[str, Any]] = TTLCache(
+        settings.USER_CACHE_MAX_SIZE, settings.USER_CACHE_LOCAL_TTL_SECONDS
+    )
+    stats = CacheStats()
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"{settings.REDIS_USER_CACHE_KEY}:{user_id}"
+
+    @staticmethod
+    @retry_on_redis_error(error=RedisUnavailableError)
+    async def _redis_get(key: str) -> bytes | None:
+        return await Redis(connection_pool=get_redis_pool()).get(key)
+
+    @staticmethod
+    @retry_on_redis_error(error=RedisUnavailableError)
+    async def _redis_set(key: str, value: str) -> None:
+        await Redis(connection_pool=get_redis_pool()).set(
+            key, value, ex=settings.USER_CACHE_REDIS_TTL_SECONDS
+        )
+
+    @staticmethod
+    @retry_on_redis_error(error=RedisUnavailableError)
+    async def _redis_delete(*keys: str) -> None:
+        await Redis(connection_pool=get_redis_pool()).delete(*keys)
+
+    @classmethod
+    async def get(cls, user_id: str) -> dict[str, Any] | None:
+        if (data := cls.LOCAL.get(user_id)) is not None:
+            cls.stats.local_hits += 1
+            return data
+
+        try:
+            raw = await cls._redis_get(cls._key(user_id))
+        except RedisError:
+            raw = None
+        if raw is None:
+            cls.stats.misses += 1
+            return None
+
+        cls.stats.redis_hits += 1
+        data = json.loads(raw)
+        cls.LOCAL.set(user_id, data)
+        return data
+
+    @classmethod
+    async def set(cls, user: Any) -> None:
+        data = {field: getattr(user, field) for field in cls.FIELDS}
+        cls.LOCAL.set(data["id"], data)
+        try:
+            await cls._redis_set(cls._key(data["id"]), json.dumps(data))
+        except RedisError:
+            pass
+
+    @classmethod
+    async def invalidate(cls, *user_ids: str) -> None:
+        if not user_ids:
+            return
+        for user_id in user_ids:
+            cls.LOCAL.delete(user_id)
+        cls.stats.invalidations += len(user_ids)
+        try:
+            await cls._redis_delete(*map(cls._key, user_ids))
+        except RedisError:
+            # * 삭제 실패 시에도 redis 값은 USER_CACHE_REDIS_TTL_SECONDS 후 만료됨
+            pass
@@ -0,0 +1,272 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from time import time
+from typing import Any
+
+from aioredis import Redis, RedisError
+from fastapi import WebSocket, status
+
+from app.config import settings
+
+from .redis import get_redis_pool, retry_on_redis_error
+
+logger = logging.getLogger(__name__)
+
+StreamId = tuple[int, int]
+
+
+def parse_stream_id(stream_id: str) -> StreamId:
+    ms, _, seq = stream_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+class ChatConnection:
+    """WebSocket 연결 1개와 전용 송신 대기열 (크기 제한)
+
+    대기열이 가득 차면(느린 클라이언트) CHAT_SLOW_CONSUMER_POLICY에 따라
+    drop: 가장 오래된 메시지를 버림 / disconnect: 연결 종료
+    """
+
+    def __init__(self, websocket: WebSocket, room: str) -> None:
+        self.websocket = websocket
+        self.room = room
+        self.queue: asyncio.Queue[tuple[StreamId | None, str]] = asyncio.Queue(
+            settings.CHAT_SEND_QUEUE_SIZE
+        )
+        self.dropped = 0
+        # * 재접속 시 history로 이미 보낸 마지막 메시지 id (이하의 실시간 메시지는 건너뜀)
+        self.replayed_until: StreamId | None = None
+        self._sender: asyncio.Task | None = None
+
+    def offer(self, message_id: StreamId | None, message: str) -> bool:
+        """대기열에 추가. 연결을 끊어야 하면 False"""
+
+        try:
+            self.queue.put_nowait((message_id, message))
+            return True
+        except asyncio.QueueFull:
+            if settings.CHAT_SLOW_CONSUMER_POLICY == "disconnect":
+                return False
+            self.queue.get_nowait()
+            self.queue.put_nowait((message_id, message))
+            self.dropped += 1
+            return True
+
+    async def _send_loop(self) -> None:
+        """송신 실패 시 로그를 남기고 연결을 닫음 (수신 쪽이 끊김을 감지해서 unregister)"""
+
+        while True:
+            message_id, message = await self.queue.get()
+            if self.replayed_until is not None and message_id is not None:
+                if message_id <= self.replayed_until:
+                    continue
+                self.replayed_until = None
+            try:
+                await self.websocket.send_text(message)
+            except Exception:
+                logger.warning(
+                    "chat send failed, dropping connection: room=%s", self.room, exc_info=True
+                )
+                break
+        try:
+            await self.websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+        except RuntimeError:
+            # * 이미 닫힌 연결
+            pass
+
+    def start(self) -> None:
+        self._sender = asyncio.create_task(self._send_loop())
+
+    def stop(self) -> None:
+        if self._sender is not None:
+            self._sender.cancel()
+
+    async def close(self, code: int, reason: str | None = None) -> None:
+        self.stop()
+        try:
+            await self.websocket.close(code=code, reason=reason)
+        except RuntimeError:
+            # * 이미 닫힌 연결
+            pass
+
+
+class ChatHub:
+    """room 단위 WebSocket broadcast
+
+    - 이 worker에 연결된 클라이언트는 rooms(room -> 연결 목록)에 등록
+    - room은 CHAT_ROOMS에 있는 것만 허용 (is_allowed)
+    - 메시지는 room별 redis stream(chat_history:<room>, 최대 CHAT_HISTORY_MAX_LEN개,
+      마지막 메시지 후 CHAT_HISTORY_TTL_SECONDS 동안 보관)에 저장한 뒤
+      redis pub/sub(chat:<room>)으로 발행하고, 모든 worker가 구독해서 자기 연결에 전달
+    - 구독 task가 떠 있지 않으면(redis 장애 등) 이 worker의 연결에만 직접 전달
+    """
+
+    def __init__(self) -> None:
+        self.rooms: dict[str, set[ChatConnection]] = defaultdict(set)
+        self.kicked = 0
+        self._task: asyncio.Task | None = None
+        self._subscribed = asyncio.Event()
+        # * 느린 연결 종료 task (참조를 유지하지 않으면 실행 중에 GC될 수 있음)
+        self._closing: set[asyncio.Task] = set()
+
+    @staticmethod
+    def channel(room: str) -> str:
+        return f"{settings.REDIS_CHAT_KEY}:{room}"
+
+    @staticmethod
+    def history_key(room: str) -> str:
+        return f"{settings.REDIS_CHAT_HISTORY_KEY}:{room}"
+
+    @staticmethod
+    def is_allowed(room: str) -> bool:
+        return room in settings.CHAT_ROOMS
+
+    @property
+    def connections(self) -> int:
+        return sum(map(len, self.rooms.values()))
+
+    async def join(self, conn: ChatConnection, last_id: str | None = None) -> None:
+        """연결 등록. last_id가 있으면 그 이후 메시지를 한 번에 보낸 뒤 실시간 전달 시작
+
+        등록을 먼저 해서 history 조회 중에 들어온 실시간 메시지도 대기열에 쌓이게 하고,
+        송신 task에서 history로 보낸 id 이하는 건너뜀.
+        """
+
+        self.rooms[conn.room].add(conn)
+        if last_id is not None:
+            messages, complete = await self.replay(conn.room, last_id)
+            frame = {"type": "history", "room": conn.room, "messages": messages}
+            await conn.websocket.send_text(json.dumps({**frame, "complete": complete}))
+            conn.replayed_until = parse_stream_id(messages[-1]["id"] if messages else last_id)
+        conn.start()
+
+    def unregister(self, conn: ChatConnection) -> None:
+        conn.stop()
+        if (conns := self.rooms.get(conn.room)) is not None:
+            conns.discard(conn)
+            if not conns:
+                del self.rooms[conn.room]
+
+    @staticmethod
+    def _entry_to_message(entry_id: bytes, fields: dict[bytes, bytes]) -> dict[str, Any]:
+        return {**json.loads(fields[b"message"]), "id": entry_id.decode()}
+
+    @retry_on_redis_error()
+    async def history(
+        self, room: str, before: str | None = None, limit: int = 50
+    ) -> list[dict[str, Any]]:
+        """최신순으로 limit개 (before가 있으면 그 id보다 이전 메시지)
+
+        읽기라 재시도해도 안전. 재시도 후에도 redis 오류면 ServiceUnavailableException(503)
+        """
+
+        redis = Redis(connection_pool=get_redis_pool())
+        entries = await redis.xrevrange(
+            self.history_key(room), max=f"({before}" if before else "+", min="-", count=limit
+        )
+        return [self._entry_to_message(*entry) for entry in entries]
+
+    async def replay(self, room: str, last_id: str) -> tuple[list[dict[str, Any]], bool]:
+        """last_id 이후 메시지를 오래된 순으로 최대 CHAT_REPLAY_MAX_MESSAGES개
+
+        Returns:
+            tuple[list[dict[str, Any]], bool]: (메시지 목록, 놓친 메시지를 모두 포함했는지)
+        """
+
+        try:
+            redis = Redis(connection_pool=get_redis_pool())
+            limit = settings.CHAT_REPLAY_MAX_MESSAGES
+            entries = await redis.xrange(
+                self.history_key(room), min=f"({last_id}", max="+", count=limit + 1
+            )
+        except RedisError:
+            logger.warning("chat replay failed: room=%s", room)
+            return [], False
+        messages = [self._entry_to_message(*entry) for entry in entries[:limit]]
+        return messages, len(entries) <= limit
+
+    def deliver(self, room: str, message: str) -> None:
+        if not (conns := self.rooms.get(room)):
+            return
+        message_id = json.loads(message).get("id")
+        stream_id = parse_stream_id(message_id) if message_id else None
+        for conn in list(conns):
+            if not conn.offer(stream_id, message):
+                self.kicked += 1
+                self.unregister(conn)
+                task = asyncio.create_task(
+                    conn.close(status.WS_1008_POLICY_VIOLATION, "slow consumer")
+                )
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+
+    async def send(self, room: str, text: str) -> None:
+        """history stream에 저장(id 발급) 후 모든 worker에 발행"""
+
+        message: dict[str, Any] = {"type": "message", "room": room, "text": text, "ts": time()}
+        redis = Redis(connection_pool=get_redis_pool())
+        key = self.history_key(room)
+        try:
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.xadd(
+                    key,
+                    {"message": json.dumps(message, ensure_ascii=False)},
+                    maxlen=settings.CHAT_HISTORY_MAX_LEN,
+                    approximate=True,
+                )
+                pipe.expire(key, settings.CHAT_HISTORY_TTL_SECONDS)
+                message_id, _ = await pipe.execute()
+            message["id"] = message_id.decode()
+        except RedisError:
+            logger.warning("chat history append failed: room=%s", room)
+
+        raw = json.dumps(message, ensure_ascii=False)
+        if self._subscribed.is_set():
+            try:
+                await redis.publish(self.channel(room), raw)
+                return
+            except RedisError:
+                logger.warning("chat publish failed, delivering locally: room=%s", room)
+        self.deliver(room, raw)
+
+    async def _listen(self) -> None:
+        prefix = f"{settings.REDIS_CHAT_KEY}:"
+        while True:
+            pubsub = Redis(connection_pool=get_redis_pool()).pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(f"{prefix}*")
+                self._subscribed.set()
+                while True:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        room = message["channel"].decode()[len(prefix) :]
+                        self.deliver(room, message["data"].decode())
+            except RedisError:
+                logger.warning("chat subscription disconnected, retrying")
+                self._subscribed.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.close()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._subscribed.clear()
+        for conns in list(self.rooms.values()):
+            for conn in list(conns):
+                self.unregister(conn)
+                await conn.close(status.WS_1001_GOING_AWAY)
+
+
+CHAT_HUB = ChatHub()
@@ -0,0 +1,47 @@
+import json
+import math
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Any, Callable
+
+from app.exceptions import UnProcessableException
+
+
+def _positive_int(value: Any) -> int:
+    if type(value) is not int or value < 1:
+        raise ValueError
+    return value
+
+
+def _finite_float(value: Any) -> float:
+    if type(value) not in (int, float) or not math.isfinite(value):
+        raise ValueError
+    return float(value)
+
+
+class CursorHandler:
+    """keyset pagination 용 opaque cursor (base64url(json)) 인코딩/디코딩"""
+
+    # * cursor 값은 SQL 조건에 그대로 bind 되므로 key별로 타입/범위 검증 (bool은 int로 취급하지 않음)
+    FIELDS: dict[str, Callable[[Any], Any]] = {"id": _positive_int, "score": _finite_float}
+
+    @staticmethod
+    def encode(**values: Any) -> str:
+        raw = json.dumps(values, separators=(",", ":")).encode()
+        return urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    @classmethod
+    def decode(cls, cursor: str, *keys: str) -> dict[str, Any]:
+        """디코딩 실패, keys 누락, 값 검증(FIELDS) 실패 시 UnProcessableException
+
+        Returns:
+            dict[str, Any]: keys의 검증된 값
+        """
+
+        try:
+            raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, dict):
+                raise ValueError
+            return {key: cls.FIELDS[key](values[key]) for key in keys}
+        except (ValueError, TypeError, KeyError):
+            raise UnProcessableException("Invalid cursor.")
@@ -1,24 +1,249 @@
-from typing import AsyncGenerator
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from itertools import count
+from time import monotonic, perf_counter, time
+from typing import Any, AsyncGenerator, AsyncIterator, Iterable
 
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
 from app.config import settings
-from app.models.base import ModelBase
-
-ENGINE = create_async_engine(
-    settings.MYSQL_URL,
-    future=True,
-    echo=False,
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=1800,
+
+from .metrics import DB_CONNECTION_HOLD_SECONDS, DB_POOL_WAIT_SECONDS, METRICS, Gauge
+from .profiling import QUERY_STATS, QueryProfiler
+
+logger = logging.getLogger(__name__)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """connection checkout에 걸린 시간(반환 대기 + 새 연결 생성), checkout ~ 반납까지 점유 시간 기록
+
+    - pool 이름은 logging_name (dispose 후 pool이 다시 만들어져도 유지됨)
+    - 점유 시간은 요청별 QueryStats에도 누적 (반납은 요청 task의 context에서 일어남)
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = perf_counter()
+        try:
+            record = super()._do_get()
+        finally:
+            DB_POOL_WAIT_SECONDS.observe(perf_counter() - start, self.logging_name or "")
+        record.info["checked_out_at"] = perf_counter()
+        return record
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        checked_out_at = record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            held = perf_counter() - checked_out_at
+            DB_CONNECTION_HOLD_SECONDS.observe(held, self.logging_name or "")
+            if (stats := QUERY_STATS.get()) is not None:
+                stats.hold_seconds += held
+        super()._do_return_conn(record)
+
+
+class LazySession(AsyncSession):
+    """connection은 첫 statement에서 checkout하고 트랜잭션이 끝나면(commit, rollback) 바로 반납
+
+    읽기만 한 트랜잭션은 끝내지 않으면 session이 닫힐 때(요청 끝)까지 connection을 쥐고 있으므로
+    조회 뒤 느린 작업(bcrypt, 외부 호출 등)이 이어지면 release()로 먼저 반납.
+    """
+
+    async def release(self) -> None:
+        """진행 중인 트랜잭션을 끝내 connection 반납 (ORM 객체는 expire_on_commit=False라 유지)
+
+        다음 statement는 새 connection, 새 트랜잭션에서 실행됨.
+        SELECT ... FOR UPDATE 등 트랜잭션을 이어가야 하는 흐름 중간에는 호출하지 않음.
+        """
+
+        if self.in_transaction():
+            await self.commit()
+
+
+class ReadSession(LazySession):
+    """읽기 전용 session (replica 또는 primary)
+
+    읽기 트랜잭션은 session이 닫힐 때(route 반환 직후, 응답 전송 전) 끝나고 connection도 그때 반납.
+    한 요청의 여러 조회는 같은 snapshot을 봄. 조회 뒤 느린 작업이 이어지면 release() 호출.
+    트랜잭션의 첫 statement에서 replica 연결이 실패하면(ReplicaRouter가 제외 처리) primary로 다시 실행.
+    """
+
+    @property
+    def on_replica(self) -> bool:
+        """replica에 연결된 session인지 (replica는 복제 지연만큼 primary보다 뒤처질 수 있음)"""
+
+        return bool(self.info.get("replica"))
+
+    async def _fall_back_to_primary(self) -> bool:
+        """실패한 replica가 제외 목록에 올랐으면 primary로 bind를 바꾸고 True"""
+
+        idx = self.info.get("replica_idx")
+        if idx is None or not ReplicaRouter.is_down(idx):
+            return False
+        await self.rollback()
+        logger.warning("replica%d unavailable, falling back to primary", idx)
+        self.bind = ENGINE
+        self.sync_session.bind = ENGINE.sync_engine
+        self.info.update(replica=False, replica_idx=None)
+        return True
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        first = not self.in_transaction()
+        try:
+            return await super().execute(*args, **kwargs)
+        except DBAPIError:
+            if not (first and await self._fall_back_to_primary()):
+                raise
+        return await super().execute(*args, **kwargs)
+
+    async def stream(self, *args: Any, **kwargs: Any) -> Any:
+        first = not self.in_transaction()
+        try:
+            return await super().stream(*args, **kwargs)
+        except DBAPIError:
+            if not (first and await self._fall_back_to_primary()):
+                raise
+        return await super().stream(*args, **kwargs)
+
+
+def create_engine(url: str, name: str, **kwargs) -> AsyncEngine:
+    """session time_zone을 UTC로 고정 (TIMESTAMP를 client_now()와 같은 UTC 기준으로 읽고 씀)"""
+
+    engine = create_async_engine(
+        url,
+        future=True,
+        echo=False,
+        poolclass=TimedQueuePool,
+        pool_logging_name=name,
+        pool_size=5,
+        max_overflow=10,
+        pool_timeout=30,
+        pool_recycle=1800,
+        connect_args={"init_command": "SET time_zone = '+00:00'"},
+        **kwargs,
+    )
+    QueryProfiler.install(engine)
+    return engine
+
+
+ENGINE = create_engine(settings.MYSQL_URL, "primary")
+SESSION = async_sessionmaker(
+    bind=ENGINE, class_=LazySession, autocommit=False, expire_on_commit=False
+)
+# * replica가 없거나 모두 실패했을 때의 읽기 session
+PRIMARY_READ_SESSION = async_sessionmaker(
+    bind=ENGINE, class_=ReadSession, autocommit=False, expire_on_commit=False
 )
-SESSION = async_sessionmaker(bind=ENGINE, autocommit=False, expire_on_commit=False)
+
+# * replica마다 별도 engine(pool). 죽은 replica를 빨리 감지하도록 pre_ping 사용
+REPLICA_ENGINES = [
+    create_engine(url, f"replica{idx}", pool_pre_ping=True)
+    for idx, url in enumerate(settings.MYSQL_REPLICA_URLS)
+]
+REPLICA_SESSIONS = [
+    async_sessionmaker(
+        bind=engine,
+        class_=ReadSession,
+        autocommit=False,
+        expire_on_commit=False,
+        info={"replica": True, "replica_idx": idx},
+    )
+    for idx, engine in enumerate(REPLICA_ENGINES)
+]
+
+
+def _pool_gauge(name: str, documentation: str, value: str) -> Gauge:
+    def collect() -> Iterable[tuple[tuple[str, ...], float]]:
+        for engine in (ENGINE, *REPLICA_ENGINES):
+            pool = engine.pool
+            yield (pool.logging_name or "",), getattr(pool, value)()
+
+    return METRICS.register(Gauge(name, documentation, ("pool",), collect))
+
+
+_pool_gauge("db_pool_size", "Configured number of pooled DB connections", "size")
+_pool_gauge("db_pool_checked_out", "DB connections currently checked out", "checkedout")
+_pool_gauge("db_pool_checked_in", "Idle DB connections in the pool", "checkedin")
+# * QueuePool.overflow()는 pool_size만큼 음수에서 시작 (0보다 크면 max_overflow 사용 중)
+_pool_gauge("db_pool_overflow", "Current DB pool overflow (negative below pool_size)", "overflow")
+
+
+class ReplicaRouter:
+    """읽기 전용 session을 replica로 분산 (round robin)
+
+    - 쓰기 요청 직후에는 STICKY_COOKIE_KEY 쿠키(ReadYourWritesMiddleware가 설정)가 유효한 동안 primary 사용
+    - 연결에 실패한 replica는 REPLICA_RETRY_SECONDS 동안 제외, 모두 제외되면 primary 사용
+      (첫 쿼리의 pre_ping/연결에서 감지. 실패한 요청은 ReadSession이 primary로 다시 실행)
+    """
+
+    STICKY_COOKIE_KEY = "db_primary_until"
+    _counter = count()
+    _down_until: dict[int, float] = {}
+
+    @classmethod
+    def is_sticky(cls, request: Request) -> bool:
+        try:
+            return int(request.cookies.get(cls.STICKY_COOKIE_KEY, 0)) > time()
+        except ValueError:
+            return False
+
+    @classmethod
+    def candidates(cls) -> list[int]:
+        now = monotonic()
+        start = next(cls._counter) % len(REPLICA_SESSIONS)
+        order = [(start + i) % len(REPLICA_SESSIONS) for i in range(len(REPLICA_SESSIONS))]
+        return [idx for idx in order if cls._down_until.get(idx, 0) <= now]
+
+    @classmethod
+    def is_down(cls, idx: int) -> bool:
+        return cls._down_until.get(idx, 0) > monotonic()
+
+    @classmethod
+    def mark_down(cls, idx: int) -> None:
+        cls._down_until[idx] = monotonic() + settings.REPLICA_RETRY_SECONDS
+
+    @classmethod
+    def open_session(cls, request: Request) -> ReadSession:
+        # * connection은 첫 쿼리에서 checkout (cache hit 등 쿼리가 없는 요청은 pool slot을 쓰지 않음)
+        if REPLICA_SESSIONS and not cls.is_sticky(request):
+            for idx in cls.candidates():
+                return REPLICA_SESSIONS[idx]()
+        return PRIMARY_READ_SESSION()
+
+    @classmethod
+    def install(cls, idx: int, engine: AsyncEngine) -> None:
+        """연결 실패/끊김(pre_ping 포함)이 난 replica를 제외 목록에 올리는 engine event 등록"""
+
+        def handle_error(context: ExceptionContext) -> None:
+            if context.is_disconnect or context.connection is None:
+                logger.warning("replica marked down: %s", engine.pool.logging_name)
+                cls.mark_down(idx)
+
+        event.listen(engine.sync_engine, "handle_error", handle_error)
+
+
+for _idx, _engine in enumerate(REPLICA_ENGINES):
+    ReplicaRouter.install(_idx, _engine)
+
+
+@asynccontextmanager
+async def read_session(request: Request) -> AsyncIterator[ReadSession]:
+    async with ReplicaRouter.open_session(request) as sess:
+        yield sess
 
 
 async def get_db_session() -> AsyncGenerator:
+    """primary session. connection은 첫 statement에서 checkout, commit/rollback/release 시 반납"""
+
     async with SESSION() as sess:
         try:
             yield sess
@@ -26,8 +251,36 @@ async def get_db_session() -> AsyncGenerator:
             await sess.rollback()
 
 
-async def create_all_tables() -> None:
-    async with ENGINE.begin() as conn:
-        # await conn.run_sync(ModelBase.metadata.drop_all)
-        await conn.run_sync(ModelBase.metadata.create_all)
-    await ENGINE.dispose()
+async def get_read_db_session(request: Request) -> AsyncGenerator:
+    """replica session (replica가 없거나 모두 실패하면 primary)"""
+
+    async with read_session(request) as sess:
+        try:
+            yield sess
+        except SQLAlchemyError:
+            await sess.rollback()
+
+
+async def warm_up_engines() -> None:
+    """DB_POOL_WARM_SIZE개(최대 pool_size)의 연결을 미리 열어 pool에 넣어 둠
+
+    첫 요청들이 TCP 연결, 인증 비용을 내지 않도록 부팅 시 호출. replica 실패는 무시
+    """
+
+    for engine in (ENGINE, *REPLICA_ENGINES):
+        size = min(settings.DB_POOL_WARM_SIZE, engine.pool.size())  # type:ignore
+        conns = [engine.connect() for _ in range(size)]
+        try:
+            await asyncio.gather(*(conn.start() for conn in conns))
+        except (SQLAlchemyError, OSError):
+            if engine is ENGINE:
+                raise
+            logger.warning("replica pool warm-up failed: %s", engine.pool.logging_name)
+        finally:
+            # * 반납하면 pool에 남음 (pool_size 이하이므로)
+            await asyncio.gather(*(c.close() for c in conns if c.sync_connection is not None))
+
+
+async def dispose_engines() -> None:
+    for engine in (ENGINE, *REPLICA_ENGINES):
+        await engine.dispose()
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import sys
+import threading
+from collections import Counter
+from functools import lru_cache
+from time import perf_counter, sleep
+from types import FrameType
+
+from app.config import settings
+from app.exceptions import ConflictException
+
+from .metrics import EVENT_LOOP_LAG_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# * 긴 prefix부터 비교 (site-packages가 stdlib 경로보다 먼저 잘리도록)
+PATH_PREFIXES = sorted({p.rstrip("/") + "/" for p in sys.path if p}, key=len, reverse=True)
+
+
+class LoopLagMonitor:
+    """event loop 지연 측정
+
+    LOOP_LAG_INTERVAL_SECONDS마다 sleep 후 예정보다 늦게 깨어난 시간을 lag로 기록
+    (event_loop_lag_seconds histogram). bcrypt 등 loop를 막는 동기 작업이 있으면 커짐.
+    """
+
+    max_lag = 0.0
+    _task: asyncio.Task | None = None
+
+    @classmethod
+    async def _run(cls) -> None:
+        loop = asyncio.get_running_loop()
+        interval = settings.LOOP_LAG_INTERVAL_SECONDS
+        while True:
+            start = loop.time()
+            await asyncio.sleep(interval)
+            lag = max(0.0, loop.time() - start - interval)
+            EVENT_LOOP_LAG_SECONDS.observe(lag)
+            cls.max_lag = max(cls.max_lag, lag)
+            if lag >= settings.LOOP_LAG_WARN_SECONDS:
+                logger.warning("event loop blocked for %.3fs", lag)
+
+    @classmethod
+    def start(cls) -> None:
+        if cls._task is None:
+            cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+
+
+@lru_cache(maxsize=4096)
+def _short_path(filename: str) -> str:
+    for prefix in PATH_PREFIXES:
+        if filename.startswith(prefix):
+            return filename[len(prefix) :]
+    return filename
+
+
+class StackSampler:
+    """별도 thread에서 sys._current_frames()를 주기적으로 읽는 sampling profiler
+
+    event loop가 막혀 있어도 sampling 가능. 결과는 flamegraph.pl, speedscope 등에서 읽는
+    collapsed stack 형식 ("thread;바깥 frame;...;안쪽 frame 횟수").
+    worker 내에서 동시에 1개만 실행.
+    """
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _label(frame: FrameType) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({_short_path(code.co_filename)}:{frame.f_lineno})"
+
+    @classmethod
+    def sample(
+        cls, seconds: float, interval: float, thread_id: int | None = None
+    ) -> Counter[str]:
+        """seconds 동안 interval마다 stack 수집
+
+        Args:
+            seconds (float): 수집 시간
+            interval (float): sampling 간격 (초)
+            thread_id (int | None): 이 thread만 수집 (None이면 sampler 외 모든 thread)
+
+        Returns:
+            Counter[str]: collapsed stack별 sample 수
+        """
+
+        if not cls._lock.acquire(blocking=False):
+            raise ConflictException("Profiler is already running.")
+        try:
+            me = threading.get_ident()
+            stacks: Counter[str] = Counter()
+            deadline = perf_counter() + seconds
+            while perf_counter() < deadline:
+                names = {t.ident: t.name for t in threading.enumerate()}
+                for ident, frame in sys._current_frames().items():
+                    if ident == me or (thread_id is not None and ident != thread_id):
+                        continue
+                    labels = []
+                    current: FrameType | None = frame
+                    while current is not None:
+                        labels.append(cls._label(current))
+                        current = current.f_back
+                    labels.append(names.get(ident, f"thread-{ident}"))
+                    stacks[";".join(reversed(labels))] += 1
+                sleep(interval)
+            return stacks
+        finally:
+            cls._lock.release()
+
+    @staticmethod
+    def collapse(stacks: Counter[str]) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
@@ -0,0 +1,116 @@
+import logging
+from hashlib import blake2b
+from time import time
+from typing import Collection
+
+from aioredis import Redis, RedisError
+from fastapi import Request
+
+from app.config import settings
+from app.exceptions import NotModifiedException
+
+from .redis import RedisUnavailableError, retry_on_redis_error
+
+logger = logging.getLogger(__name__)
+
+# * version은 ms timestamp 기반으로 항상 증가 (key가 만료/유실된 뒤 다시 만들어도 예전 값과 겹치지 않음)
+# * KEYS[1]: event version / ARGV[1]: now(ms), ARGV[2]: TTL (다른 script 앞에 붙여서도 사용)
+BUMP_VERSION_LUA = """
+local version = tonumber(redis.call('GET', KEYS[1]) or '0')
+local now = tonumber(ARGV[1])
+if now <= version then now = version + 1 end
+redis.call('SET', KEYS[1], now, 'EX', ARGV[2])
+"""
+BUMP_VERSION_SCRIPT = BUMP_VERSION_LUA + "return now\n"
+
+
+class ETagHandler:
+    """유저별 event version(redis) 기반 strong ETag
+
+    Event 쓰기(create/update/delete)마다 version을 올리고 (EventStats.apply에서 통계 증감과 함께),
+    GET 요청의 If-None-Match가 현재 version으로 만든 ETag와 같으면 MySQL 조회 없이 304 반환.
+    version 증가에 실패하면 key를 삭제 (다음 조회 때 더 큰 version을 새로 만듦).
+    삭제도 실패하면 이 worker는 삭제에 성공할 때까지 해당 유저에게 ETag 없이 응답
+    (다른 worker는 redis가 복구된 뒤 EVENT_VERSION_TTL_SECONDS까지 이전 version을 볼 수 있음).
+    """
+
+    # * version 증가와 삭제가 모두 실패한 유저 (이 worker)
+    _stale: set[str] = set()
+
+    @staticmethod
+    def key(user_id: str) -> str:
+        return f"{settings.REDIS_EVENT_VERSION_KEY}:{user_id}"
+
+    @staticmethod
+    def bump_args() -> list[int]:
+        """BUMP_VERSION_LUA의 ARGV"""
+
+        return [int(time() * 1000), settings.EVENT_VERSION_TTL_SECONDS]
+
+    @classmethod
+    async def _bump(cls, redis: Redis, user_id: str) -> int:
+        return await redis.eval(
+            BUMP_VERSION_SCRIPT, 1, cls.key(user_id), *cls.bump_args()
+        )  # type:ignore
+
+    @classmethod
+    @retry_on_redis_error(error=RedisUnavailableError)
+    async def _delete(cls, redis: Redis, user_ids: Collection[str]) -> None:
+        await redis.delete(*map(cls.key, user_ids))
+
+    @classmethod
+    async def _clear_stale(cls, redis: Redis, user_ids: Collection[str]) -> bool:
+        try:
+            await cls._delete(redis, user_ids)
+        except RedisError:
+            logger.warning("failed to invalidate event version: user_ids=%s", user_ids)
+            return False
+        cls._stale.difference_update(user_ids)
+        return True
+
+    @classmethod
+    async def invalidate(cls, redis: Redis, *user_ids: str) -> None:
+        """version 증가에 실패한 유저의 version key 삭제 (실패하면 _stale에 남김)"""
+
+        cls._stale.update(user_ids)
+        await cls._clear_stale(redis, user_ids)
+
+    @classmethod
+    @retry_on_redis_error(error=RedisUnavailableError)
+    async def get_version(cls, redis: Redis, user_id: str) -> int:
+        if (version := await redis.get(cls.key(user_id))) is not None:
+            return int(version)
+        return await cls._bump(redis, user_id)
+
+    @staticmethod
+    def make_etag(request: Request, user_id: str, version: int) -> str:
+        resource = f"{user_id}:{request.url.path}?{request.url.query}".encode()
+        return f'"{version}-{blake2b(resource, digest_size=8).hexdigest()}"'
+
+    @classmethod
+    async def check(
+        cls, request: Request, redis: Redis, user_id: str, min_age: float = 0
+    ) -> str | None:
+        """현재 ETag 반환. If-None-Match와 일치하면 NotModifiedException(304)
+
+        redis 장애, 이전 version 삭제 실패 시 None 반환 (ETag 없이 일반 응답).
+        마지막 쓰기(version은 ms timestamp 기반)가 min_age초 안이면 None 반환 (304 판단은 그대로).
+        If-None-Match: *는 무시 (조회 전이라 대상 존재 여부를 모름: 없는 event에도 304가 나감)
+        """
+
+        if user_id in cls._stale and not await cls._clear_stale(redis, [user_id]):
+            return None
+        try:
+            version = await cls.get_version(redis, user_id)
+        except RedisError:
+            return None
+
+        etag = cls.make_etag(request, user_id, version)
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            candidates = {tag.strip() for tag in if_none_match.split(",")}
+            if etag in candidates:
+                raise NotModifiedException(headers={"ETag": etag})
+        if time() * 1000 - version < min_age * 1000:
+            return None
+        return etag
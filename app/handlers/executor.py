@@ -0,0 +1,89 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Any, Callable, TypeVar
+
+from app.exceptions import ServiceUnavailableException
+
+from .metrics import EXECUTOR_QUEUE_WAIT_SECONDS
+
+T = TypeVar("T")
+
+
+@dataclass
+class ExecutorStats:
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    rejected: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["avg_wait_seconds"] = (
+            self.total_wait_seconds / self.completed if self.completed else 0.0
+        )
+        return data
+
+
+class BoundedExecutor:
+    """CPU 작업을 event loop 밖(thread/process pool)에서 실행
+
+    - 동시에 실행되는 작업 수는 max_workers로 제한
+    - 대기열이 max_queue_size를 넘으면 바로 ServiceUnavailableException (대기열 무한 증가 방지)
+    - 대기 시간은 name label로 executor_queue_wait_seconds에 기록
+    """
+
+    def __init__(self, name: str, kind: str, max_workers: int, max_queue_size: int) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"invalid executor kind: {kind}")
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.stats = ExecutorStats()
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="bounded-executor"
+                )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        stats = self.stats
+        if stats.queued >= self.max_queue_size:
+            stats.rejected += 1
+            raise ServiceUnavailableException
+
+        stats.queued += 1
+        start = perf_counter()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            stats.queued -= 1
+
+        wait = perf_counter() - start
+        stats.total_wait_seconds += wait
+        stats.max_wait_seconds = max(stats.max_wait_seconds, wait)
+        EXECUTOR_QUEUE_WAIT_SECONDS.observe(wait, self.name)
+        stats.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            stats.running -= 1
+            stats.completed += 1
+            self._semaphore.release()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -1,17 +1,23 @@
 from dataclasses import asdict, dataclass
 from datetime import datetime
+from hashlib import blake2b
 from time import time
+from uuid import uuid4
 
 from aioredis import Redis
 from fastapi import Request, Response
-from jose import JWTError, jwt  # type:ignore
+from fastapi.security.utils import get_authorization_scheme_param
 from typing_extensions import Self
 
 from app.config import settings
 from app.exceptions import InvalidTokenException, UnAuthorizedException
 from app.models.users import User
 
+from .cache import TTLCache
+from .jwt_codecs import get_codec
+from .metrics import REDIS_COMMAND_SECONDS
 from .redis import retry_on_redis_error
+from .revocation import RevocationRegistry
 
 
 @dataclass(frozen=True)
@@ -19,13 +25,14 @@ class TokenPayload:
     sub: str
     exp: int
     is_admin: bool
+    jti: str = ""  # 토큰 고유 id (폐기 목록 key). jti 도입 전에 발급된 토큰은 빈 값
 
     @classmethod
     def from_user(cls, user_id: str, expires_in_seconds: int, is_admin: bool) -> Self:
         """datetime을 timestamp로 변환한 뒤 TokenPayload 객체 반환"""
 
         expires_timestamp = int(time()) + expires_in_seconds
-        return cls(sub=user_id, exp=expires_timestamp, is_admin=is_admin)
+        return cls(sub=user_id, exp=expires_timestamp, is_admin=is_admin, jti=uuid4().hex)
 
     def exp_to_datetime(self) -> datetime:
         """expire timestamp to datetime"""
@@ -34,21 +41,37 @@ class TokenPayload:
 
 
 class TokenHandler:
-    @staticmethod
-    def encode_token(token_payload: TokenPayload) -> str:
-        return jwt.encode(  # type:ignore
-            asdict(token_payload), settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM
-        )
+    CODEC = get_codec(settings.JWT_BACKEND, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+    # * 검증이 끝난 토큰 cache (key: 토큰 digest). 만료 시각(exp)이 지나면 cache에서도 사라짐
+    VERIFIED: TTLCache[TokenPayload] = TTLCache(
+        settings.TOKEN_CACHE_MAX_SIZE, settings.TOKEN_CACHE_TTL_SECONDS
+    )
 
-    @staticmethod
-    def decode_token(token: str) -> TokenPayload:
+    @classmethod
+    def encode_token(cls, token_payload: TokenPayload) -> str:
+        return cls.CODEC.encode(asdict(token_payload))
+
+    @classmethod
+    def decode_token(cls, token: str) -> TokenPayload:
         """검증 실패 시 InvalidTokenException"""
 
+        key = blake2b(token.encode(), digest_size=16).digest()
+        if (payload := cls.VERIFIED.get(key)) is not None:
+            return payload
+
         try:
-            payload = jwt.decode(token, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
-            return TokenPayload(**payload)
-        except JWTError:
+            payload = TokenPayload(**cls.CODEC.decode(token))
+        except TypeError:
             raise InvalidTokenException
+        if (remaining_sec := payload.exp - time()) > 0:
+            cls.VERIFIED.set(key, payload, remaining_sec)
+        return payload
+
+    @staticmethod
+    def revocation_id(token: str, payload: TokenPayload) -> str:
+        """폐기 목록 key에 쓸 id. jti 없는 (이전 형식) 토큰은 기존 blacklist key와 맞추기 위해 토큰 원문"""
+
+        return payload.jti or token
 
     @classmethod
     def generate_access_token(cls, user: User) -> str:
@@ -64,6 +87,7 @@ class TokenHandler:
 class TokenStorage:
     @staticmethod
     @retry_on_redis_error()
+    @REDIS_COMMAND_SECONDS.timed("save_refresh_token")
     async def save_refresh_token(redis: Redis, user: User, token: str) -> None:
         await redis.set(
             f"{settings.REDIS_TOKEN_KEY}:{user.id}",
@@ -72,22 +96,62 @@ class TokenStorage:
         )
 
     @staticmethod
-    @retry_on_redis_error()
-    async def delete_refresh_token(redis: Redis, token: str) -> None:
+    def _revoke(pipe: Redis, token: str, payload: TokenPayload) -> None:
+        """pipeline에 blacklist 등록 + 다른 worker에 폐기 알림 추가"""
+
+        revocation_id = TokenHandler.revocation_id(token, payload)
+        if (remaining_sec := payload.exp - int(time())) > 0:
+            pipe.set(RevocationRegistry.key(revocation_id), value=1, ex=remaining_sec)
+            pipe.publish(settings.REDIS_REVOCATION_CHANNEL, revocation_id)
+        RevocationRegistry.add(revocation_id)
+
+    @staticmethod
+    async def revoke_refresh_token(redis: Redis, token: str) -> bool:
+        """blacklist 등록(SET NX), refresh token 삭제를 하나의 pipeline(MULTI/EXEC)으로 전송
+
+        blacklist 값은 호출마다 만든 nonce. 같은 호출의 재시도(EXEC는 성공했지만 응답이 유실된 경우)는
+        자기 nonce를 읽으므로 이미 폐기된 토큰(재사용)으로 오인하지 않음.
+
+        Args:
+            redis (Redis): redis client
+            token (str): refresh token
+
+        Returns:
+            bool: 다른 호출이 이미 blacklist에 등록한 토큰이면 True
+        """
+
         payload = TokenHandler.decode_token(token)
-        await redis.delete(f"{settings.REDIS_TOKEN_KEY}:{payload.sub}")
+        nonce = uuid4().hex
+        return await TokenStorage._revoke_refresh_token(redis, token, payload, nonce) != nonce
 
     @staticmethod
     @retry_on_redis_error()
-    async def set_blacklist(redis: Redis, token: str) -> None:
-        payload = TokenHandler.decode_token(token)
-        if (remaining_sec := payload.exp - int(time())) > 0:
-            await redis.set(f"{settings.REDIS_BLACKLIST_KEY}:{token}", value=1, ex=remaining_sec)
+    @REDIS_COMMAND_SECONDS.timed("revoke_refresh_token")
+    async def _revoke_refresh_token(
+        redis: Redis, token: str, payload: TokenPayload, nonce: str
+    ) -> str | None:
+        """blacklist에 저장된 값(먼저 등록한 호출의 nonce) 반환"""
+
+        revocation_id = TokenHandler.revocation_id(token, payload)
+        key = RevocationRegistry.key(revocation_id)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.set(key, value=nonce, ex=max(payload.exp - int(time()), 1), nx=True)
+            pipe.get(key)
+            pipe.delete(f"{settings.REDIS_TOKEN_KEY}:{payload.sub}")
+            pipe.publish(settings.REDIS_REVOCATION_CHANNEL, revocation_id)
+            result = await pipe.execute()
+        RevocationRegistry.add(revocation_id)
+        stored = result[1]
+        return stored.decode() if isinstance(stored, bytes) else stored
 
     @staticmethod
     @retry_on_redis_error()
-    async def is_blacklisted(redis: Redis, token: str) -> bool:
-        return await redis.exists(f"{settings.REDIS_BLACKLIST_KEY}:{token}") > 0  # type:ignore
+    @REDIS_COMMAND_SECONDS.timed("revoke_access_token")
+    async def revoke_access_token(redis: Redis, token: str) -> None:
+        payload = TokenHandler.decode_token(token)
+        async with redis.pipeline(transaction=True) as pipe:
+            TokenStorage._revoke(pipe, token, payload)
+            await pipe.execute()
 
 
 class TokenIssuer:
@@ -118,12 +182,15 @@ class TokenIssuer:
         return access_token
 
     async def revoke_token(self) -> None:
-        """cookie 확인 후 refresh token 있으면 token 삭제"""
+        """요청에 쓰인 access token 폐기, cookie 확인 후 refresh token 있으면 token 삭제"""
+
+        _, access_token = get_authorization_scheme_param(self.request.headers.get("Authorization"))
+        if access_token:
+            await TokenStorage.revoke_access_token(self.redis, access_token)
 
         token = self.request.cookies.get(settings.REFRESH_TOKEN_COOKIE_KEY)
         if token is not None:
-            await TokenStorage.delete_refresh_token(self.redis, token)
-            await TokenStorage.set_blacklist(self.redis, token)
+            await TokenStorage.revoke_refresh_token(self.redis, token)
             self.response.delete_cookie(settings.REFRESH_TOKEN_COOKIE_KEY, self.COOKIE_PATH)
         return
 
@@ -134,9 +201,8 @@ class TokenIssuer:
         if token is None:
             raise UnAuthorizedException
         self.response.delete_cookie(settings.REFRESH_TOKEN_COOKIE_KEY, self.COOKIE_PATH)
-        if await TokenStorage.is_blacklisted(self.redis, token):
+        # * 이미 blacklist에 있던 토큰이어도 SET NX/삭제는 멱등이므로 한 번의 round trip으로 처리
+        if await TokenStorage.revoke_refresh_token(self.redis, token):
             raise InvalidTokenException
-        await TokenStorage.delete_refresh_token(self.redis, token)
-        await TokenStorage.set_blacklist(self.redis, token)
         payload = TokenHandler.decode_token(token)
         return await self.issue_token(User(id=payload.sub))
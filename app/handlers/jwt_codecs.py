@@ -0,0 +1,99 @@
+import hashlib
+import hmac
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from time import time
+from typing import Any, Protocol
+
+from jose import JWTError, jwt  # type:ignore
+
+from app.exceptions import InvalidTokenException
+
+
+class JWTCodec(Protocol):
+    """JWT encode/decode backend. decode는 서명/만료 검증 실패 시 InvalidTokenException"""
+
+    def encode(self, claims: dict[str, Any]) -> str: ...
+
+    def decode(self, token: str) -> dict[str, Any]: ...
+
+
+class JoseCodec:
+    """python-jose (모든 알고리즘 지원)"""
+
+    def __init__(self, secret_key: str, algorithm: str) -> None:
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        return jwt.encode(claims, self.secret_key, self.algorithm)  # type:ignore
+
+    def decode(self, token: str) -> dict[str, Any]:
+        try:
+            return jwt.decode(token, self.secret_key, self.algorithm)
+        except JWTError:
+            raise InvalidTokenException
+
+
+def b64encode(data: bytes) -> bytes:
+    return urlsafe_b64encode(data).rstrip(b"=")
+
+
+def b64decode(data: bytes) -> bytes:
+    return urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+class HMACCodec:
+    """표준 라이브러리 hmac 기반 HS256/HS384/HS512
+
+    secret key로 초기화한 hmac 객체와 header를 미리 만들어 두고 요청마다 copy()만 함.
+    python-jose와 같은 compact 형식이라 서로 발급한 토큰을 검증할 수 있음. (검증 claim은 exp만)
+    """
+
+    DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+    def __init__(self, secret_key: str, algorithm: str) -> None:
+        if algorithm not in self.DIGESTS:
+            raise ValueError(f"HMACCodec does not support {algorithm}")
+        self.algorithm = algorithm
+        self._mac = hmac.new(secret_key.encode(), digestmod=self.DIGESTS[algorithm])
+        header = {"alg": algorithm, "typ": "JWT"}
+        self._header = b64encode(json.dumps(header, separators=(",", ":")).encode())
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        payload = b64encode(json.dumps(claims, separators=(",", ":")).encode())
+        signing_input = self._header + b"." + payload
+        return (signing_input + b"." + b64encode(self._sign(signing_input))).decode()
+
+    def decode(self, token: str) -> dict[str, Any]:
+        try:
+            signing_input, _, signature = token.encode().rpartition(b".")
+            header, _, payload = signing_input.partition(b".")
+            if json.loads(b64decode(header)).get("alg") != self.algorithm:
+                raise InvalidTokenException
+            if not hmac.compare_digest(self._sign(signing_input), b64decode(signature)):
+                raise InvalidTokenException
+            claims = json.loads(b64decode(payload))
+        except (ValueError, AttributeError):
+            raise InvalidTokenException
+
+        if not isinstance(claims, dict):
+            raise InvalidTokenException
+        if "exp" in claims and int(claims["exp"]) < int(time()):
+            raise InvalidTokenException
+        return claims
+
+
+CODECS: dict[str, type[JoseCodec] | type[HMACCodec]] = {"jose": JoseCodec, "hmac": HMACCodec}
+
+
+def get_codec(backend: str, secret_key: str, algorithm: str) -> JWTCodec:
+    try:
+        return CODECS[backend](secret_key, algorithm)
+    except KeyError:
+        raise ValueError(f"unknown JWT backend: {backend}")
@@ -0,0 +1,211 @@
+from bisect import bisect_left
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Iterable
+
+LabelValues = tuple[str, ...]
+
+# * 초 단위 latency bucket (5ms ~ 10s)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Iterable[str], values: Iterable[str], **extra: str) -> str:
+    pairs = [*zip(names, values), *extra.items()]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """metric 1종 (이름, 설명, label 이름). 값은 label 값 tuple별로 보관"""
+
+    TYPE = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: LabelValues = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        header = f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.TYPE}\n"
+        return header + "".join(f"{line}\n" for line in self.samples())
+
+
+class Counter(Metric):
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: LabelValues = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self._values.items():
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+class Histogram(Metric):
+    """누적 bucket은 출력할 때 계산 (observe는 bucket 1개만 증가시켜 요청마다 드는 비용 최소화)"""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: LabelValues = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+        # * label 값 -> [bucket별 개수(마지막은 +Inf), 합계]
+        self._series: dict[LabelValues, list[Any]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def timed(self, *labels: str) -> Callable:
+        """async 함수 실행 시간 기록 decorator (예외가 나도 기록)"""
+
+        def decorator(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                start = perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self.observe(perf_counter() - start, *labels)
+
+            return wrapper
+
+        return decorator
+
+    def samples(self) -> Iterable[str]:
+        bounds = [*map(_number, self.buckets), "+Inf"]
+        for labels, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                yield f"{self.name}_bucket{_labels(self.labelnames, labels, le=bound)} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}"
+            yield f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}"
+
+
+class Gauge(Metric):
+    """조회 시점에 collect()를 호출해서 값을 읽는 gauge (pool 상태 등 이미 다른 곳에 있는 값)"""
+
+    TYPE = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: LabelValues,
+        collect: Callable[[], Iterable[tuple[LabelValues, float]]],
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.collect = collect
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self.collect():
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+class CollectedCounter(Gauge):
+    """조회 시점에 값을 읽는 counter (이미 다른 곳에서 누적 중인 통계)"""
+
+    TYPE = "counter"
+
+
+class MetricsRegistry:
+    """worker 내 metric 목록. render()는 Prometheus text exposition format(0.0.4)"""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self.metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Any:
+        if metric.name in self.metrics:
+            raise ValueError(f"duplicated metric: {metric.name}")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        return "".join(metric.render() for metric in self.metrics.values())
+
+
+METRICS = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS: Histogram = METRICS.register(
+    Histogram("http_request_duration_seconds", "HTTP request latency", ("method", "route"))
+)
+HTTP_REQUESTS: Counter = METRICS.register(
+    Counter("http_requests_total", "HTTP responses by status", ("method", "route", "status"))
+)
+REDIS_COMMAND_SECONDS: Histogram = METRICS.register(
+    Histogram(
+        "redis_command_duration_seconds",
+        "Redis command (or pipeline) latency per attempt",
+        ("operation",),
+        buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    )
+)
+DB_POOL_WAIT_SECONDS: Histogram = METRICS.register(
+    Histogram(
+        "db_pool_wait_seconds",
+        "Time spent waiting for a DB connection from the pool",
+        ("pool",),
+        buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+    )
+)
+DB_CONNECTION_HOLD_SECONDS: Histogram = METRICS.register(
+    Histogram(
+        "db_connection_hold_seconds",
+        "Time a DB connection stays checked out from the pool (checkout to checkin)",
+        ("pool",),
+        buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+    )
+)
+DB_REQUEST_HOLD_SECONDS: Histogram = METRICS.register(
+    Histogram(
+        "db_request_connection_hold_seconds",
+        "Total DB connection hold time per request that used the database",
+        ("method", "route"),
+        buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+    )
+)
+EVENT_LOOP_LAG_SECONDS: Histogram = METRICS.register(
+    Histogram(
+        "event_loop_lag_seconds",
+        "Delay between a scheduled event loop wake-up and the actual one",
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    )
+)
+EXECUTOR_QUEUE_WAIT_SECONDS: Histogram = METRICS.register(
+    Histogram(
+        "executor_queue_wait_seconds",
+        "Time a task waits for a free worker in a BoundedExecutor",
+        ("executor",),
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    )
+)
@@ -0,0 +1,30 @@
+from typing import Sequence
+
+from app.models.events import Event, EventChange
+from app.models.users import User
+
+from .cache import UserCache
+from .stats import EventStats
+
+
+async def event_written(user_ids: Sequence[str], changes: Sequence[EventChange]) -> None:
+    """Event 쓰기 후 유저별 event version 증가 (ETag 무효화), 통계(EventStats) 증감 (한 script로)"""
+
+    await EventStats.apply(user_ids, changes)
+
+
+async def user_written(user_ids: Sequence[str], deleted: bool) -> None:
+    """User 쓰기 후 인증 유저 cache 무효화 (is_disabled 등 변경 즉시 반영), 삭제면 통계도 삭제"""
+
+    await UserCache.invalidate(*user_ids)
+    if deleted:
+        await EventStats.clear(*user_ids)
+
+
+def install_model_hooks() -> None:
+    """model 쓰기 후처리 등록 (model은 handler를 import하지 않음). 여러 번 호출해도 한 번만 등록"""
+
+    if event_written not in Event.AFTER_WRITE:
+        Event.AFTER_WRITE.append(event_written)
+    if user_written not in User.AFTER_WRITE:
+        User.AFTER_WRITE.append(user_written)
@@ -0,0 +1,91 @@
+import json
+import logging
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("app.slow_query")
+
+
+@dataclass
+class QueryStats:
+    """요청 1건 동안 실행된 SQL 통계"""
+
+    method: str = ""
+    path: str = ""
+    count: int = 0
+    seconds: float = 0.0
+    # * DB connection 점유 시간 합계 (TimedQueuePool이 반납 시 누적)
+    hold_seconds: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """threshold번 이상 반복된 statement (N+1 의심)"""
+
+        return [(stmt, n) for stmt, n in self.statements.most_common() if n >= threshold]
+
+
+# * middleware가 요청마다 새 QueryStats를 넣음. SQLAlchemy가 쿼리를 실행하는 greenlet도
+# * 요청 task의 context를 이어받으므로 engine event에서 같은 객체에 누적됨
+QUERY_STATS: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+class QueryProfiler:
+    """engine event hook: 요청별 쿼리 수/시간 집계, 느린 쿼리 로그"""
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        context._query_start = perf_counter()
+
+    @staticmethod
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = perf_counter() - context._query_start
+        stats = QUERY_STATS.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+        if elapsed >= settings.SLOW_QUERY_SECONDS:
+            QueryProfiler.log_slow_query(statement, elapsed, stats, executemany)
+
+    @staticmethod
+    def log_slow_query(
+        statement: str, seconds: float, stats: QueryStats | None, executemany: bool
+    ) -> None:
+        # * 파라미터는 개인정보(이메일, 비밀번호 hash 등)가 섞일 수 있어 기록하지 않음
+        record: dict[str, Any] = {
+            "event": "slow_query",
+            "duration_ms": round(seconds * 1000, 3),
+            "statement": " ".join(statement.split()),
+            "executemany": executemany,
+        }
+        if stats is not None:
+            record.update(method=stats.method, path=stats.path)
+        slow_query_logger.warning(json.dumps(record, ensure_ascii=False))
+
+    @classmethod
+    def install(cls, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "before_cursor_execute", cls._before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", cls._after_cursor_execute)
+
+    @staticmethod
+    def warn_repeated(stats: QueryStats, route: str) -> None:
+        for statement, count in stats.repeated(settings.N_PLUS_ONE_THRESHOLD):
+            logger.warning(
+                "possible N+1: %s %s ran the same statement %d times: %s",
+                stats.method,
+                route,
+                count,
+                " ".join(statement.split())[:300],
+            )
@@ -0,0 +1,91 @@
+import logging
+from hashlib import blake2b
+from time import time
+
+from aioredis import Redis, RedisError
+from fastapi import Request
+
+from app.config import settings
+from app.exceptions import TooManyRequestsException
+
+from .redis import RedisUnavailableError, get_redis_pool, retry_on_redis_error
+
+logger = logging.getLogger(__name__)
+
+# * token bucket 여러 개를 한 번에 검사/차감 (하나라도 부족하면 아무것도 차감하지 않음)
+# * KEYS: bucket key 목록, ARGV: now(ms), 이후 bucket마다 capacity, 초당 충전량
+TOKEN_BUCKET_SCRIPT = """
+local now = tonumber(ARGV[1])
+local buckets = {}
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local rate = tonumber(ARGV[i * 2 + 1])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) / 1000 * rate)
+    if tokens < 1 then
+        retry_after = math.max(retry_after, math.ceil((1 - tokens) / rate))
+    end
+    buckets[i] = {key, tokens, math.ceil(capacity / rate * 1000)}
+end
+for _, bucket in ipairs(buckets) do
+    local tokens = bucket[2]
+    if retry_after == 0 then tokens = tokens - 1 end
+    redis.call('HSET', bucket[1], 'tokens', tostring(tokens), 'ts', now)
+    redis.call('PEXPIRE', bucket[1], bucket[3])
+end
+return retry_after
+"""
+
+
+class RateLimiter:
+    """IP, email별 token bucket 요청 제한 (redis Lua script로 원자적으로 처리)
+
+    route dependency로 사용하며 endpoint(bcrypt) 실행 전에 429로 거절.
+    redis 장애 시에는 제한하지 않음 (로그인 자체가 막히지 않도록)
+    """
+
+    @staticmethod
+    @retry_on_redis_error(max_retries=1, error=RedisUnavailableError)
+    async def _consume(keys: list[str], args: list[float]) -> int:
+        # * token을 차감하므로 재시도 없이 breaker, deadline만 적용
+        script = Redis(connection_pool=get_redis_pool()).register_script(TOKEN_BUCKET_SCRIPT)
+        return int(await script(keys=keys, args=args))
+
+    def __init__(self, scope: str) -> None:
+        self.scope = scope
+
+    def _key(self, kind: str, value: str) -> str:
+        digest = blake2b(value.encode(), digest_size=12).hexdigest()
+        return f"{settings.REDIS_RATE_LIMIT_KEY}:{self.scope}:{kind}:{digest}"
+
+    async def __call__(self, request: Request) -> None:
+        ip = request.client.host if request.client else "unknown"
+        keys = [self._key("ip", ip)]
+        args: list[float] = [
+            int(time() * 1000),
+            settings.AUTH_RATE_LIMIT_IP_CAPACITY,
+            settings.AUTH_RATE_LIMIT_IP_PER_SECOND,
+        ]
+        try:
+            # * body는 FastAPI가 이미 읽어 둔 상태 (request에 cache 됨)
+            body = await request.json()
+            email = body.get("email") if isinstance(body, dict) else None
+        except ValueError:
+            email = None
+        if isinstance(email, str) and email:
+            keys.append(self._key("email", email.strip().lower()))
+            args += [
+                settings.AUTH_RATE_LIMIT_EMAIL_CAPACITY,
+                settings.AUTH_RATE_LIMIT_EMAIL_PER_SECOND,
+            ]
+
+        try:
+            retry_after = await self._consume(keys, args)
+        except RedisError:
+            logger.warning("rate limiter unavailable, allowing request: scope=%s", self.scope)
+            return
+        if retry_after > 0:
+            raise TooManyRequestsException(headers={"Retry-After": str(retry_after)})
@@ -0,0 +1,81 @@
+import argparse
+import asyncio
+import logging
+
+from aioredis import Redis
+from sqlalchemy import select
+
+from app.models.events import Event
+from app.models.users import User
+
+from .db import ENGINE, SESSION
+from .etag import ETagHandler
+from .redis import get_redis_pool
+from .stats import EventStats
+
+logger = logging.getLogger(__name__)
+
+# * 계산 중 쓰기가 있었던 유저를 다시 계산하는 횟수
+REBUILD_ATTEMPTS = 3
+
+
+async def rebuild(user_ids: list[str] | None = None, batch_size: int = 500) -> int:
+    """MySQL에서 유저별 event 통계를 다시 계산해 redis hash 교체
+
+    계산 전에 읽은 event version이 저장 시점에도 같은 유저만 교체 (replace_if_version).
+    그 사이 쓰기가 있었던 유저는 새 snapshot에서 다시 계산 (REBUILD_ATTEMPTS번 후에도 안 되면 건너뜀)
+
+    Args:
+        user_ids (list[str] | None): 대상 유저 (None이면 전체 유저를 id 순으로 batch_size명씩)
+        batch_size (int): 한 번에 계산할 유저 수
+
+    Returns:
+        int: 처리한 유저 수
+    """
+
+    done = 0
+    last_id = ""
+    redis = Redis(connection_pool=get_redis_pool())
+    async with SESSION() as db:
+        while True:
+            if user_ids is not None:
+                batch, user_ids = user_ids[:batch_size], user_ids[batch_size:]
+            else:
+                stmt = select(User.id).where(User.id > last_id).order_by(User.id).limit(batch_size)
+                batch = list((await db.execute(stmt)).scalars().all())
+            if not batch:
+                return done
+            pending = batch
+            for _ in range(REBUILD_ATTEMPTS):
+                # * version을 읽은 뒤에 시작한 새 snapshot에서 계산
+                await db.commit()
+                versions = {u: await ETagHandler.get_version(redis, u) for u in pending}
+                stats = await Event.stats(db, pending)
+                pending = [
+                    u
+                    for u in pending
+                    if not await EventStats.replace_if_version(
+                        u, EventStats.fields(stats[u]), ETagHandler.key(u), versions[u]
+                    )
+                ]
+                if not pending:
+                    break
+            if pending:
+                logger.warning("skipped (concurrent writes): user_ids=%s", pending)
+            done += len(batch)
+            last_id = batch[-1]
+            logger.info("rebuilt event stats: %d users", done)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="event 통계(redis) 재계산")
+    parser.add_argument("--user-id", action="append", default=None, help="대상 유저 (여러 번 가능)")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    async def main() -> None:
+        print(f"rebuilt: {await rebuild(args.user_id, args.batch_size)} users")
+        await ENGINE.dispose()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
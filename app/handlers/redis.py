@@ -1,36 +1,208 @@
 import asyncio
+import logging
+import random
+from collections import Counter
+from contextvars import ContextVar
 from functools import wraps
+from time import monotonic
 from typing import AsyncGenerator
 
-from aioredis import RedisError, from_url
+from aioredis import BlockingConnectionPool, Redis, RedisError
 
 from app.config import settings
 from app.exceptions import ServiceUnavailableException
 
+logger = logging.getLogger(__name__)
+
+# * retry_on_redis_error로 감싼 호출의 재시도 마감 시각 (monotonic)
+REDIS_DEADLINE: ContextVar[float | None] = ContextVar("redis_deadline", default=None)
+
+
+class RedisUnavailableError(RedisError):
+    """breaker가 open이거나 재시도 deadline을 넘김 (best effort 호출은 다른 RedisError처럼 처리)"""
+
+
+class DeadlineConnectionPool(BlockingConnectionPool):
+    """연결 대기 시간을 REDIS_POOL_TIMEOUT과 재시도 deadline까지 남은 시간 중 짧은 쪽으로 제한
+
+    get_connection이 대기 직전에 self.timeout을 읽으므로 property로 계산
+    (wait_for로 취소하면 연결 중이던 connection이 pool에 반환되지 않을 수 있음)
+    """
+
+    @property  # type:ignore[override]
+    def timeout(self) -> float:
+        deadline_at = REDIS_DEADLINE.get()
+        if deadline_at is None:
+            return self._timeout
+        return max(0.0, min(self._timeout, deadline_at - monotonic()))
+
+    @timeout.setter
+    def timeout(self, value: float) -> None:
+        self._timeout = value
+
+
+REDIS_POOL: DeadlineConnectionPool | None = None
+
+
+def get_redis_pool() -> DeadlineConnectionPool:
+    """worker 당 하나의 connection pool 반환 (없으면 생성)
+
+    BlockingConnectionPool은 max_connections에 도달하면 새 연결을 만들지 않고
+    REDIS_POOL_TIMEOUT 초(retry_on_redis_error 안에서는 deadline까지 남은 시간) 동안
+    반환되는 연결을 기다림.
+    응답이 REDIS_SOCKET_TIMEOUT 초 안에 오지 않으면 aioredis가 연결을 끊고 TimeoutError를 냄
+    (task cancel과 달리 응답 순서가 어긋난 연결이 pool에 돌아가지 않음).
+    """
+
+    global REDIS_POOL
+    if REDIS_POOL is None:
+        REDIS_POOL = DeadlineConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+    return REDIS_POOL
+
+
+async def warm_up_redis_pool() -> None:
+    """REDIS_POOL_WARM_SIZE개(최대 REDIS_MAX_CONNECTIONS)의 연결을 미리 열어 둠
+
+    실패해도 부팅은 계속 (redis 장애 시에도 동작하는 기능이 있으므로)
+    """
+
+    pool = get_redis_pool()
+    size = min(settings.REDIS_POOL_WARM_SIZE, settings.REDIS_MAX_CONNECTIONS)
+    results = await asyncio.gather(
+        *(pool.get_connection("PING") for _ in range(size)), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.warning("redis pool warm-up failed: %r", result)
+        else:
+            await pool.release(result)
+
+
+async def close_redis_pool() -> None:
+    global REDIS_POOL
+    if REDIS_POOL is not None:
+        await REDIS_POOL.disconnect()
+        REDIS_POOL = None
+
 
 async def get_redis() -> AsyncGenerator:
-    redis = from_url(settings.REDIS_URL, max_connections=5)
-    try:
-        yield redis
-    finally:
-        await redis.close()
+    # * 요청마다 pool을 새로 만들지 않고 공유 pool에서 연결을 빌려 씀. (pool 정리는 lifespan에서)
+    yield Redis(connection_pool=get_redis_pool())
+
+
+class CircuitBreaker:
+    """redis 장애 시 빠르게 실패하기 위한 circuit breaker (worker 내 공유)
+
+    - closed: 정상. 연속 실패가 failure_threshold 이상이면 open
+    - open: 바로 실패. recovery_seconds 지나면 half_open
+    - half_open: 시험 요청 1개만 통과. 성공하면 closed, 실패하면 다시 open
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int, recovery_seconds: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.transitions: Counter[str] = Counter()
+        self._trial_in_flight = False
+
+    def _transition(self, state: str) -> None:
+        logger.warning("redis circuit breaker: %s -> %s", self.state, state)
+        self.transitions[f"{self.state}->{state}"] += 1
+        self.state = state
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN:
+            if monotonic() - self.opened_at < self.recovery_seconds:
+                return False
+            self._transition(self.HALF_OPEN)
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+        return True
+
+    def release(self) -> None:
+        """redis와 무관한 이유로 끝난 시험 요청 반납"""
+
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._trial_in_flight = False
+        if self.state != self.CLOSED:
+            self._transition(self.CLOSED)
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or (
+            self.state == self.CLOSED and self.failures >= self.failure_threshold
+        ):
+            self.opened_at = monotonic()
+            self._transition(self.OPEN)
+
+
+REDIS_BREAKER = CircuitBreaker(
+    settings.REDIS_BREAKER_FAILURE_THRESHOLD, settings.REDIS_BREAKER_RECOVERY_SECONDS
+)
+
 
+def retry_on_redis_error(
+    max_retries: int = settings.REDIS_RETRY_MAX_ATTEMPTS,
+    base_delay: float = settings.REDIS_RETRY_BASE_DELAY,
+    max_delay: float = settings.REDIS_RETRY_MAX_DELAY,
+    deadline: float = settings.REDIS_RETRY_DEADLINE_SECONDS,
+    breaker: CircuitBreaker = REDIS_BREAKER,
+    error: type[Exception] = ServiceUnavailableException,
+):
+    """redis 명령어 실패 시 재시도
 
-def retry_on_redis_error(max_retries=3, delay=1):
-    """redis 명령어 실패 시 재시도"""
+    - 재시도 간격: full jitter exponential backoff (0 ~ min(max_delay, base_delay * 2^n))
+    - 시도 1회의 시간은 socket timeout(REDIS_SOCKET_TIMEOUT)으로 제한, deadline 초가 지나면 더 재시도하지 않음
+      (pool 연결 대기도 deadline까지 남은 시간으로 제한)
+    - breaker가 open이면 redis를 호출하지 않고 바로 error (기본 ServiceUnavailableException)
+    - 실패해도 요청을 계속 처리하는 호출(cache, ETag, 통계 등)은 error=RedisUnavailableError
+    - 명령은 실행됐지만 응답만 유실된 경우에도 재시도하므로 감싸는 함수는 멱등이어야 함
+      (멱등이 아니면 max_retries=1로 breaker, deadline만 적용)
+    - 감싼 함수 안에서 다시 감싼 함수를 호출하지 않음 (half_open 시험 요청이 1개뿐이라 실패함)
+    """
 
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            retries = 0
-            while retries < max_retries:
-                try:
-                    return await func(*args, **kwargs)
-                except RedisError:
-                    retries += 1
-                    if retries == max_retries:
-                        raise ServiceUnavailableException
-                    await asyncio.sleep(delay)
+            deadline_at = monotonic() + deadline
+            token = REDIS_DEADLINE.set(deadline_at)
+            try:
+                for attempt in range(max_retries):
+                    if not breaker.allow():
+                        raise error
+                    try:
+                        result = await func(*args, **kwargs)
+                    except RedisError:
+                        breaker.record_failure()
+                        delay = random.uniform(0, min(max_delay, base_delay * 2**attempt))
+                        if attempt + 1 == max_retries or monotonic() + delay >= deadline_at:
+                            raise error
+                        await asyncio.sleep(delay)
+                    except BaseException:
+                        breaker.release()
+                        raise
+                    else:
+                        breaker.record_success()
+                        return result
+                raise error
+            finally:
+                REDIS_DEADLINE.reset(token)
 
         return wrapper
 
@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import math
+from hashlib import blake2b
+from time import monotonic
+
+from aioredis import Redis, RedisError
+
+from app.config import settings
+
+from .redis import RedisUnavailableError, get_redis_pool, retry_on_redis_error
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """false positive만 있는 집합 (삭제 불가). 크기는 capacity, error_rate로 결정"""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        digest = blake2b(item.encode(), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class RevocationRegistry:
+    """폐기된 토큰(jti) 확인
+
+    worker마다 Bloom filter를 두고 redis pub/sub으로 다른 worker의 폐기도 반영.
+    Bloom filter에 없으면 redis 조회 없이 바로 '폐기 안 됨'으로 판단하고,
+    있으면(false positive 가능) redis에서 blacklist key를 확인.
+    동기화 task가 떠 있지 않거나 끊긴 동안에는 매번 redis를 조회함.
+    """
+
+    FILTER = BloomFilter(settings.REVOCATION_BLOOM_CAPACITY, settings.REVOCATION_BLOOM_ERROR_RATE)
+    _pending: BloomFilter | None = None
+    _synced = False
+    _task: asyncio.Task | None = None
+
+    @staticmethod
+    def key(revocation_id: str) -> str:
+        return f"{settings.REDIS_BLACKLIST_KEY}:{revocation_id}"
+
+    @classmethod
+    def add(cls, revocation_id: str) -> None:
+        cls.FILTER.add(revocation_id)
+        if cls._pending is not None:
+            cls._pending.add(revocation_id)
+
+    @classmethod
+    @retry_on_redis_error(error=RedisUnavailableError)
+    async def _exists(cls, revocation_id: str) -> bool:
+        redis = Redis(connection_pool=get_redis_pool())
+        return await redis.exists(cls.key(revocation_id)) > 0  # type:ignore
+
+    @classmethod
+    async def is_revoked(cls, revocation_id: str) -> bool:
+        if cls._synced and revocation_id not in cls.FILTER:
+            return False
+        try:
+            return await cls._exists(revocation_id)
+        except RedisError:
+            # * 확인할 수 없으면 Bloom filter 결과를 따름 (동기화 전이면 통과)
+            return cls._synced
+
+    @classmethod
+    async def _rebuild(cls, redis: Redis) -> None:
+        """blacklist key를 SCAN 해서 새 filter를 만든 뒤 교체 (만료된 jti 정리)"""
+
+        cls._pending = BloomFilter(
+            settings.REVOCATION_BLOOM_CAPACITY, settings.REVOCATION_BLOOM_ERROR_RATE
+        )
+        try:
+            prefix = f"{settings.REDIS_BLACKLIST_KEY}:"
+            async for key in redis.scan_iter(match=f"{prefix}*", count=1000):
+                cls._pending.add(key.decode()[len(prefix) :])
+            cls.FILTER = cls._pending
+        finally:
+            cls._pending = None
+
+    @classmethod
+    async def _sync(cls) -> None:
+        redis = Redis(connection_pool=get_redis_pool())
+        while True:
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                # * 구독 먼저 -> SCAN (사이에 들어온 폐기를 놓치지 않도록)
+                await pubsub.subscribe(settings.REDIS_REVOCATION_CHANNEL)
+                await cls._rebuild(redis)
+                cls._synced = True
+                rebuilt_at = monotonic()
+                while True:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        cls.add(message["data"].decode())
+                    if monotonic() - rebuilt_at > settings.REVOCATION_BLOOM_REBUILD_SECONDS:
+                        await cls._rebuild(redis)
+                        rebuilt_at = monotonic()
+            except RedisError:
+                logger.warning("revocation sync disconnected, retrying")
+                cls._synced = False
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.close()
+
+    @classmethod
+    def start(cls) -> None:
+        if cls._task is None:
+            cls._task = asyncio.create_task(cls._sync())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+            cls._synced = False
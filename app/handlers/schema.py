@@ -0,0 +1,161 @@
+import asyncio
+import logging
+from typing import Callable
+
+from sqlalchemy import TIMESTAMP, Column, Connection, Integer, Table, func, inspect, select, text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.config import settings
+from app.models.base import ModelBase
+from app.models.events import EVENT_TAGS, TAG_MAX_LENGTH, Event
+from app.models.users import User  # noqa: F401 (metadata에 등록)
+
+from .db import ENGINE
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION_TABLE = Table(
+    "schema_version",
+    ModelBase.metadata,
+    Column("version", Integer, primary_key=True),
+    Column("applied_at", TIMESTAMP, server_default=func.now()),
+    schema="testdb",
+)
+
+
+def _create_tables(conn: Connection) -> None:
+    ModelBase.metadata.create_all(conn, checkfirst=True)
+
+
+def _create_missing_indexes(table: Table) -> Callable[[Connection], None]:
+    """기존 테이블에 없는 index 생성 (create_all은 이미 있는 테이블의 index를 추가하지 않음)"""
+
+    def migration(conn: Connection) -> None:
+        existing = {idx["name"] for idx in inspect(conn).get_indexes(table.name, table.schema)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(conn)
+
+    return migration
+
+
+def _backfill_event_tags(conn: Connection) -> None:
+    """기존 events.tags로 event_tags 채움 (이미 있는 행, 길이 제한을 넘는 tag는 제외)"""
+
+    conn.execute(
+        text(
+            "INSERT IGNORE INTO testdb.event_tags (event_id, tag, user_id) "
+            "SELECT e.id, jt.tag, e.user_id FROM testdb.events e, "
+            "JSON_TABLE(e.tags, '$[*]' COLUMNS (tag VARCHAR(255) PATH '$')) jt "
+            "WHERE jt.tag IS NOT NULL AND CHAR_LENGTH(jt.tag) BETWEEN 1 AND :max_length"
+        ),
+        {"max_length": TAG_MAX_LENGTH},
+    )
+
+
+def _create_event_tags(conn: Connection) -> None:
+    EVENT_TAGS.create(conn, checkfirst=True)
+    _backfill_event_tags(conn)
+
+
+def _event_tags_binary_collation(conn: Connection) -> None:
+    """tag를 utf8mb4_bin으로 변경 후, 기본 collation에서 중복으로 빠졌던 tag를 다시 채움"""
+
+    conn.execute(
+        text(
+            "ALTER TABLE testdb.event_tags MODIFY tag "
+            f"VARCHAR({TAG_MAX_LENGTH}) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL"
+        )
+    )
+    _backfill_event_tags(conn)
+
+
+MIGRATIONS: list[tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "create tables", _create_tables),
+    (2, "events (user_id, id) index", _create_missing_indexes(Event.__table__)),  # type:ignore
+    (3, "event_tags table", _create_event_tags),
+    (4, "events fulltext index", _create_missing_indexes(Event.__table__)),  # type:ignore
+    (5, "event_tags.tag binary collation", _event_tags_binary_collation),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+class SchemaManager:
+    """DB schema version 관리
+
+    부팅마다 create_all(테이블 reflection) 대신 schema_version 테이블의 최대 version만 조회.
+    코드의 SCHEMA_VERSION보다 낮으면 MIGRATIONS를 순서대로 적용 (여러 worker가 동시에 떠도
+    MySQL named lock으로 한 번만 실행). 각 migration은 이미 적용된 상태에서도 안전해야 함
+    (init.sql이나 예전 create_all로 만든 DB도 처음엔 version 0).
+
+    수동 실행: python -m app.handlers.schema
+    """
+
+    LOCK_NAME = "testdb.schema_migration"
+    LOCK_TIMEOUT_SECONDS = 60
+
+    @staticmethod
+    async def current_version(conn: AsyncConnection) -> int:
+        stmt = select(func.max(SCHEMA_VERSION_TABLE.c.version))
+        try:
+            version = (await conn.execute(stmt)).scalar()
+        except ProgrammingError:
+            # * schema_version 테이블이 아직 없음
+            await conn.rollback()
+            return 0
+        await conn.commit()
+        return version or 0
+
+    @classmethod
+    async def migrate(cls, conn: AsyncConnection) -> int:
+        acquired = await conn.scalar(
+            text("SELECT GET_LOCK(:name, :timeout)"),
+            {"name": cls.LOCK_NAME, "timeout": cls.LOCK_TIMEOUT_SECONDS},
+        )
+        if acquired != 1:
+            raise RuntimeError("could not acquire schema migration lock")
+        try:
+            # * lock을 기다리는 동안 다른 worker가 이미 적용했을 수 있음
+            version = await cls.current_version(conn)
+            for target, description, migration in MIGRATIONS:
+                if target <= version:
+                    continue
+                logger.info("applying schema migration %d: %s", target, description)
+                await conn.run_sync(migration)
+                await conn.execute(SCHEMA_VERSION_TABLE.insert().values(version=target))
+                await conn.commit()
+                version = target
+            return version
+        finally:
+            await conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": cls.LOCK_NAME})
+            await conn.commit()
+
+    @classmethod
+    async def check(cls) -> None:
+        """부팅 시 호출. 최신이면 쿼리 1번으로 끝남
+
+        Raises:
+            RuntimeError: DB가 코드보다 최신이거나, 자동 migration이 꺼져 있는데 DB가 뒤처진 경우
+        """
+
+        async with ENGINE.connect() as conn:
+            version = await cls.current_version(conn)
+            if version == SCHEMA_VERSION:
+                return
+            if version > SCHEMA_VERSION:
+                raise RuntimeError(f"db schema {version} is newer than app ({SCHEMA_VERSION})")
+            if not settings.SCHEMA_AUTO_MIGRATE:
+                raise RuntimeError(f"db schema {version} is behind app ({SCHEMA_VERSION})")
+            await cls.migrate(conn)
+
+
+if __name__ == "__main__":
+
+    async def main() -> None:
+        async with ENGINE.connect() as conn:
+            print(f"schema version: {await SchemaManager.migrate(conn)}")
+        await ENGINE.dispose()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
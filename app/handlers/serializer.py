@@ -0,0 +1,42 @@
+from operator import attrgetter
+from typing import Any, Iterable, Mapping
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+
+class RowSerializer:
+    """ORM 객체/행을 pydantic 검증 없이 바로 JSON bytes로 변환 (orjson)
+
+    schema의 필드만 꺼내므로 응답 모양은 schema와 같음.
+    route에서는 response_model을 그대로 두고(OpenAPI 문서용) 이 serializer의 Response를 반환.
+    """
+
+    def __init__(self, schema: type[BaseModel]) -> None:
+        self.fields = tuple(schema.model_fields)
+        self._getter = attrgetter(*self.fields)
+
+    def to_dict(self, obj: Any) -> dict[str, Any]:
+        return dict(zip(self.fields, self._getter(obj)))
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(self.to_dict(obj))
+
+    def dumps_many(self, objs: Iterable[Any]) -> bytes:
+        return orjson.dumps([self.to_dict(obj) for obj in objs])
+
+    @staticmethod
+    def dumps_lines(rows: Iterable[Mapping[str, Any]]) -> bytes:
+        """NDJSON (행마다 한 줄)"""
+
+        return b"".join(orjson.dumps(row) + b"\n" for row in rows)
+
+    def response(
+        self, content: Any, status_code: int = 200, headers: Mapping[str, str] | None = None
+    ) -> Response:
+        if isinstance(content, (list, tuple)):
+            body = self.dumps_many(content)
+        else:
+            body = self.dumps(content)
+        return Response(body, status_code, headers, media_type="application/json")
@@ -0,0 +1,146 @@
+import logging
+from collections import Counter, defaultdict
+from typing import Iterable
+
+from aioredis import Redis, RedisError
+
+from app.config import settings
+from app.models.events import EventChange, EventCounts
+
+from .etag import BUMP_VERSION_LUA, ETagHandler
+from .redis import RedisUnavailableError, get_redis_pool, retry_on_redis_error
+
+logger = logging.getLogger(__name__)
+
+# * event version 증가와 통계 증감을 원자적으로 (재계산(REPLACE_IF_VERSION_SCRIPT)이 둘 사이에 끼면
+# * 이 쓰기가 포함된 snapshot이 저장된 뒤 증감이 한 번 더 더해짐)
+# * hash가 있을 때만 증감 (없으면 아직 집계 전이므로 조회 시 MySQL에서 다시 계산)
+# * KEYS: event version, stats hash / ARGV: now(ms), version TTL, field, delta, field, delta, ...
+INCREMENT_SCRIPT = f"""{BUMP_VERSION_LUA}
+if redis.call('EXISTS', KEYS[2]) == 0 then return 0 end
+for i = 3, #ARGV, 2 do
+    redis.call('HINCRBY', KEYS[2], ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+
+# * event version(ETagHandler)이 계산 시작 때 읽은 값 그대로일 때만 hash 교체
+# * (계산 중 commit된 쓰기의 apply는 hash가 없어 무시되므로, 그 쓰기가 빠진 값을 저장하면 안 됨)
+# * KEYS: stats hash, event version / ARGV: version, field, value, field, value, ...
+REPLACE_IF_VERSION_SCRIPT = """
+if redis.call('GET', KEYS[2]) ~= ARGV[1] then return 0 end
+redis.call('DEL', KEYS[1])
+for i = 2, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+
+
+class EventStats:
+    """유저별 event 통계 (redis hash: total, checked, tag:<tag>)
+
+    Event 쓰기 commit 후 증감분만 반영해서 조회는 event 수와 상관없이 O(1).
+    hash가 없으면(처음 조회, redis 유실) 조회하는 쪽에서 MySQL로 계산해 replace_if_version으로 채움.
+    redis 반영은 best effort라 실패하면 어긋날 수 있음 (python -m app.handlers.rebuild_stats로 재계산)
+    """
+
+    TAG_PREFIX = "tag:"
+
+    @staticmethod
+    def key(user_id: str) -> str:
+        return f"{settings.REDIS_EVENT_STATS_KEY}:{user_id}"
+
+    @classmethod
+    def fields(cls, counts: EventCounts) -> dict[str, int]:
+        """Event.stats 결과를 hash 형식으로"""
+
+        total, checked, tags = counts
+        return {
+            "total": total,
+            "checked": checked,
+            **{f"{cls.TAG_PREFIX}{tag}": count for tag, count in tags.items()},
+        }
+
+    @staticmethod
+    @retry_on_redis_error(max_retries=1, error=RedisUnavailableError)
+    async def _increment(keys: list[str], args: list[str | int]) -> None:
+        # * 증감은 멱등이 아니므로 재시도 없이 breaker, deadline만 적용
+        script = Redis(connection_pool=get_redis_pool()).register_script(INCREMENT_SCRIPT)
+        await script(keys=keys, args=args)
+
+    @staticmethod
+    @retry_on_redis_error(error=RedisUnavailableError)
+    async def _hgetall(key: str) -> dict[bytes, bytes]:
+        return await Redis(connection_pool=get_redis_pool()).hgetall(key)
+
+    @staticmethod
+    @retry_on_redis_error(error=RedisUnavailableError)
+    async def _delete(*keys: str) -> None:
+        await Redis(connection_pool=get_redis_pool()).delete(*keys)
+
+    @classmethod
+    async def apply(cls, user_ids: Iterable[str], changes: Iterable[EventChange]) -> None:
+        """유저별 event version(ETagHandler) 증가, 변경 목록을 유저별 증감분으로 합쳐서 반영
+
+        증감이 없는(합이 0인) field는 생략, 증감이 없는 유저도 version은 증가
+        """
+
+        deltas: defaultdict[str, Counter[str]] = defaultdict(
+            Counter, {user_id: Counter() for user_id in user_ids}
+        )
+        for user_id, is_checked, tags, sign in changes:
+            delta = deltas[user_id]
+            delta["total"] += sign
+            delta["checked"] += sign if is_checked else 0
+            for tag in dict.fromkeys(tags or ()):
+                delta[f"{cls.TAG_PREFIX}{tag}"] += sign
+
+        failed = []
+        for user_id, delta in deltas.items():
+            args = [item for field, n in delta.items() if n for item in (field, n)]
+            keys = [ETagHandler.key(user_id), cls.key(user_id)]
+            try:
+                await cls._increment(keys, [*ETagHandler.bump_args(), *args])
+            except RedisError:
+                logger.warning("failed to update event stats: user_id=%s", user_id)
+                failed.append(user_id)
+        if failed:
+            # * 이전 version이 남으면 이전 응답이 계속 304로 재사용됨. 통계는 다음 조회 때 다시 계산
+            await ETagHandler.invalidate(Redis(connection_pool=get_redis_pool()), *failed)
+            await cls.clear(*failed)
+
+    @classmethod
+    async def get(cls, user_id: str) -> dict[str, int] | None:
+        """집계된 적 없으면 None (redis 장애도 None)"""
+
+        try:
+            raw = await cls._hgetall(cls.key(user_id))
+        except RedisError:
+            return None
+        if not raw:
+            return None
+        return {field.decode(): int(value) for field, value in raw.items()}
+
+    @classmethod
+    @retry_on_redis_error(error=RedisUnavailableError)
+    async def replace_if_version(
+        cls, user_id: str, fields: dict[str, int], version_key: str, version: int
+    ) -> bool:
+        """version_key 값이 version 그대로면 hash 교체 후 True, 그 사이 바뀌었으면 False
+
+        같은 값으로 다시 교체해도 결과가 같으므로 재시도. 최종 실패는 RedisUnavailableError
+        """
+
+        args = [version, *(item for field, n in fields.items() for item in (field, n))]
+        script = Redis(connection_pool=get_redis_pool()).register_script(REPLACE_IF_VERSION_SCRIPT)
+        return bool(await script(keys=[cls.key(user_id), version_key], args=args))
+
+    @classmethod
+    async def clear(cls, *user_ids: str) -> None:
+        if not user_ids:
+            return
+        try:
+            await cls._delete(*map(cls.key, user_ids))
+        except RedisError:
+            logger.warning("failed to clear event stats: user_ids=%s", user_ids)
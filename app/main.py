@@ -1,19 +1,45 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
 
+from .apis.admin import admin_router
+from .apis.chats import chat_router
 from .apis.events import event_router
+from .apis.metrics import metrics_router
 from .apis.users import users_router
-from .handlers.db import create_all_tables
+from .config import settings
+from .handlers.auth import PasswordHandler
+from .handlers.chat import CHAT_HUB
+from .handlers.db import dispose_engines, warm_up_engines
+from .handlers.diagnostics import LoopLagMonitor
+from .handlers.model_hooks import install_model_hooks
+from .handlers.redis import close_redis_pool, warm_up_redis_pool
+from .handlers.revocation import RevocationRegistry
+from .handlers.schema import SchemaManager
+from .middlewares import MetricsMiddleware, QueryProfilerMiddleware, ReadYourWritesMiddleware
 
 
 def init_app() -> FastAPI:
+    install_model_hooks()
+
     @asynccontextmanager
     async def lifspan(app: FastAPI):
-        await create_all_tables()
+        await SchemaManager.check()
+        # * 준비가 끝난 뒤에 요청을 받도록 (uvicorn은 lifespan 시작이 끝나야 요청 처리)
+        await asyncio.gather(warm_up_engines(), warm_up_redis_pool())
+        RevocationRegistry.start()
+        CHAT_HUB.start()
+        LoopLagMonitor.start()
         yield
+        await LoopLagMonitor.stop()
+        await CHAT_HUB.stop()
+        await RevocationRegistry.stop()
+        await close_redis_pool()
+        PasswordHandler.EXECUTOR.shutdown()
+        await dispose_engines()
 
     app = FastAPI(
         title="FastAPI test Backend",
@@ -28,11 +54,32 @@ def init_app() -> FastAPI:
                 allow_credentials=True,
                 allow_methods=["*"],
                 allow_headers=["*"],
+                expose_headers=[
+                    "ETag",
+                    "X-Next-Cursor",
+                    "X-DB-Query-Count",
+                    "X-DB-Query-Time-Ms",
+                    "Preference-Applied",
+                ],
             )
         ],
     )
+    if settings.MYSQL_REPLICA_URLS:
+        app.add_middleware(ReadYourWritesMiddleware)
+    app.add_middleware(QueryProfilerMiddleware)
     app.include_router(event_router)
     app.include_router(users_router)
+    app.include_router(chat_router)
+    app.include_router(admin_router)
+
+    @app.get("/health", include_in_schema=False)
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    if settings.METRICS_ENABLED:
+        # * 가장 바깥(마지막에 추가)에서 측정해야 다른 middleware 시간까지 포함됨
+        app.add_middleware(MetricsMiddleware)
+        app.include_router(metrics_router)
     return app
 
 
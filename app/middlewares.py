@@ -0,0 +1,111 @@
+from time import perf_counter, time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import settings
+from .handlers.db import ReplicaRouter
+from .handlers.metrics import DB_REQUEST_HOLD_SECONDS, HTTP_REQUEST_SECONDS, HTTP_REQUESTS
+from .handlers.profiling import QUERY_STATS, QueryProfiler, QueryStats
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """route별 latency histogram, status별 응답 수 기록
+
+    label은 실제 경로가 아니라 route 경로 template(/events/{id})을 사용 (label 개수 고정).
+    route는 router가 scope["route"]에 넣어 둔 값을 응답이 끝난 뒤 읽음.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = route.path if route is not None else UNMATCHED_ROUTE
+            method = scope["method"]
+            HTTP_REQUEST_SECONDS.observe(perf_counter() - start, method, path)
+            HTTP_REQUESTS.inc(method, path, str(status))
+
+
+class ReadYourWritesMiddleware:
+    """성공한 쓰기 요청 응답에 쿠키를 붙여, 이후 REPLICA_STICKY_SECONDS 동안 읽기를 primary로 보냄
+
+    replica 복제 지연 때문에 방금 쓴 데이터가 안 보이는 문제 방지 (worker가 달라도 동작)
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and 200 <= message["status"] < 400:
+                sticky_seconds = settings.REPLICA_STICKY_SECONDS
+                MutableHeaders(scope=message).append(
+                    "Set-Cookie",
+                    f"{ReplicaRouter.STICKY_COOKIE_KEY}={int(time()) + sticky_seconds}; "
+                    f"Max-Age={sticky_seconds}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class QueryProfilerMiddleware:
+    """요청별 SQL 실행 횟수/시간, DB connection 점유 시간 집계
+
+    - DB를 사용한 요청은 connection 점유 시간 합계를 db_request_connection_hold_seconds에 기록
+    - 같은 쿼리가 N_PLUS_ONE_THRESHOLD번 이상 실행되면 경고 로그 (N+1 의심)
+    - DEBUG면 응답 헤더에 X-DB-Query-Count, X-DB-Query-Time-Ms 추가
+      (응답 시작 전까지의 쿼리만 포함. streaming 응답 중 실행된 쿼리는 빠짐)
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(method=scope["method"], path=scope["path"])
+        token = QUERY_STATS.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and settings.DEBUG:
+                headers = MutableHeaders(scope=message)
+                headers.append("X-DB-Query-Count", str(stats.count))
+                headers.append("X-DB-Query-Time-Ms", f"{stats.seconds * 1000:.3f}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            QUERY_STATS.reset(token)
+            route = scope.get("route")
+            QueryProfiler.warn_repeated(stats, route.path if route is not None else stats.path)
+            if stats.hold_seconds:
+                path = route.path if route is not None else UNMATCHED_ROUTE
+                DB_REQUEST_HOLD_SECONDS.observe(stats.hold_seconds, stats.method, path)
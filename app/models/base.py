@@ -1,25 +1,62 @@
-from datetime import date, datetime
-from typing import Any, Sequence, TypeVar
+import builtins
+from datetime import date, datetime, timezone
+from typing import Any, AsyncGenerator, ClassVar, Collection, Sequence, TypeVar
 
-from sqlalchemy import TIMESTAMP, Date, Integer, delete, desc, func, select
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy import (
+    TIMESTAMP,
+    Date,
+    Integer,
+    case,
+    delete,
+    desc,
+    func,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.exc import DataError, IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
-from app.exceptions import ConflictException, NotFoundException, ServiceUnavailableException
+from app.exceptions import (
+    ConflictException,
+    CustomException,
+    NotFoundException,
+    ServiceUnavailableException,
+    UnProcessableException,
+)
 
 ModelType = TypeVar("ModelType", bound="ModelBase")
 
 
+def client_now() -> datetime:
+    """client-side 기본값용 현재 UTC 시각 (TIMESTAMP 정밀도에 맞춰 초 단위, tzinfo 없음)
+
+    app 서버 시간대와 무관. DB 연결은 time_zone을 UTC로 고정 (create_engine의 init_command)
+    """
+
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
 class ModelBase(DeclarativeBase):
     """Base Model"""
 
     type_annotation_map = {int: Integer, datetime: TIMESTAMP, date: Date}
 
+    # * True면 create/update 후 refresh(SELECT)로 DB 값을 다시 읽음.
+    # * 기본값이 모두 client-side인 모델은 False로 두면 쓰기 1문장으로 끝남
+    REFRESH_AFTER_WRITE: ClassVar[bool] = True
+
     id: Any
-    created_at: Mapped[datetime] = mapped_column(server_default=func.now(), doc="Time of Creation.")
+    # * ORM 쓰기는 client-side 값 사용 (refresh 없이 instance에 값이 채워짐), server_default는 raw SQL용
+    created_at: Mapped[datetime] = mapped_column(
+        default=client_now, server_default=func.now(), doc="Time of Creation."
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        server_default=func.now(), onupdate=func.now(), doc="Time of last Modification."
+        default=client_now,
+        server_default=func.now(),
+        onupdate=client_now,
+        doc="Time of last Modification.",
     )
 
     @classmethod
@@ -54,14 +91,107 @@ class ModelBase(DeclarativeBase):
         conditions: Sequence[Any] | None = None,
         offset: int = 0,
         limit: int = 20,
+        last_id: Any | None = None,
     ) -> Sequence[ModelType]:
+        """id 내림차순 목록 반환
+
+        Args:
+            cls (type[_MBT]): BaseModel 상속받은 모델
+            db (AsyncSession): db session
+            conditions (Sequence[Any]): where절에 들어갈 조건
+            offset (int): OFFSET (last_id 없을 때만 사용)
+            limit (int): LIMIT
+            last_id (Any | None): 이전 페이지 마지막 id. 주어지면 OFFSET 대신 `id < last_id` (keyset)
+
+        Returns:
+            Sequence[_MBT]: 레코드 목록
+        """
+
         if conditions is None:
             conditions = []
 
-        stmt = select(cls).where(*conditions).offset(offset).limit(limit).order_by(desc(cls.id))
+        stmt = select(cls).where(*conditions)
+        if last_id is not None:
+            stmt = stmt.where(cls.id < last_id)
+        else:
+            stmt = stmt.offset(offset)
+        stmt = stmt.order_by(desc(cls.id)).limit(limit)
         result = await db.execute(stmt)
         return result.scalars().all()
 
+    # * class 본문 안의 list는 위의 list classmethod이므로 반환 타입에는 builtins.list 사용
+    @classmethod
+    async def stream(
+        cls: type[ModelType],
+        db: AsyncSession,
+        columns: Sequence[Any],
+        conditions: Sequence[Any] | None = None,
+        yield_per: int = 1000,
+    ) -> AsyncGenerator[builtins.list[dict[str, Any]], None]:
+        """server-side cursor로 조회하며 yield_per 행씩 dict 목록으로 반환 (id 오름차순)
+
+        ORM 객체를 만들지 않아 행 수와 상관없이 메모리 사용량이 일정함.
+        끝까지 읽기 전에 중단되면(클라이언트 연결 끊김 등) 남은 행을 읽어 버리는 대신 연결을 폐기함.
+
+        Args:
+            cls (type[_MBT]): BaseModel 상속받은 모델
+            db (AsyncSession): db session
+            columns (Sequence[Any]): select 할 컬럼
+            conditions (Sequence[Any]): where절에 들어갈 조건
+            yield_per (int): 한 번에 가져올 행 수
+        """
+
+        if conditions is None:
+            conditions = []
+
+        stmt = (
+            select(*columns)
+            .where(*conditions)
+            .order_by(cls.id)
+            .execution_options(yield_per=yield_per)
+        )
+        result = await db.stream(stmt)
+        completed = False
+        try:
+            async for partition in result.mappings().partitions():
+                yield [dict(row) for row in partition]
+            completed = True
+        finally:
+            if not completed:
+                await (await db.connection()).invalidate()
+
+    @classmethod
+    async def _sync_related(
+        cls: type[ModelType],
+        db: AsyncSession,
+        records: Sequence[ModelType],
+        columns: Collection[str] | None = None,
+    ) -> None:
+        """쓰기 트랜잭션 commit 직전 호출. 파생 테이블(index 등)을 같은 트랜잭션에서 맞추는 용도
+
+        Args:
+            cls (type[_MBT]): BaseModel 상속받은 모델
+            db (AsyncSession): db session
+            records (Sequence[_MBT]): 생성/수정된 레코드 (id 할당된 상태)
+            columns (Collection[str] | None): 수정된 컬럼명 (생성이면 None)
+        """
+
+        return
+
+    @classmethod
+    async def _delete_related(
+        cls: type[ModelType], db: AsyncSession, records: Sequence[ModelType]
+    ) -> None:
+        """bulk_delete에서 DELETE 직전(같은 트랜잭션) 호출. 파생 테이블 정리용
+
+        Args:
+            cls (type[_MBT]): BaseModel 상속받은 모델
+            db (AsyncSession): db session
+            records (Sequence[_MBT]): 삭제될 레코드
+        """
+
+        return
+
     @classmethod
     async def delete(cls: type[ModelType], db: AsyncSession, conditions: Sequence[Any]) -> None:
         """조건에 맞는 레코드 삭제
@@ -97,8 +227,11 @@ class ModelBase(DeclarativeBase):
             setattr(instance, k, v)
 
         try:
+            await db.flush()
+            await cls._sync_related(db, [instance], kwargs.keys())
             await db.commit()
-            await db.refresh(instance)
+            if cls.REFRESH_AFTER_WRITE:
+                await db.refresh(instance)
         except SQLAlchemyError as e:
             await db.rollback()
             if isinstance(e, IntegrityError):
@@ -106,6 +239,42 @@ class ModelBase(DeclarativeBase):
             raise ServiceUnavailableException
         return instance
 
+    @classmethod
+    async def update_where(
+        cls: type[ModelType], db: AsyncSession, conditions: Sequence[Any], **kwargs: Any
+    ) -> int:
+        """조건부 UPDATE 1회 (조회 없음). 맞는 행이 없으면 NotFoundException
+
+        instance를 읽지 않으므로 _sync_related(파생 테이블)가 필요한 컬럼 수정에는 사용하지 않음.
+
+        Args:
+            cls (type[_MBT]): BaseModel 상속받은 모델
+            db (AsyncSession): db session
+            conditions (Sequence[Any]): where절에 들어갈 조건 (ex. id, 소유자)
+
+        Returns:
+            int: 조건에 맞은 행 수
+        """
+
+        stmt = (
+            update(cls)
+            .where(*conditions)
+            .values(kwargs)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            result = await db.execute(stmt)
+            await db.commit()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            if isinstance(e, IntegrityError):
+                raise ConflictException
+            raise ServiceUnavailableException
+        # * MySQL dialect는 CLIENT.FOUND_ROWS로 연결하므로 값이 같아도 조건에 맞으면 집계됨
+        if result.rowcount == 0:
+            raise NotFoundException
+        return result.rowcount
+
     @classmethod
     async def create(cls: type[ModelType], db: AsyncSession, instance: ModelType) -> ModelType:
         """
@@ -120,11 +289,170 @@ class ModelBase(DeclarativeBase):
 
         db.add(instance)
         try:
+            await db.flush()
+            await cls._sync_related(db, [instance])
             await db.commit()
-            await db.refresh(instance)
+            if cls.REFRESH_AFTER_WRITE:
+                await db.refresh(instance)
         except SQLAlchemyError as e:
             await db.rollback()
             if isinstance(e, IntegrityError):
                 raise ConflictException
             raise ServiceUnavailableException
         return instance
+
+    @classmethod
+    async def bulk_create(
+        cls: type[ModelType],
+        db: AsyncSession,
+        rows: Sequence[dict[str, Any]],
+        conditions: Sequence[Any] | None = None,
+    ) -> Sequence[ModelType | CustomException]:
+        """행마다 INSERT 후 생성된 레코드 반환 (하나의 트랜잭션)
+
+        MySQL 8 기본값(innodb_autoinc_lock_mode=2)에서는 동시에 실행된 INSERT와 id가 섞일 수 있어
+        multi-row INSERT 후 id 범위로 다시 조회하면 다른 행이 포함될 수 있음.
+        행마다 INSERT하면 각 행의 id는 그 INSERT의 lastrowid로 정확히 할당됨.
+
+        행마다 SAVEPOINT를 두고 INSERT, _sync_related를 실행. 그 행의 값 때문에 실패하면
+        (IntegrityError -> ConflictException, DataError -> UnProcessableException) 그 행만 되돌리고
+        나머지는 생성. 연결 장애 등 다른 DB 오류는 전체를 rollback 하고 ServiceUnavailableException
+
+        Args:
+            cls (type[_MBT]): BaseModel 상속받은 모델
+            db (AsyncSession): db session
+            rows (Sequence[dict[str, Any]]): 컬럼명을 key로 갖는 행 목록
+            conditions (Sequence[Any]): REFRESH_AFTER_WRITE 모델이 생성된 행을 다시 조회할 때
+                함께 거는 where절 조건 (ex. 소유자)
+
+        Returns:
+            Sequence[_MBT | CustomException]: rows 순서대로 생성된 레코드 또는 그 행의 오류
+        """
+
+        if not rows:
+            return []
+        if conditions is None:
+            conditions = []
+
+        results: list[ModelType | CustomException] = []
+        try:
+            for row in rows:
+                record = cls(**row)
+                try:
+                    async with db.begin_nested():
+                        db.add(record)
+                        await db.flush()
+                        await cls._sync_related(db, [record])
+                except IntegrityError:
+                    results.append(ConflictException())
+                    continue
+                except DataError:
+                    results.append(UnProcessableException())
+                    continue
+                results.append(record)
+
+            records = [result for result in results if isinstance(result, cls)]
+            if cls.REFRESH_AFTER_WRITE and records:
+                stmt = (
+                    select(cls)
+                    .where(cls.id.in_([record.id for record in records]), *conditions)
+                    .execution_options(populate_existing=True)
+                )
+                await db.execute(stmt)
+            await db.commit()
+        except SQLAlchemyError:
+            await db.rollback()
+            raise ServiceUnavailableException
+        return results
+
+    @classmethod
+    async def bulk_update(
+        cls: type[ModelType],
+        db: AsyncSession,
+        conditions: Sequence[Any],
+        values_by_id: dict[Any, dict[str, Any]],
+    ) -> Sequence[ModelType]:
+        """id별로 다른 값을 CASE 식으로 묶어 UPDATE 1회 실행 (하나의 트랜잭션)
+
+        Args:
+            cls (type[_MBT]): BaseModel 상속받은 모델
+            db (AsyncSession): db session
+            conditions (Sequence[Any]): 대상 행을 제한할 where절 조건 (ex. 소유자)
+            values_by_id (dict[Any, dict[str, Any]]): {id: {컬럼명: 값}}
+
+        Returns:
+            Sequence[_MBT]: 갱신된 레코드. 조건에 맞지 않는 id는 포함되지 않음
+        """
+
+        if not values_by_id:
+            return []
+
+        table = cls.__table__
+        try:
+            stmt = (
+                select(cls.id)
+                .where(cls.id.in_(list(values_by_id)), *conditions)
+                .with_for_update()
+            )
+            ids = (await db.execute(stmt)).scalars().all()
+
+            columns = {column for i in ids for column in values_by_id[i]}
+            if columns:
+                values = {
+                    column: case(
+                        {
+                            i: literal(values_by_id[i][column], table.c[column].type)
+                            for i in ids
+                            if column in values_by_id[i]
+                        },
+                        value=table.c.id,
+                        else_=table.c[column],
+                    )
+                    for column in columns
+                }
+                stmt_update = (
+                    update(cls)
+                    .where(cls.id.in_(ids))
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                await db.execute(stmt_update)
+
+            stmt = select(cls).where(cls.id.in_(ids)).execution_options(populate_existing=True)
+            records = (await db.execute(stmt)).scalars().all()
+            await cls._sync_related(db, records, columns)
+            await db.commit()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            if isinstance(e, IntegrityError):
+                raise ConflictException
+            raise ServiceUnavailableException
+        return records
+
+    @classmethod
+    async def bulk_delete(
+        cls: type[ModelType], db: AsyncSession, conditions: Sequence[Any]
+    ) -> Sequence[ModelType]:
+        """조건에 맞는 레코드를 DELETE 1회로 삭제 (하나의 트랜잭션)
+
+        Args:
+            cls (type[_MBT]): BaseModel 상속받은 모델
+            db (AsyncSession): db session
+            conditions (Sequence[Any]): where절에 들어갈 조건
+
+        Returns:
+            Sequence[_MBT]: 삭제된 레코드 (삭제 직전 값)
+        """
+
+        try:
+            stmt = select(cls).where(*conditions).with_for_update()
+            records = (await db.execute(stmt)).scalars().all()
+            if records:
+                await cls._delete_related(db, records)
+                stmt_delete = delete(cls).where(cls.id.in_([record.id for record in records]))
+                await db.execute(stmt_delete.execution_options(synchronize_session=False))
+            await db.commit()
+        except SQLAlchemyError:
+            await db.rollback()
+            raise ServiceUnavailableException
+        return records
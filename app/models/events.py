@@ -1,14 +1,69 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, ClassVar, Collection, Sequence
 
-from sqlalchemy import JSON, Boolean, ForeignKeyConstraint, PrimaryKeyConstraint, String
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    ColumnElement,
+    ForeignKeyConstraint,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    Table,
+    and_,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.mysql import VARCHAR, match
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.exceptions import CustomException
+
 from .base import ModelBase
 
 if TYPE_CHECKING:
     from .users import User
 
 
+TAG_MAX_LENGTH = 50
+# * EventStats에 반영되는 컬럼 (수정 시 이전 값 필요)
+STATS_COLUMNS = frozenset({"is_checked", "tags"})
+
+# * (user_id, is_checked, tags, +1 추가 / -1 제거)
+EventChange = tuple[str, bool, Sequence[str] | None, int]
+# * 유저별 (total, checked, {tag: 수})
+EventCounts = tuple[int, int, dict[str, int]]
+# * 쓰기 commit 후 호출 (쓰기가 있었던 user_id 목록, 통계 증감 목록)
+EventWriteHook = Callable[[Sequence[str], Sequence[EventChange]], Awaitable[None]]
+
+# * events.tags(JSON)를 tag 1개당 1행으로 펼친 index 테이블 (tag 필터 조회용)
+# * Event 쓰기/삭제(_sync_related, _delete_related), User 삭제 시 같은 트랜잭션에서 갱신
+# * (FK 없음: init.sql의 events.id는 BIGINT UNSIGNED, create_all은 INT라 타입을 맞출 수 없음)
+EVENT_TAGS = Table(
+    "event_tags",
+    ModelBase.metadata,
+    Column("event_id", Integer, nullable=False),
+    # * 대소문자, 악센트가 다른 tag는 다른 tag (기본 collation은 "Work"/"work"를 같은 PK로 취급)
+    Column(
+        "tag",
+        String(TAG_MAX_LENGTH).with_variant(
+            VARCHAR(TAG_MAX_LENGTH, collation="utf8mb4_bin"), "mysql"
+        ),
+        nullable=False,
+    ),
+    Column("user_id", String(36), nullable=False),
+    PrimaryKeyConstraint("event_id", "tag", name="event_tags_pkey"),
+    # * WHERE user_id = ? AND tag IN (...) ORDER BY event_id DESC
+    Index("event_tags_user_id_tag_event_id_idx", "user_id", "tag", "event_id"),
+    schema="testdb",
+)
+
+
 class Event(ModelBase):
     __tablename__ = "events"
     __table_args__ = (
@@ -16,6 +71,17 @@ class Event(ModelBase):
         ForeignKeyConstraint(
             ["user_id"], ["testdb.users.id"], ondelete="CASCADE", name="users_id_fkey"
         ),
+        # * 유저별 목록 keyset pagination (WHERE user_id = ? AND id < ? ORDER BY id DESC)
+        Index("events_user_id_id_idx", "user_id", "id"),
+        # * 검색 (MATCH ... AGAINST). 한글은 공백 단위 token으로 찾기 어려워 ngram parser 사용
+        Index(
+            "events_fulltext_idx",
+            "title",
+            "description",
+            "location",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
         {"schema": "testdb"},
     )
 
@@ -25,7 +91,200 @@ class Event(ModelBase):
     tags: Mapped[list[str]] = mapped_column(JSON(), nullable=True, doc="event tags")
     image: Mapped[str] = mapped_column(String(255), nullable=True, doc="evevnt thumbnail image")
     location: Mapped[str] = mapped_column(String(50), nullable=True, doc="event location")
-    is_checked: Mapped[bool] = mapped_column(Boolean(), default=0)
+    is_checked: Mapped[bool] = mapped_column(Boolean(), default=False)
     user_id: Mapped[str] = mapped_column(String(36))
 
     user: Mapped["User"] = relationship("User", back_populates="events")
+
+    # * 기본값(created_at, updated_at, is_checked)이 모두 client-side -> 쓰기 후 refresh 생략
+    REFRESH_AFTER_WRITE = False
+    # * ETag, 통계 반영은 handler 계층에서 등록 (app.handlers.model_hooks)
+    AFTER_WRITE: ClassVar[list[EventWriteHook]] = []
+
+    @classmethod
+    def tag_condition(
+        cls, user_id: str, tags: Collection[str], match_all: bool = False
+    ) -> ColumnElement[bool]:
+        """tags 중 하나라도(match_all이면 모두) 가진 event 조건 (event_tags index 사용)"""
+
+        tags = list(dict.fromkeys(tags))
+        stmt = select(EVENT_TAGS.c.event_id).where(
+            EVENT_TAGS.c.user_id == user_id, EVENT_TAGS.c.tag.in_(tags)
+        )
+        if match_all and len(tags) > 1:
+            stmt = stmt.group_by(EVENT_TAGS.c.event_id).having(func.count() == len(tags))
+        return cls.id.in_(stmt)
+
+    @classmethod
+    async def search(
+        cls,
+        db: AsyncSession,
+        conditions: Sequence[Any],
+        query: str,
+        limit: int = 20,
+        after: tuple[float, int] | None = None,
+    ) -> list[tuple["Event", float]]:
+        """title, description, location 전문 검색. 관련도(score) 내림차순, 같으면 id 내림차순
+
+        Args:
+            db (AsyncSession): db session
+            conditions (Sequence[Any]): where절에 들어갈 조건 (ex. 소유자)
+            query (str): 검색어 (natural language mode)
+            limit (int): LIMIT
+            after (tuple[float, int] | None): 이전 페이지 마지막 (score, id). 주어지면 그 다음부터
+
+        Returns:
+            list[tuple[Event, float]]: (레코드, score) 목록
+        """
+
+        relevance = match(cls.title, cls.description, cls.location, against=query)
+        stmt = select(cls, relevance.label("score")).where(*conditions, relevance > 0)
+        if after is not None:
+            score, last_id = after
+            stmt = stmt.where(or_(relevance < score, and_(relevance == score, cls.id < last_id)))
+        stmt = stmt.order_by(relevance.desc(), cls.id.desc()).limit(limit)
+        result = await db.execute(stmt)
+        return [(event, score) for event, score in result.all()]
+
+    @classmethod
+    async def _sync_related(
+        cls,
+        db: AsyncSession,
+        records: Sequence["Event"],
+        columns: Collection[str] | None = None,
+    ) -> None:
+        """event_tags를 현재 tags와 맞춤 (tags가 바뀌지 않은 수정이면 생략)"""
+
+        if columns is not None and "tags" not in columns:
+            return
+        if columns is not None:
+            ids = [event.id for event in records]
+            await db.execute(delete(EVENT_TAGS).where(EVENT_TAGS.c.event_id.in_(ids)))
+        rows = [
+            {"event_id": event.id, "tag": tag, "user_id": event.user_id}
+            for event in records
+            for tag in dict.fromkeys(event.tags or ())
+        ]
+        if rows:
+            await db.execute(insert(EVENT_TAGS), rows)
+
+    @classmethod
+    async def _delete_related(cls, db: AsyncSession, records: Sequence["Event"]) -> None:
+        ids = [event.id for event in records]
+        await db.execute(delete(EVENT_TAGS).where(EVENT_TAGS.c.event_id.in_(ids)))
+
+    @classmethod
+    async def stats(cls, db: AsyncSession, user_ids: Sequence[str]) -> dict[str, EventCounts]:
+        """유저별 (total, checked, {tag: 수})를 MySQL에서 계산. event가 없는 유저도 포함"""
+
+        stmt = (
+            select(cls.user_id, func.count(), func.coalesce(func.sum(cls.is_checked), 0))
+            .where(cls.user_id.in_(user_ids))
+            .group_by(cls.user_id)
+        )
+        counts = {user_id: (total, checked) for user_id, total, checked in await db.execute(stmt)}
+        tags: dict[str, dict[str, int]] = {user_id: {} for user_id in user_ids}
+        stmt = (
+            select(EVENT_TAGS.c.user_id, EVENT_TAGS.c.tag, func.count())
+            .where(EVENT_TAGS.c.user_id.in_(user_ids))
+            .group_by(EVENT_TAGS.c.user_id, EVENT_TAGS.c.tag)
+        )
+        for user_id, tag, count in await db.execute(stmt):
+            tags[user_id][tag] = count
+        stats = {}
+        for user_id in user_ids:
+            total, checked = counts.get(user_id, (0, 0))
+            stats[user_id] = (int(total), int(checked), tags[user_id])
+        return stats
+
+    @staticmethod
+    def _change(event: "Event", sign: int) -> EventChange:
+        return event.user_id, bool(event.is_checked), list(event.tags or ()), sign
+
+    @classmethod
+    async def _after_write(
+        cls, user_ids: Sequence[str], changes: Sequence[EventChange] = ()
+    ) -> None:
+        for hook in cls.AFTER_WRITE:
+            await hook(user_ids, changes)
+
+    # * 쓰기 commit 후 AFTER_WRITE hook 호출 (유저별 ETag 무효화, 통계 증감)
+
+    @classmethod
+    async def create(cls, db: AsyncSession, instance: "Event") -> "Event":
+        event = await super().create(db, instance)
+        await cls._after_write([event.user_id], [cls._change(event, 1)])
+        return event
+
+    @classmethod
+    async def update(cls, db: AsyncSession, instance: "Event", **kwargs: Any) -> "Event":
+        # * 통계에 쓰이는 값은 바뀌기 전 값이 필요
+        before = cls._change(instance, -1) if STATS_COLUMNS & kwargs.keys() else None
+        event = await super().update(db, instance, **kwargs)
+        changes = [before, cls._change(event, 1)] if before is not None else []
+        await cls._after_write([event.user_id], changes)
+        return event
+
+    @classmethod
+    async def update_owned(cls, db: AsyncSession, id: int, user_id: str, **kwargs: Any) -> None:
+        """조회 없이 UPDATE 1회로 수정. 없거나 다른 유저의 event면 NotFoundException
+
+        통계 컬럼(is_checked, tags)은 바뀌기 전 값이 필요하므로 update 사용.
+        """
+
+        if STATS_COLUMNS & kwargs.keys():
+            raise ValueError(f"use Event.update for {sorted(STATS_COLUMNS & kwargs.keys())}")
+        await cls.update_where(db, [cls.id == id, cls.user_id == user_id], **kwargs)
+        await cls._after_write([user_id])
+
+    @classmethod
+    async def delete(cls, db: AsyncSession, conditions: Sequence[Any]) -> None:
+        """삭제된 행의 user_id 등이 필요하므로 bulk_delete(SELECT ... FOR UPDATE + DELETE) 사용"""
+
+        await cls.bulk_delete(db, conditions)
+
+    @classmethod
+    async def bulk_create(
+        cls,
+        db: AsyncSession,
+        rows: Sequence[dict[str, Any]],
+        conditions: Sequence[Any] | None = None,
+    ) -> Sequence["Event | CustomException"]:
+        results = await super().bulk_create(db, rows, conditions)
+        events = [result for result in results if isinstance(result, Event)]
+        await cls._after_write(
+            [event.user_id for event in events], [cls._change(event, 1) for event in events]
+        )
+        return results
+
+    @classmethod
+    async def bulk_update(
+        cls,
+        db: AsyncSession,
+        conditions: Sequence[Any],
+        values_by_id: dict[Any, dict[str, Any]],
+    ) -> Sequence["Event"]:
+        """통계 컬럼(is_checked, tags)을 바꾸는 항목이 있으면 바뀌기 전 값을 먼저 조회
+
+        (조회와 UPDATE 사이 다른 요청이 같은 행을 바꾸면 통계가 어긋날 수 있음 -> rebuild로 보정)
+        """
+
+        ids = [i for i, values in values_by_id.items() if STATS_COLUMNS & values.keys()]
+        before: list[EventChange] = []
+        if ids:
+            stmt = select(cls.user_id, cls.is_checked, cls.tags).where(cls.id.in_(ids), *conditions)
+            before = [(u, bool(c), t, -1) for u, c, t in await db.execute(stmt)]
+
+        events = await super().bulk_update(db, conditions, values_by_id)
+        changed = set(ids)
+        after = [cls._change(event, 1) for event in events if event.id in changed]
+        await cls._after_write([event.user_id for event in events], [*before, *after])
+        return events
+
+    @classmethod
+    async def bulk_delete(cls, db: AsyncSession, conditions: Sequence[Any]) -> Sequence["Event"]:
+        events = await super().bulk_delete(db, conditions)
+        await cls._after_write(
+            [event.user_id for event in events], [cls._change(event, -1) for event in events]
+        )
+        return events
@@ -1,14 +1,19 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, ClassVar, Sequence
 from uuid import uuid4
 
-from sqlalchemy import Boolean, PrimaryKeyConstraint, String, UniqueConstraint
+from sqlalchemy import Boolean, PrimaryKeyConstraint, String, UniqueConstraint, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import ModelBase
+from .events import EVENT_TAGS
 
 if TYPE_CHECKING:
     from .events import Event
 
+# * 쓰기 commit 후 호출 (user_id 목록, 삭제 여부)
+UserWriteHook = Callable[[Sequence[str], bool], Awaitable[None]]
+
 
 class User(ModelBase):
     __tablename__ = "users"
@@ -25,3 +30,32 @@ class User(ModelBase):
     is_admin: Mapped[bool] = mapped_column(Boolean(), default=0, doc="is admin?")
 
     events: Mapped[list["Event"]] = relationship("Event", back_populates="user")
+
+    # * 인증 유저 cache, event 통계 정리는 handler 계층에서 등록 (app.handlers.model_hooks)
+    AFTER_WRITE: ClassVar[list[UserWriteHook]] = []
+
+    @classmethod
+    async def _after_write(cls, user_ids: Sequence[str], deleted: bool = False) -> None:
+        for hook in cls.AFTER_WRITE:
+            await hook(user_ids, deleted)
+
+    @classmethod
+    async def update(cls, db: AsyncSession, instance: "User", **kwargs: Any) -> "User":
+        """업데이트 후 AFTER_WRITE hook 호출 (인증 유저 cache 무효화: is_disabled 등 변경 즉시 반영)"""
+
+        user = await super().update(db, instance, **kwargs)
+        await cls._after_write([user.id])
+        return user
+
+    @classmethod
+    async def delete(cls, db: AsyncSession, conditions: Sequence[Any]) -> None:
+        """삭제 후 AFTER_WRITE hook 호출 (인증 유저 cache, event 통계 삭제)
+
+        event는 FK cascade로 지워지므로 event_tags는 같은 트랜잭션에서 직접 삭제
+        """
+
+        user_ids = (await db.execute(select(cls.id).where(*conditions))).scalars().all()
+        if user_ids:
+            await db.execute(delete(EVENT_TAGS).where(EVENT_TAGS.c.user_id.in_(user_ids)))
+        await super().delete(db, conditions)
+        await cls._after_write(user_ids, deleted=True)
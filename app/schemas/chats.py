@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+
+class ChatMessageSchema(BaseModel):
+    id: str = Field(..., description="redis stream id (<ms>-<seq>)")
+    type: str
+    room: str
+    text: str
+    ts: float
+
+
+class ChatHistorySchema(BaseModel):
+    items: list[ChatMessageSchema]
+    next_cursor: str | None = Field(default=None, description="다음 페이지 조회 시 before 값")
@@ -1,10 +1,17 @@
+from typing import Annotated, Any
+
 from pydantic import BaseModel, Field
 
+from app.config import settings
+from app.models.events import TAG_MAX_LENGTH
+
 
 class EventBassSchema(BaseModel):
     title: str = Field(..., max_length=30)
     description: str | None = Field(default=None, max_length=100)
-    tags: list[str] | None = Field(default=None)
+    tags: list[Annotated[str, Field(min_length=1, max_length=TAG_MAX_LENGTH)]] | None = Field(
+        default=None
+    )
     image: str | None = Field(default=None, max_length=255)
     location: str | None = Field(default=None, max_length=50)
 
@@ -21,3 +28,29 @@ class CreateEventSchema(EventBassSchema):
 class UpdateEventSchema(EventBassSchema):
     title: str = Field(default=None)
     is_checked: bool = Field(default=None)
+
+
+class BatchUpdateEventSchema(UpdateEventSchema):
+    id: int = Field(..., ge=1)
+
+
+class BatchDeleteEventSchema(BaseModel):
+    ids: list[int] = Field(..., min_length=1, max_length=settings.BATCH_MAX_SIZE)
+
+
+class BatchItemResultSchema(BaseModel):
+    index: int = Field(..., description="요청 목록에서의 위치")
+    status: int = Field(..., description="항목별 HTTP status code")
+    data: ReadEventSchema | None = None
+    error: Any = None
+
+
+class BatchResultSchema(BaseModel):
+    results: list[BatchItemResultSchema]
+
+
+class EventStatsSchema(BaseModel):
+    total: int
+    checked: int
+    unchecked: int
+    tags: dict[str, int] = Field(..., description="tag별 event 수")
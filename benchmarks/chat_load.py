@@ -0,0 +1,83 @@
+"""chat hub 부하 테스트: idle WebSocket 연결 N개를 유지한 채 broadcast latency 측정
+
+실행 중인 서버에 --connections 개를 연결해 두고, 별도 연결 하나가 --messages 번 전송.
+메시지마다 모든 수신자의 (수신 시각 - 전송 시각)과 마지막 수신자까지 걸린 시간(fan-out 완료)을 기록.
+여러 worker로 띄우면 redis pub/sub 경유 경로까지 측정됨.
+클라이언트/서버 모두 열린 파일 수 제한을 늘려야 함 (ulimit -n 65535).
+
+실행:
+    uvicorn app.main:app --workers 4 --loop uvloop
+    python -m benchmarks.chat_load --url ws://localhost:8000/chats/ws/lobby --connections 10000
+"""
+
+import argparse
+import asyncio
+import json
+from collections import defaultdict
+from time import time
+
+import websockets
+
+from .utils import Timings, dump_results, print_table
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="ws://localhost:8000/chats/ws/lobby")
+    parser.add_argument("--connections", type=int, default=10_000)
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--connect-concurrency", type=int, default=200)
+    parser.add_argument("--output", default=None, help="결과를 저장할 json 경로")
+    args = parser.parse_args()
+
+    delivery = Timings("delivery latency")
+    received: dict[int, list[float]] = defaultdict(list)
+    sent_at: dict[int, float] = {}
+
+    async def receive(ws) -> None:
+        async for raw in ws:
+            now = time()
+            body = json.loads(json.loads(raw)["text"])
+            delivery.add(now - body["sent_at"])
+            received[body["seq"]].append(now)
+
+    sem = asyncio.Semaphore(args.connect_concurrency)
+
+    async def connect():
+        async with sem:
+            return await websockets.connect(args.url, max_queue=None, ping_interval=None)
+
+    conns = await asyncio.gather(*(connect() for _ in range(args.connections)))
+    print(f"connected: {len(conns)}")
+    receivers = [asyncio.create_task(receive(ws)) for ws in conns]
+
+    async with websockets.connect(args.url) as sender:
+        await asyncio.sleep(args.interval)
+        for seq in range(args.messages):
+            sent_at[seq] = time()
+            await sender.send(json.dumps({"seq": seq, "sent_at": sent_at[seq]}))
+            await asyncio.sleep(args.interval)
+
+    fanout = Timings("fan-out complete")
+    for seq, start in sent_at.items():
+        if received[seq]:
+            fanout.add(max(received[seq]) - start)
+    delivered = sum(map(len, received.values()))
+
+    for task in receivers:
+        task.cancel()
+    await asyncio.gather(*(ws.close() for ws in conns), return_exceptions=True)
+
+    results = []
+    for timings in (delivery, fanout):
+        summary = timings.summary()
+        summary.pop("throughput_rps")
+        results.append(summary)
+    print_table(results)
+    print(f"delivered {delivered} / {args.connections * args.messages} (idle {args.connections})")
+    dump_results(args.output, {"results": results, "delivered": delivered})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
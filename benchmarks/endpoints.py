@@ -0,0 +1,247 @@
+"""주요 endpoint throughput, p50/p95/p99 측정 (MySQL, Redis 없이 in-process 실행)
+
+init_app()으로 만든 app을 ASGITransport로 직접 호출.
+- DB: SQLite(aiosqlite) 파일에 testdb 데이터베이스를 ATTACH 해서 모델(schema="testdb") 그대로 사용
+  (get_db_session, get_read_db_session을 dependency override)
+- Redis: fakeredis 연결 pool을 공유 pool(REDIS_POOL)로 사용 (Lua script 포함)
+
+가상 유저 --users 명이 동시에 signup -> signin -> refresh -> event 생성/목록/조회/수정/삭제 순으로
+단계별 요청을 보내고 endpoint별 latency, 요청당 SQL 수(DEBUG 응답 헤더) 기록. rate limit은 측정 중 걸리지 않도록 한도를 높여 둠.
+--baseline 으로 이전 결과 json을 넘기면 p50/p95 변화율을 같이 출력.
+추가 패키지 필요: pip install aiosqlite "fakeredis[lua]<2" "redis<4.2"
+(fakeredis 2.x는 aioredis 미지원. redis 4.2 이상이 같이 설치되면 fakeredis 1.x가 redis.asyncio를 사용해
+ 첫 요청에서 AttributeError: 'FakeReader' object has no attribute 'read')
+
+실행: python -m benchmarks.endpoints --users 20 --repeat 50 --output before.json
+"""
+
+import argparse
+import asyncio
+import os
+import sqlite3
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Any, AsyncGenerator
+from uuid import UUID, uuid4
+
+# * settings는 app import 시점에 생성되므로 필수 값(.env 없을 때)을 먼저 채움. 실제 연결은 하지 않음
+for key, value in {
+    "MYSQL_SCHEME": "mysql+aiomysql",
+    "MYSQL_HOST": "localhost",
+    "MYSQL_PORT": "3306",
+    "MYSQL_DATABASE": "testdb",
+    "MYSQL_USER": "bench",
+    "MYSQL_PASSWORD": "bench",
+    "REDIS_SCHEME": "redis",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_DATABASE": "0",
+    "JWT_SECRET_KEY": "bench-secret",
+    "JWT_ALGORITHM": "HS256",
+}.items():
+    os.environ.setdefault(key, value)
+
+from fakeredis.aioredis import FakeRedis  # noqa: E402
+from httpx import ASGITransport, AsyncClient, Response  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.exc import SQLAlchemyError  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.config import settings  # noqa: E402
+from app.handlers import redis as redis_handler  # noqa: E402
+from app.handlers.db import (  # noqa: E402
+    LazySession,
+    ReadSession,
+    get_db_session,
+    get_read_db_session,
+)
+from app.handlers.profiling import QueryProfiler  # noqa: E402
+from app.main import init_app  # noqa: E402
+from app.models.base import ModelBase  # noqa: E402
+
+from .utils import Timings, compare_results, dump_results, print_table, timer  # noqa: E402
+
+PASSWORD = "Bench1234!"
+
+
+def create_sqlite_engine(workdir: Path) -> AsyncEngine:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{workdir / 'main.db'}", connect_args={"timeout": 30}
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def attach_testdb(dbapi_conn: Any, _: Any) -> None:
+        cursor = dbapi_conn.cursor()
+        cursor.execute(f"ATTACH DATABASE '{workdir / 'testdb.db'}' AS testdb")
+        cursor.execute("PRAGMA testdb.journal_mode=WAL")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    QueryProfiler.install(engine)
+    return engine
+
+
+class BenchUser:
+    """가상 유저 1명 (토큰, refresh cookie, 생성한 event id 보관)"""
+
+    # * endpoint별 실행된 SQL 수 합계 (DEBUG 응답 헤더 X-DB-Query-Count)
+    queries: Counter[str] = Counter()
+
+    def __init__(self, client: AsyncClient) -> None:
+        self.client = client
+        self.email = f"bench-{uuid4().hex[:12]}@example.com"
+        self.access_token = ""
+        self.refresh_cookie = ""
+        self.event_ids: list[int] = []
+
+    @property
+    def auth(self) -> dict[str, str]:
+        return {"Authorization": f"{settings.TOKEN_TYPE} {self.access_token}"}
+
+    def keep_tokens(self, res: Response) -> None:
+        self.access_token = res.json()["access_token"]
+        self.refresh_cookie = res.cookies.get(settings.REFRESH_TOKEN_COOKIE_KEY) or ""
+
+    async def call(self, timings: Timings, method: str, url: str, **kwargs: Any) -> Response:
+        with timer(timings):
+            res = await self.client.request(method, url, **kwargs)
+        if res.is_error:
+            raise RuntimeError(f"{method} {url} -> {res.status_code}: {res.text}")
+        self.queries[timings.name] += int(res.headers.get("X-DB-Query-Count", 0))
+        return res
+
+    async def signup(self, timings: Timings) -> None:
+        body = {"email": self.email, "password": PASSWORD, "password2": PASSWORD}
+        await self.call(timings, "POST", "/users/signup", json=body)
+
+    async def signin(self, timings: Timings) -> None:
+        body = {"email": self.email, "password": PASSWORD}
+        self.keep_tokens(await self.call(timings, "POST", "/users/signin", json=body))
+
+    async def refresh(self, timings: Timings) -> None:
+        cookie = {"Cookie": f"{settings.REFRESH_TOKEN_COOKIE_KEY}={self.refresh_cookie}"}
+        self.keep_tokens(await self.call(timings, "POST", "/users/refresh", headers=cookie))
+
+    async def create_event(self, timings: Timings) -> None:
+        body = {"title": "bench", "description": "benchmark event", "tags": ["a", "b"]}
+        res = await self.call(timings, "POST", "/events", json=body, headers=self.auth)
+        self.event_ids.append(res.json()["id"])
+
+    async def list_events(self, timings: Timings) -> None:
+        await self.call(timings, "GET", "/events", params={"limit": 20}, headers=self.auth)
+
+    async def detail_event(self, timings: Timings, i: int) -> None:
+        event_id = self.event_ids[i % len(self.event_ids)]
+        await self.call(timings, "GET", f"/events/{event_id}", headers=self.auth)
+
+    async def update_event(self, timings: Timings, i: int) -> None:
+        event_id = self.event_ids[i % len(self.event_ids)]
+        body = {"title": f"bench {i}", "is_checked": bool(i % 2)}
+        await self.call(timings, "PUT", f"/events/{event_id}", json=body, headers=self.auth)
+
+    async def update_event_minimal(self, timings: Timings, i: int) -> None:
+        """통계 컬럼을 건드리지 않는 수정 + Prefer: return=minimal (조건부 UPDATE 1회)"""
+
+        event_id = self.event_ids[i % len(self.event_ids)]
+        headers = {**self.auth, "Prefer": "return=minimal"}
+        body = {"title": f"bench {i}", "location": "seoul"}
+        await self.call(timings, "PUT", f"/events/{event_id}", json=body, headers=headers)
+
+    async def delete_event(self, timings: Timings) -> None:
+        event_id = self.event_ids.pop()
+        await self.call(timings, "DELETE", f"/events/{event_id}", headers=self.auth)
+
+
+async def run(users: int, repeat: int, auth_repeat: int, workdir: Path) -> list[dict]:
+    engine = create_sqlite_engine(workdir)
+    makers = {
+        cls: async_sessionmaker(bind=engine, class_=cls, autocommit=False, expire_on_commit=False)
+        for cls in (LazySession, ReadSession)
+    }
+    async with engine.begin() as conn:
+        await conn.run_sync(ModelBase.metadata.create_all)
+
+    def sqlite_session(cls: type[LazySession]) -> Any:
+        async def dependency() -> AsyncGenerator:
+            async with makers[cls]() as sess:
+                try:
+                    yield sess
+                except SQLAlchemyError:
+                    await sess.rollback()
+
+        return dependency
+
+    app = init_app()
+    app.dependency_overrides[get_db_session] = sqlite_session(LazySession)
+    app.dependency_overrides[get_read_db_session] = sqlite_session(ReadSession)
+    redis_handler.REDIS_POOL = FakeRedis().connection_pool  # type:ignore
+    settings.AUTH_RATE_LIMIT_IP_CAPACITY = settings.AUTH_RATE_LIMIT_EMAIL_CAPACITY = 10**9
+    settings.DEBUG = True
+
+    transport = ASGITransport(app=app, root_path="/api/v1")  # type:ignore
+    results = []
+    async with AsyncClient(base_url="http://bench", transport=transport) as client:
+        bench_users = [BenchUser(client) for _ in range(users)]
+
+        async def phase(name: str, times: int, step: Any) -> None:
+            timings = Timings(name)
+
+            async def scenario(user: BenchUser) -> None:
+                for i in range(times):
+                    await step(user, timings, i)
+
+            await asyncio.gather(*(scenario(user) for user in bench_users))
+            summary = timings.summary()
+            summary["queries_per_req"] = round(BenchUser.queries[name] / summary["count"], 2)
+            results.append(summary)
+
+        await phase("POST /users/signup", 1, lambda u, t, i: u.signup(t))
+        await phase("POST /users/signin", auth_repeat, lambda u, t, i: u.signin(t))
+        await phase("POST /users/refresh", repeat, lambda u, t, i: u.refresh(t))
+        await phase("POST /events", repeat, lambda u, t, i: u.create_event(t))
+        await phase("GET /events", repeat, lambda u, t, i: u.list_events(t))
+        await phase("GET /events/{id}", repeat, lambda u, t, i: u.detail_event(t, i))
+        await phase("PUT /events/{id}", repeat, lambda u, t, i: u.update_event(t, i))
+        await phase(
+            "PUT /events/{id} (minimal)", repeat, lambda u, t, i: u.update_event_minimal(t, i)
+        )
+        await phase("DELETE /events/{id}", repeat, lambda u, t, i: u.delete_event(t))
+
+    await redis_handler.close_redis_pool()
+    await engine.dispose()
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=20, help="동시 가상 유저 수")
+    parser.add_argument("--repeat", type=int, default=50, help="유저별 endpoint 호출 횟수")
+    parser.add_argument("--auth-repeat", type=int, default=5, help="유저별 signin 횟수 (bcrypt)")
+    parser.add_argument("--db-dir", default=None, help="SQLite 파일 위치 (기본: 임시 디렉터리)")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 json 경로")
+    parser.add_argument("--output", default=None, help="결과를 저장할 json 경로")
+    args = parser.parse_args()
+
+    # * User.id 기본값(uuid4)을 String 컬럼에 그대로 넣으므로 SQLite에서도 문자열로 저장
+    sqlite3.register_adapter(UUID, str)
+
+    if args.db_dir is None:
+        with tempfile.TemporaryDirectory() as workdir:
+            results = await run(args.users, args.repeat, args.auth_repeat, Path(workdir))
+    else:
+        Path(args.db_dir).mkdir(parents=True, exist_ok=True)
+        results = await run(args.users, args.repeat, args.auth_repeat, Path(args.db_dir))
+
+    dump_results(args.output, results)
+    if args.baseline is not None:
+        results = compare_results(results, args.baseline)
+    print_table(results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
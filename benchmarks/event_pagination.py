@@ -0,0 +1,94 @@
+"""OFFSET vs keyset(cursor) pagination latency 비교
+
+한 유저에게 --rows 개(기본 2,097,152)의 이벤트를 INSERT ... SELECT 로 복제해 넣은 뒤
+--page 번째 페이지(기본 1000)를 OFFSET 방식과 id < last_id 방식으로 반복 조회.
+MySQL이 떠 있어야 함 (.env 설정 사용). --cleanup 시 벤치용 유저/이벤트 삭제.
+
+실행: python -m benchmarks.event_pagination --rows 2000000 --page 1000
+"""
+
+import argparse
+import asyncio
+from uuid import uuid4
+
+from sqlalchemy import delete, desc, select, text
+
+from app.handlers.db import ENGINE, SESSION
+from app.models.events import Event
+from app.models.users import User
+
+from .utils import Timings, dump_results, print_table, timer
+
+
+async def seed(user_id: str, rows: int) -> None:
+    async with ENGINE.begin() as conn:
+        await conn.execute(
+            text("INSERT INTO testdb.users (id, email, password) VALUES (:id, :email, 'x')"),
+            {"id": user_id, "email": f"{user_id}@bench.local"},
+        )
+        await conn.execute(
+            text("INSERT INTO testdb.events (title, user_id) VALUES ('bench', :id)"),
+            {"id": user_id},
+        )
+        count = 1
+        while count < rows:
+            await conn.execute(
+                text(
+                    "INSERT INTO testdb.events (title, tags, user_id) "
+                    "SELECT title, tags, user_id FROM testdb.events WHERE user_id = :id "
+                    "LIMIT :n"
+                ),
+                {"id": user_id, "n": min(count, rows - count)},
+            )
+            count += min(count, rows - count)
+    print(f"seeded {count} events for {user_id}")
+
+
+async def run(user_id: str, page: int, limit: int, repeat: int) -> list[dict]:
+    conditions = [Event.user_id == user_id]
+    offset = (page - 1) * limit
+    offset_timings = Timings(f"offset page={page}")
+    cursor_timings = Timings(f"cursor page={page}")
+
+    async with SESSION() as db:
+        # * 직전 페이지 마지막 id (cursor가 가리키는 값) - 측정 대상 아님
+        stmt = select(Event.id).where(*conditions).order_by(desc(Event.id))
+        last_id = (await db.execute(stmt.offset(offset - 1).limit(1))).scalar_one()
+
+        for _ in range(repeat):
+            with timer(offset_timings):
+                by_offset = await Event.list(db, conditions, offset, limit)
+            with timer(cursor_timings):
+                by_cursor = await Event.list(db, conditions, 0, limit, last_id)
+        assert [e.id for e in by_offset] == [e.id for e in by_cursor]
+
+    return [offset_timings.summary(), cursor_timings.summary()]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2**21)
+    parser.add_argument("--page", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--user-id", default=None, help="이미 seed된 유저 재사용")
+    parser.add_argument("--cleanup", action="store_true")
+    parser.add_argument("--output", default=None, help="결과를 저장할 json 경로")
+    args = parser.parse_args()
+
+    user_id = args.user_id or str(uuid4())
+    if args.user_id is None:
+        await seed(user_id, args.rows)
+
+    results = await run(user_id, args.page, args.limit, args.repeat)
+    print_table(results)
+    dump_results(args.output, results)
+
+    if args.cleanup:
+        async with ENGINE.begin() as conn:
+            await conn.execute(delete(User).where(User.id == user_id))
+    await ENGINE.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
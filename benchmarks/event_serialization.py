@@ -0,0 +1,76 @@
+"""list_events 한 페이지 직렬화 비용 비교 (20, 100, 1000개)
+
+- pydantic: FastAPI 기본 경로 (response_model 검증 -> jsonable_encoder -> json.dumps)
+- fast: RowSerializer (필드만 꺼내서 orjson.dumps)
+DB 없이 메모리에 만든 Event 객체 사용.
+
+실행: python -m benchmarks.event_serialization
+"""
+
+import argparse
+import json
+from time import perf_counter
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.apis.events import EVENT_SERIALIZER
+from app.models.events import Event
+from app.schemas.events import ReadEventSchema
+
+from .utils import Timings, dump_results, print_table
+
+ADAPTER = TypeAdapter(list[ReadEventSchema])
+
+
+def make_events(n: int) -> list[Event]:
+    return [
+        Event(
+            id=i,
+            title=f"event {i}",
+            description="description " * 5,
+            tags=["tag1", "tag2", "tag3"],
+            image="https://example.com/image.png",
+            location="Seoul",
+            is_checked=bool(i % 2),
+            user_id="00000000-0000-0000-0000-000000000000",
+        )
+        for i in range(n)
+    ]
+
+
+def pydantic_path(events: list[Event]) -> bytes:
+    validated = ADAPTER.validate_python(events, from_attributes=True)
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def fast_path(events: list[Event]) -> bytes:
+    return EVENT_SERIALIZER.dumps_many(events)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--output", default=None, help="결과를 저장할 json 경로")
+    args = parser.parse_args()
+
+    results = []
+    for size in (20, 100, 1000):
+        events = make_events(size)
+        assert json.loads(pydantic_path(events)) == json.loads(fast_path(events))
+        for name, func in (("pydantic", pydantic_path), ("fast", fast_path)):
+            timings = Timings(f"{name} n={size}")
+            for _ in range(args.repeat):
+                start = perf_counter()
+                func(events)
+                timings.add(perf_counter() - start)
+            summary = timings.summary()
+            summary["us_per_event"] = round(summary["mean_ms"] * 1000 / size, 3)
+            results.append(summary)
+
+    print_table(results)
+    dump_results(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
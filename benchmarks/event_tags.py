@@ -0,0 +1,122 @@
+"""tag 필터 조회: event_tags index vs events.tags(JSON) 직접 검사
+
+한 유저에게 --rows 개(기본 1,000,000)의 이벤트를 넣고 (tag 100종 중 1~3개, 앞쪽 tag일수록 자주 쓰임)
+첫 페이지와 --page 번째 페이지(cursor)를 조회.
+- index: Event.tag_condition (GET /events?tag=... 와 같은 쿼리)
+- json: JSON_OVERLAPS / JSON_CONTAINS 로 events.tags를 행마다 검사 (index 없던 때 방식)
+MySQL 8.0.17+ 이 떠 있어야 함 (.env 설정 사용). --cleanup 시 벤치용 유저/이벤트 삭제.
+
+실행: python -m benchmarks.event_tags --rows 1000000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import delete, func, insert, literal, select, text
+
+from app.handlers.db import ENGINE, SESSION
+from app.models.events import EVENT_TAGS, Event
+from app.models.users import User
+
+from .utils import Timings, dump_results, print_table, timer
+
+TAGS = [f"tag{i:02d}" for i in range(100)]
+# * zipf 비슷한 분포: tag00이 가장 흔하고 tag99가 가장 드묾
+WEIGHTS = [1 / (i + 1) for i in range(len(TAGS))]
+
+CASES = [
+    ("any [common]", ["tag00"], False),
+    ("any [rare]", ["tag99"], False),
+    ("any [3 tags]", ["tag05", "tag50", "tag90"], False),
+    ("all [2 common]", ["tag00", "tag01"], True),
+    ("all [common, rare]", ["tag00", "tag99"], True),
+]
+
+
+async def seed(user_id: str, rows: int, batch: int = 10_000) -> None:
+    rng = random.Random(0)
+    async with ENGINE.begin() as conn:
+        await conn.execute(
+            text("INSERT INTO testdb.users (id, email, password) VALUES (:id, :email, 'x')"),
+            {"id": user_id, "email": f"{user_id}@bench.local"},
+        )
+        stmt = select(func.coalesce(func.max(Event.id), 0))
+        next_id = (await conn.execute(stmt)).scalar_one() + 1
+        for start in range(0, rows, batch):
+            events, tags = [], []
+            for event_id in range(next_id + start, next_id + min(start + batch, rows)):
+                picked = sorted(set(rng.choices(TAGS, WEIGHTS, k=rng.randint(1, 3))))
+                events.append(
+                    {"id": event_id, "title": "bench", "tags": picked, "user_id": user_id}
+                )
+                tags += [{"event_id": event_id, "tag": tag, "user_id": user_id} for tag in picked]
+            await conn.execute(insert(Event), events)
+            await conn.execute(insert(EVENT_TAGS), tags)
+    print(f"seeded {rows} events for {user_id}")
+
+
+def json_condition(tags: list[str], match_all: bool) -> Any:
+    json_func = func.JSON_CONTAINS if match_all else func.JSON_OVERLAPS
+    return json_func(Event.tags, literal(json.dumps(tags))) == 1
+
+
+async def run(user_id: str, page: int, limit: int, repeat: int) -> list[dict]:
+    results = []
+    async with SESSION() as db:
+        for name, tags, match_all in CASES:
+            for kind in ("index", "json"):
+                if kind == "index":
+                    condition = Event.tag_condition(user_id, tags, match_all)
+                else:
+                    condition = json_condition(tags, match_all)
+                conditions = [Event.user_id == user_id, condition]
+
+                # * page 번째 페이지 직전 id (cursor가 가리키는 값) - 측정 대상 아님
+                stmt = select(Event.id).where(*conditions).order_by(Event.id.desc())
+                offset = (page - 1) * limit - 1
+                last_id = (await db.execute(stmt.offset(offset).limit(1))).scalar()
+
+                first = Timings(f"{kind} {name} first page")
+                deep = Timings(f"{kind} {name} page={page}")
+                for _ in range(repeat):
+                    with timer(first):
+                        await Event.list(db, conditions, 0, limit)
+                    if last_id is not None:
+                        with timer(deep):
+                            await Event.list(db, conditions, 0, limit, last_id)
+                results += [first.summary(), deep.summary()]
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--user-id", default=None, help="이미 seed된 유저 재사용")
+    parser.add_argument("--cleanup", action="store_true")
+    parser.add_argument("--output", default=None, help="결과를 저장할 json 경로")
+    args = parser.parse_args()
+
+    user_id = args.user_id or str(uuid4())
+    if args.user_id is None:
+        await seed(user_id, args.rows)
+
+    results = await run(user_id, args.page, args.limit, args.repeat)
+    print_table(results)
+    dump_results(args.output, results)
+
+    if args.cleanup:
+        async with ENGINE.begin() as conn:
+            await conn.execute(delete(EVENT_TAGS).where(EVENT_TAGS.c.user_id == user_id))
+            await conn.execute(delete(User).where(User.id == user_id))
+    await ENGINE.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
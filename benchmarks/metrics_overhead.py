@@ -0,0 +1,122 @@
+"""MetricsMiddleware, metric 기록 1회당 비용 측정 (목표: 요청당 수 µs 이하)
+
+최소한의 ASGI app을 middleware 없이/있이 직접 호출해서 요청 1건당 시간 차이를 계산.
+--rounds 번 반복해서 라운드별 (총 시간 / --calls) 값의 p50, p95 출력 (µs).
+/metrics 출력(render) 비용도 route 수를 늘려 가며 측정.
+
+실행: python -m benchmarks.metrics_overhead --calls 100000
+"""
+
+import argparse
+import asyncio
+import sys
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+
+from starlette.types import Message
+
+from app.handlers.metrics import Counter, Histogram, MetricsRegistry
+from app.middlewares import MetricsMiddleware
+
+from .utils import Timings, dump_results, print_table
+
+
+class FakeRoute:
+    path = "/events/{id}"
+
+
+async def endpoint(scope: dict, receive: Any, send: Any) -> None:
+    scope["route"] = FakeRoute
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def receive() -> dict:
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message: Message) -> None:
+    pass
+
+
+async def measure(
+    name: str, func: Callable[[], Awaitable[Any]], calls: int, rounds: int
+) -> Timings:
+    timings = Timings(name)
+    for _ in range(rounds):
+        start = perf_counter()
+        for _ in range(calls):
+            await func()
+        timings.add((perf_counter() - start) / calls)
+    return timings
+
+
+def row(timings: Timings) -> dict[str, Any]:
+    return {
+        "name": timings.name,
+        "p50_us": round(timings.percentile(50) * 1e6, 3),
+        "p95_us": round(timings.percentile(95) * 1e6, 3),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--budget-us", type=float, default=3.0, help="요청당 허용 overhead")
+    parser.add_argument("--output", default=None, help="결과를 저장할 json 경로")
+    args = parser.parse_args()
+
+    middleware = MetricsMiddleware(endpoint)  # type:ignore
+
+    def scope() -> dict:
+        return {"type": "http", "method": "GET", "path": "/events/1"}
+
+    async def bare() -> None:
+        await endpoint(scope(), receive, send)
+
+    async def instrumented() -> None:
+        await middleware(scope(), receive, send)
+
+    histogram = Histogram("bench_seconds", "bench", ("method", "route"))
+    counter = Counter("bench_total", "bench", ("method", "route", "status"))
+
+    async def observe() -> None:
+        histogram.observe(0.012, "GET", "/events/{id}")
+
+    async def inc() -> None:
+        counter.inc("GET", "/events/{id}", "200")
+
+    results = []
+    base = await measure("no middleware", bare, args.calls, args.rounds)
+    wrapped = await measure("MetricsMiddleware", instrumented, args.calls, args.rounds)
+    results += [row(base), row(wrapped)]
+    overhead = round((wrapped.percentile(50) - base.percentile(50)) * 1e6, 3)
+    results.append({"name": "overhead per request", "p50_us": overhead, "p95_us": ""})
+    for name, func in (("Histogram.observe", observe), ("Counter.inc", inc)):
+        results.append(row(await measure(name, func, args.calls, args.rounds)))
+
+    for routes in (10, 100):
+        registry = MetricsRegistry()
+        hist = registry.register(Histogram("bench_seconds", "bench", ("method", "route")))
+        for i in range(routes):
+            hist.observe(0.01, "GET", f"/route/{i}")
+        start = perf_counter()
+        body = registry.render()
+        results.append(
+            {
+                "name": f"render routes={routes} ({len(body)} bytes)",
+                "p50_us": round((perf_counter() - start) * 1e6, 3),
+                "p95_us": "",
+            }
+        )
+
+    print_table(results)
+    dump_results(args.output, results)
+    if overhead > args.budget_us:
+        print(f"overhead {overhead}us exceeds budget {args.budget_us}us")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
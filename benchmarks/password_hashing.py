@@ -0,0 +1,72 @@
+"""동시 로그인 중 event loop lag 측정 (bcrypt를 loop 안에서 실행 vs BoundedExecutor)
+
+로그인 요청 N개를 동시에 처리하는 동안 10ms 주기의 ticker가 실제로 얼마나 늦게 깨어나는지 기록.
+DB/Redis 없이 PasswordHandler만 사용.
+
+실행: python -m benchmarks.password_hashing --signins 50
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+
+from app.handlers.auth import PasswordHandler
+
+from .utils import Timings, dump_results, print_table
+
+PASSWORD = "Bench1234!"
+TICK = 0.01
+
+
+async def measure_lag(lag: Timings, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = perf_counter()
+        await asyncio.sleep(TICK)
+        lag.add(max(0.0, perf_counter() - start - TICK))
+
+
+async def run(mode: str, signins: int, hashed: str) -> dict:
+    lag = Timings(f"{mode} loop lag")
+
+    async def sign_in() -> None:
+        if mode == "blocking":
+            PasswordHandler.verify_password(PASSWORD, hashed)
+        else:
+            await PasswordHandler.verify_password_async(PASSWORD, hashed)
+        await asyncio.sleep(0)
+
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(measure_lag(lag, stop))
+    await asyncio.sleep(TICK * 2)
+    start = perf_counter()
+    await asyncio.gather(*(sign_in() for _ in range(signins)))
+    elapsed = perf_counter() - start
+    stop.set()
+    await ticker
+
+    summary = lag.summary()
+    summary.pop("throughput_rps")
+    return {
+        **summary,
+        "max_lag_ms": round(max(lag.samples, default=0.0) * 1000, 3),
+        "signins_per_sec": round(signins / elapsed, 2),
+        "executor": PasswordHandler.EXECUTOR.stats.snapshot() if mode != "blocking" else None,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--signins", type=int, default=50)
+    parser.add_argument("--output", default=None, help="결과를 저장할 json 경로")
+    args = parser.parse_args()
+
+    hashed = PasswordHandler.hash_password(PASSWORD)
+    results = [await run(mode, args.signins, hashed) for mode in ("blocking", "executor")]
+    print_table([{k: v for k, v in r.items() if k != "executor"} for r in results])
+    print("executor stats:", results[1]["executor"])
+    dump_results(args.output, results)
+    PasswordHandler.EXECUTOR.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""요청마다 redis 연결을 새로 여는 방식(before)과 공유 pool(after) 비교
+
+/users/signin, /users/refresh 를 in-process(ASGITransport)로 반복 호출하면서
+redis 서버가 받은 연결 수(INFO stats: total_connections_received)와 p50/p99 latency 측정.
+MySQL, Redis가 떠 있어야 함 (.env 설정 사용). rate limit은 측정 중 걸리지 않도록 한도를 높여 둠.
+
+before는 endpoint가 받는 redis(get_redis dependency)만 요청마다 새로 여는 방식으로 바꿈.
+TokenStorage, 유저 cache, rate limiter, 폐기 목록은 before에서도 공유 pool을 사용하므로
+before의 연결 수는 실제 이전 방식보다 적게 나옴 (하한).
+
+실행: python -m benchmarks.redis_pool --iterations 500
+"""
+
+import argparse
+import asyncio
+from typing import AsyncGenerator
+from uuid import uuid4
+
+from aioredis import from_url
+from httpx import ASGITransport, AsyncClient
+
+from app.config import settings
+from app.handlers.redis import close_redis_pool, get_redis
+from app.main import app
+
+from .utils import Timings, dump_results, print_table, timer
+
+PASSWORD = "Bench1234!"
+BEFORE_NOTE = (
+    "note: before는 get_redis dependency만 요청마다 새 연결. "
+    "TokenStorage, cache, rate limiter, 폐기 목록은 공유 pool 사용 (before 연결 수는 하한)"
+)
+
+
+async def legacy_get_redis() -> AsyncGenerator:
+    redis = from_url(settings.REDIS_URL, max_connections=5)
+    try:
+        yield redis
+    finally:
+        await redis.close()
+
+
+async def connections_received() -> int:
+    async with from_url(settings.REDIS_URL) as r:
+        info = await r.info("stats")
+        return int(info["total_connections_received"])
+
+
+async def run(mode: str, iterations: int, concurrency: int) -> list[dict]:
+    if mode == "before":
+        app.dependency_overrides[get_redis] = legacy_get_redis
+    else:
+        app.dependency_overrides.pop(get_redis, None)
+
+    transport = ASGITransport(app=app, root_path="/api/v1")  # type:ignore
+    signin = Timings(f"{mode} /users/signin")
+    refresh = Timings(f"{mode} /users/refresh")
+
+    async with AsyncClient(base_url="http://bench", transport=transport) as client:
+        email = f"bench-{uuid4().hex[:12]}@example.com"
+        body = {"email": email, "password": PASSWORD}
+        res = await client.post("/users/signup", json={**body, "password2": PASSWORD})
+        res.raise_for_status()
+
+        # * 측정용 admin 연결 1개 포함
+        before = await connections_received()
+        sem = asyncio.Semaphore(concurrency)
+
+        async def scenario() -> None:
+            async with sem:
+                with timer(signin):
+                    res = await client.post("/users/signin", json=body)
+                assert res.status_code == 200, f"/users/signin -> {res.status_code}: {res.text}"
+                cookie = res.cookies.get(settings.REFRESH_TOKEN_COOKIE_KEY)
+                headers = {"Cookie": f"{settings.REFRESH_TOKEN_COOKIE_KEY}={cookie}"}
+                with timer(refresh):
+                    res = await client.post("/users/refresh", headers=headers)
+                assert res.status_code == 200, f"/users/refresh -> {res.status_code}: {res.text}"
+
+        await asyncio.gather(*(scenario() for _ in range(iterations)))
+        opened = await connections_received() - before - 1
+
+    await close_redis_pool()
+    app.dependency_overrides.clear()
+    return [{**t.summary(), "redis_connections": opened} for t in (signin, refresh)]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--output", default=None, help="결과를 저장할 json 경로")
+    args = parser.parse_args()
+
+    # * 실제 redis에 남아 있는 이전 실행의 bucket도 바로 채워지도록 충전량도 높임
+    settings.AUTH_RATE_LIMIT_IP_CAPACITY = settings.AUTH_RATE_LIMIT_EMAIL_CAPACITY = 10**9
+    settings.AUTH_RATE_LIMIT_IP_PER_SECOND = settings.AUTH_RATE_LIMIT_EMAIL_PER_SECOND = 10**9
+    results = []
+    for mode in ("before", "after"):
+        results += await run(mode, args.iterations, args.concurrency)
+    print_table(results)
+    print(BEFORE_NOTE)
+    dump_results(args.output, results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+"""폐기(revocation) 1건당 redis 메모리: 토큰 원문 key(이전) vs jti key(현재)
+
+각 방식으로 --count 개의 blacklist key를 만든 뒤 INFO memory(used_memory) 증가량과
+MEMORY USAGE 표본 평균을 비교. worker별 Bloom filter 크기도 함께 출력.
+Redis가 떠 있어야 함 (.env 설정 사용). 벤치용 prefix를 쓰고 끝나면 삭제.
+
+실행: python -m benchmarks.revocation_memory --count 100000
+"""
+
+import argparse
+import asyncio
+
+from aioredis import from_url
+
+from app.config import settings
+from app.handlers.jwt import TokenHandler, TokenPayload
+from app.handlers.revocation import RevocationRegistry
+
+from .utils import dump_results, print_table
+
+PREFIX = "bench_blacklist"
+
+
+async def measure(name: str, ids: list[str], ttl: int) -> dict:
+    async with from_url(settings.REDIS_URL) as redis:
+        before = int((await redis.info("memory"))["used_memory"])
+        for start in range(0, len(ids), 1000):
+            async with redis.pipeline(transaction=False) as pipe:
+                for revocation_id in ids[start : start + 1000]:
+                    pipe.set(f"{PREFIX}:{revocation_id}", 1, ex=ttl)
+                await pipe.execute()
+        after = int((await redis.info("memory"))["used_memory"])
+
+        sample = ids[:: max(1, len(ids) // 100)]
+        usages = [await redis.memory_usage(f"{PREFIX}:{i}") for i in sample]
+
+        keys = [f"{PREFIX}:{revocation_id}" for revocation_id in ids]
+        for start in range(0, len(keys), 1000):
+            await redis.delete(*keys[start : start + 1000])
+
+    return {
+        "name": name,
+        "count": len(ids),
+        "key_bytes": len(f"{PREFIX}:{ids[0]}"),
+        "used_memory_per_key": round((after - before) / len(ids), 1),
+        "memory_usage_avg": round(sum(usages) / len(usages), 1),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--output", default=None, help="결과를 저장할 json 경로")
+    args = parser.parse_args()
+
+    ttl = settings.REFRESH_TOKEN_EXPIRES_SECONDS
+    user_id = "00000000-0000-0000-0000-000000000000"
+    payloads = [TokenPayload.from_user(user_id, ttl, False) for _ in range(args.count)]
+    tokens = [TokenHandler.encode_token(payload) for payload in payloads]
+
+    results = [
+        await measure("token key (before)", tokens, ttl),
+        await measure("jti key (after)", [payload.jti for payload in payloads], ttl),
+    ]
+    print_table(results)
+
+    bloom = RevocationRegistry.FILTER
+    capacity = settings.REVOCATION_BLOOM_CAPACITY
+    print(
+        f"bloom filter per worker: {len(bloom.bits)} bytes, {bloom.hash_count} hashes, "
+        f"{len(bloom.bits) / capacity:.2f} bytes/revocation at capacity {capacity}"
+    )
+    dump_results(args.output, results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
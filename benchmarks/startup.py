@@ -0,0 +1,83 @@
+"""프로세스 실행부터 첫 요청 응답까지 걸리는 시간 측정
+
+uvicorn을 --runs 번 새로 띄워서
+- ready: 실행 ~ GET /health 첫 200 응답 (lifespan 시작 완료 후에야 응답함)
+- first_db_request: ready 직후 DB, redis를 쓰는 첫 요청(없는 계정 로그인 -> 401) latency
+를 기록. --no-warm-up 이면 pool 미리 열기를 끄고(DB_POOL_WARM_SIZE=0, REDIS_POOL_WARM_SIZE=0) 비교.
+MySQL, Redis가 떠 있어야 함 (.env 설정 사용).
+
+실행: python -m benchmarks.startup --runs 5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from time import perf_counter
+
+from httpx import AsyncClient, HTTPError
+
+from .utils import Timings, dump_results, print_table
+
+
+async def wait_ready(client: AsyncClient, timeout: float) -> None:
+    deadline = perf_counter() + timeout
+    while perf_counter() < deadline:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except HTTPError:
+            pass
+        await asyncio.sleep(0.01)
+    raise TimeoutError("server did not become ready")
+
+
+async def run_once(port: int, env: dict[str, str], timeout: float) -> tuple[float, float]:
+    start = perf_counter()
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable,
+        *("-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"),
+        env=env,
+    )
+    try:
+        async with AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=timeout) as client:
+            await wait_ready(client, timeout)
+            ready = perf_counter() - start
+            body = {"email": "startup-bench@example.com", "password": "Bench1234!"}
+            request_start = perf_counter()
+            await client.post("/users/signin", json=body)
+            return ready, perf_counter() - request_start
+    finally:
+        proc.terminate()
+        await proc.wait()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--no-warm-up", action="store_true", help="pool 미리 열기 끄고 측정")
+    parser.add_argument("--output", default=None, help="결과를 저장할 json 경로")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    label = "warm-up"
+    if args.no_warm_up:
+        env.update(DB_POOL_WARM_SIZE="0", REDIS_POOL_WARM_SIZE="0")
+        label = "no warm-up"
+
+    ready = Timings(f"{label} ready")
+    first_request = Timings(f"{label} first_db_request")
+    for _ in range(args.runs):
+        ready_seconds, request_seconds = await run_once(args.port, env, args.timeout)
+        ready.add(ready_seconds)
+        first_request.add(request_seconds)
+
+    results = [ready.summary(), first_request.summary()]
+    print_table(results)
+    dump_results(args.output, results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,55 @@
+"""요청당 access token 검증 비용 (backend별, 검증 cache cold/warm)
+
+- cold: 매 요청 cache를 비움 (서명 검증 + payload 파싱)
+- warm: 같은 토큰 반복 (digest 계산 + cache 조회)
+DB/Redis 없이 TokenHandler만 사용.
+
+실행: python -m benchmarks.token_decode
+"""
+
+import argparse
+from time import perf_counter
+
+from app.config import settings
+from app.handlers.jwt import TokenHandler
+from app.handlers.jwt_codecs import CODECS, get_codec
+from app.models.users import User
+
+from .utils import Timings, dump_results, print_table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20_000)
+    parser.add_argument("--output", default=None, help="결과를 저장할 json 경로")
+    args = parser.parse_args()
+
+    user = User(id="00000000-0000-0000-0000-000000000000", is_admin=False)
+    results = []
+    for backend in CODECS:
+        try:
+            TokenHandler.CODEC = get_codec(backend, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+        except ValueError as e:
+            print(f"skip {backend}: {e}")
+            continue
+        token = TokenHandler.generate_access_token(user)
+
+        for mode in ("cold", "warm"):
+            timings = Timings(f"{backend} {mode}")
+            TokenHandler.VERIFIED.clear()
+            for _ in range(args.repeat):
+                if mode == "cold":
+                    TokenHandler.VERIFIED.clear()
+                start = perf_counter()
+                TokenHandler.decode_token(token)
+                timings.add(perf_counter() - start)
+            summary = timings.summary()
+            summary["mean_us"] = round(summary["mean_ms"] * 1000, 2)
+            results.append(summary)
+
+    print_table(results)
+    dump_results(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
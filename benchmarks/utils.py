@@ -0,0 +1,91 @@
+import json
+import math
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+
+@dataclass
+class Timings:
+    """구간별 latency(초) 기록 후 요약 통계 반환
+
+    throughput은 첫 구간 시작부터 마지막 구간 끝까지의 wall-clock 시간 기준 (동시 실행 반영)
+    """
+
+    name: str
+    samples: list[float] = field(default_factory=list)
+    first_start: float = math.inf
+    last_end: float = -math.inf
+
+    def add(self, seconds: float) -> None:
+        end = perf_counter()
+        self.samples.append(seconds)
+        self.first_start = min(self.first_start, end - seconds)
+        self.last_end = max(self.last_end, end)
+
+    def percentile(self, p: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        idx = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+        return ordered[idx]
+
+    def summary(self) -> dict[str, Any]:
+        elapsed = self.last_end - self.first_start
+        return {
+            "name": self.name,
+            "count": len(self.samples),
+            "throughput_rps": round(len(self.samples) / elapsed, 2) if elapsed > 0 else 0.0,
+            "mean_ms": round(statistics.fmean(self.samples) * 1000, 3) if self.samples else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p95_ms": round(self.percentile(95) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+        }
+
+
+class timer:
+    """with timer(timings): ... 구간 측정"""
+
+    def __init__(self, timings: Timings) -> None:
+        self.timings = timings
+
+    def __enter__(self) -> "timer":
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.timings.add(perf_counter() - self.start)
+
+
+def print_table(rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        return
+    headers = list(rows[0].keys())
+    widths = {h: max(len(h), *(len(str(r.get(h, ""))) for r in rows)) for h in headers}
+    print("  ".join(h.ljust(widths[h]) for h in headers))
+    for row in rows:
+        print("  ".join(str(row.get(h, "")).ljust(widths[h]) for h in headers))
+
+
+def dump_results(path: str | None, results: Any) -> None:
+    if path is None:
+        return
+    Path(path).write_text(json.dumps(results, indent=2, default=str))
+    print(f"results saved: {path}")
+
+
+def compare_results(results: list[dict[str, Any]], baseline_path: str) -> list[dict[str, Any]]:
+    """이전 결과(json)와 name이 같은 항목끼리 p50/p95 변화율(%) 추가"""
+
+    baseline = {row["name"]: row for row in json.loads(Path(baseline_path).read_text())}
+    rows = []
+    for row in results:
+        base = baseline.get(row["name"])
+        row = dict(row)
+        for key in ("p50_ms", "p95_ms"):
+            if base and base.get(key):
+                row[f"{key[:3]}_change"] = f"{(row[key] - base[key]) / base[key] * 100:+.1f}%"
+        rows.append(row)
+    return rows
@@ -27,7 +27,16 @@ CREATE TABLE IF NOT EXISTS events (
     created_at TIMESTAMP DEFAULT now(),
     updated_at TIMESTAMP DEFAULT now() ON UPDATE now(),
     CONSTRAINT events_pkey PRIMARY KEY (id),
+    INDEX events_user_id_id_idx (user_id, id),
+    FULLTEXT INDEX events_fulltext_idx (title, description, location) WITH PARSER ngram,
     CONSTRAINT users_id_fkey FOREIGN KEY (user_id)
         REFERENCES testdb.users (id)
         ON DELETE CASCADE
-);
\ No newline at end of file
+);
+CREATE TABLE IF NOT EXISTS event_tags (
+    event_id BIGINT UNSIGNED NOT NULL,
+    tag VARCHAR(50) COLLATE utf8mb4_bin NOT NULL,
+    user_id VARCHAR(36) NOT NULL,
+    CONSTRAINT event_tags_pkey PRIMARY KEY (event_id, tag),
+    INDEX event_tags_user_id_tag_event_id_idx (user_id, tag, event_id)
+);
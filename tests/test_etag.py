@@ -0,0 +1,118 @@
+from time import time
+
+import pytest
+from aioredis import ConnectionError
+from starlette.requests import Request
+
+from app.exceptions import NotModifiedException
+from app.handlers.etag import ETagHandler
+from app.handlers.redis import REDIS_BREAKER
+
+
+class FakeRedis:
+    def __init__(self, version: int | None, fail_delete: bool = False) -> None:
+        self.version = version
+        self.fail_delete = fail_delete
+
+    async def get(self, key: str) -> bytes | None:
+        return None if self.version is None else str(self.version).encode()
+
+    async def delete(self, *keys: str) -> int:
+        if self.fail_delete:
+            raise ConnectionError
+        self.version = None
+        return len(keys)
+
+    async def eval(self, script: str, numkeys: int, key: str, now: int, ttl: int) -> int:
+        self.version = max(now, (self.version or 0) + 1)
+        return self.version
+
+
+def close_breaker() -> None:
+    REDIS_BREAKER.failures = 0
+    REDIS_BREAKER.state = REDIS_BREAKER.CLOSED
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    yield
+    ETagHandler._stale.clear()
+    close_breaker()
+
+
+def make_request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    scope = {"type": "http", "method": "GET", "path": "/events", "query_string": b""}
+    return Request({**scope, "headers": headers})
+
+
+@pytest.mark.asyncio
+async def test_check_returns_etag():
+    version = int(time() * 1000)
+    etag = await ETagHandler.check(make_request(), FakeRedis(version), "u1")
+
+    assert etag == ETagHandler.make_etag(make_request(), "u1", version)
+
+
+@pytest.mark.asyncio
+async def test_check_matching_etag_raises_not_modified():
+    version = int(time() * 1000)
+    etag = ETagHandler.make_etag(make_request(), "u1", version)
+
+    with pytest.raises(NotModifiedException):
+        await ETagHandler.check(make_request(etag), FakeRedis(version), "u1")
+
+
+@pytest.mark.asyncio
+async def test_check_ignores_wildcard():
+    version = int(time() * 1000)
+
+    assert await ETagHandler.check(make_request("*"), FakeRedis(version), "u1")
+
+
+@pytest.mark.asyncio
+async def test_recent_write_has_no_etag_within_min_age():
+    """replica 응답: 복제 지연 안의 쓰기면 ETag를 붙이지 않지만, 이미 가진 ETag의 304는 유지"""
+
+    recent = int(time() * 1000)
+    assert await ETagHandler.check(make_request(), FakeRedis(recent), "u1", min_age=5) is None
+
+    etag = ETagHandler.make_etag(make_request(), "u1", recent)
+    with pytest.raises(NotModifiedException):
+        await ETagHandler.check(make_request(etag), FakeRedis(recent), "u1", min_age=5)
+
+    settled = int((time() - 10) * 1000)
+    assert await ETagHandler.check(make_request(), FakeRedis(settled), "u1", min_age=5)
+
+
+@pytest.mark.asyncio
+async def test_invalidate_deletes_version():
+    old = int((time() - 10) * 1000)
+    redis = FakeRedis(old)
+    old_etag = ETagHandler.make_etag(make_request(), "u1", old)
+
+    await ETagHandler.invalidate(redis, "u1")
+
+    assert redis.version is None
+    etag = await ETagHandler.check(make_request(old_etag), redis, "u1")
+    assert etag and etag != old_etag
+
+
+@pytest.mark.asyncio
+async def test_failed_invalidate_disables_etag_until_deleted():
+    """version 증가, 삭제가 모두 실패하면 이전 ETag로 304를 주지 않음"""
+
+    old = int((time() - 10) * 1000)
+    old_etag = ETagHandler.make_etag(make_request(), "u1", old)
+    redis = FakeRedis(old, fail_delete=True)
+
+    await ETagHandler.invalidate(redis, "u1")
+
+    assert await ETagHandler.check(make_request(old_etag), redis, "u1") is None
+
+    # * redis 복구 (breaker는 연속 실패로 open 상태)
+    redis.fail_delete = False
+    close_breaker()
+    etag = await ETagHandler.check(make_request(old_etag), redis, "u1")
+    assert etag and etag != old_etag
+    assert not ETagHandler._stale
@@ -0,0 +1,21 @@
+import importlib
+import pkgutil
+
+import pytest
+
+import app
+
+MODULES = sorted(info.name for info in pkgutil.walk_packages(app.__path__, f"{app.__name__}."))
+
+
+@pytest.mark.parametrize("name", MODULES)
+def test_import(name):
+    """모든 app 모듈이 import 되는지 (class 본문 annotation 평가 오류 등)"""
+
+    importlib.import_module(name)
+
+
+def test_init_app():
+    from app.main import init_app
+
+    assert init_app().routes
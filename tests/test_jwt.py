@@ -0,0 +1,77 @@
+from hashlib import blake2b
+from time import monotonic, time
+
+import pytest
+from jose import jwt  # type:ignore
+
+from app.exceptions import InvalidTokenException
+from app.handlers.cache import TTLCache
+from app.handlers.jwt import TokenHandler, TokenPayload
+from app.handlers.jwt_codecs import HMACCodec, JoseCodec
+
+SECRET = "test-secret"
+
+
+def claims(exp_in: int = 60) -> dict:
+    return {"sub": "u1", "exp": int(time()) + exp_in, "is_admin": False, "jti": "abc"}
+
+
+@pytest.mark.parametrize("algorithm", ["HS256", "HS384", "HS512"])
+def test_hmac_and_jose_round_trip(algorithm: str):
+    hmac_codec, jose_codec = HMACCodec(SECRET, algorithm), JoseCodec(SECRET, algorithm)
+    payload = claims()
+
+    assert jose_codec.decode(hmac_codec.encode(payload)) == payload
+    assert hmac_codec.decode(jose_codec.encode(payload)) == payload
+    assert jwt.decode(hmac_codec.encode(payload), SECRET, algorithm) == payload
+
+
+@pytest.mark.parametrize("codec", [HMACCodec, JoseCodec])
+def test_rejects_bad_signature(codec: type[HMACCodec] | type[JoseCodec]):
+    other_key = codec("other-secret", "HS256").encode(claims())
+    header, _, signature = codec(SECRET, "HS256").encode(claims()).split(".")
+    _, admin, _ = codec(SECRET, "HS256").encode({**claims(), "is_admin": True}).split(".")
+    tampered = f"{header}.{admin}.{signature}"
+
+    for bad in (other_key, tampered, "not-a-token", f"{header}.{admin}."):
+        with pytest.raises(InvalidTokenException):
+            codec(SECRET, "HS256").decode(bad)
+
+
+def test_hmac_rejects_other_algorithm():
+    token = HMACCodec(SECRET, "HS512").encode(claims())
+
+    with pytest.raises(InvalidTokenException):
+        HMACCodec(SECRET, "HS256").decode(token)
+
+
+@pytest.mark.parametrize("codec", [HMACCodec, JoseCodec])
+def test_rejects_expired_token(codec: type[HMACCodec] | type[JoseCodec]):
+    token = codec(SECRET, "HS256").encode(claims(exp_in=-10))
+
+    with pytest.raises(InvalidTokenException):
+        codec(SECRET, "HS256").decode(token)
+
+
+@pytest.fixture
+def verified(monkeypatch: pytest.MonkeyPatch) -> TTLCache[TokenPayload]:
+    cache: TTLCache[TokenPayload] = TTLCache(100, 3600)
+    monkeypatch.setattr(TokenHandler, "VERIFIED", cache)
+    return cache
+
+
+def test_verified_cache_ttl_capped_at_exp(verified: TTLCache[TokenPayload]):
+    payload = TokenPayload(sub="u1", exp=int(time()) + 5, is_admin=False, jti="abc")
+    token = TokenHandler.encode_token(payload)
+
+    assert TokenHandler.decode_token(token) == payload
+    expires_at, _ = verified._data[blake2b(token.encode(), digest_size=16).digest()]
+    assert expires_at - monotonic() <= 5
+
+
+def test_expired_token_not_cached(verified: TTLCache[TokenPayload]):
+    payload = TokenPayload(sub="u1", exp=int(time()) - 10, is_admin=False, jti="abc")
+
+    with pytest.raises(InvalidTokenException):
+        TokenHandler.decode_token(TokenHandler.encode_token(payload))
+    assert len(verified) == 0
@@ -0,0 +1,60 @@
+import pytest
+from aioredis import ConnectionError
+
+from app.exceptions import ServiceUnavailableException
+from app.handlers.redis import (
+    CircuitBreaker,
+    DeadlineConnectionPool,
+    RedisUnavailableError,
+    retry_on_redis_error,
+)
+
+
+def failing(breaker: CircuitBreaker, **kwargs):
+    calls = []
+
+    @retry_on_redis_error(base_delay=0, breaker=breaker, **kwargs)
+    async def command() -> None:
+        calls.append(1)
+        raise ConnectionError
+
+    return command, calls
+
+
+@pytest.mark.asyncio
+async def test_retry_raises_service_unavailable():
+    command, calls = failing(CircuitBreaker(10, 60), max_retries=3)
+
+    with pytest.raises(ServiceUnavailableException):
+        await command()
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_skips_redis():
+    breaker = CircuitBreaker(2, 60)
+    command, calls = failing(breaker, max_retries=1, error=RedisUnavailableError)
+
+    for _ in range(2):
+        with pytest.raises(RedisUnavailableError):
+            await command()
+    assert breaker.state == breaker.OPEN
+    assert breaker.transitions == {"closed->open": 1}
+
+    with pytest.raises(RedisUnavailableError):
+        await command()
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_wait_capped_by_deadline():
+    pool = DeadlineConnectionPool(timeout=5)
+    seen = []
+
+    @retry_on_redis_error(deadline=0.2, breaker=CircuitBreaker(10, 60))
+    async def command() -> None:
+        seen.append(pool.timeout)
+
+    await command()
+    assert 0 < seen[0] <= 0.2
+    assert pool.timeout == 5
@@ -0,0 +1,139 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from aioredis import ConnectionError
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.config import settings
+from app.handlers import revocation
+from app.handlers.jwt import TokenHandler, TokenIssuer
+from app.handlers.redis import REDIS_BREAKER
+from app.handlers.revocation import BloomFilter, RevocationRegistry
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.commands: list = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def set(self, key: str, value, ex: int | None = None, nx: bool = False) -> None:
+        self.commands.append(("set", key, value, nx))
+
+    def get(self, key: str) -> None:
+        self.commands.append(("get", key))
+
+    def delete(self, key: str) -> None:
+        self.commands.append(("delete", key))
+
+    def publish(self, channel: str, message: str) -> None:
+        self.commands.append(("publish", channel, message))
+
+    async def execute(self) -> list:
+        return [self.redis.run(*command) for command in self.commands]
+
+
+class FakeRedis:
+    def __init__(self, fail: bool = False) -> None:
+        self.store: dict[str, bytes] = {}
+        self.published: list[str] = []
+        self.fail = fail
+
+    def run(self, name: str, *args):
+        if name == "set":
+            key, value, nx = args
+            if nx and key in self.store:
+                return None
+            self.store[key] = str(value).encode()
+            return True
+        if name == "get":
+            return self.store.get(args[0])
+        if name == "delete":
+            return int(self.store.pop(args[0], None) is not None)
+        self.published.append(args[1])
+        return 1
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def exists(self, key: str) -> int:
+        if self.fail:
+            raise ConnectionError
+        return int(key in self.store)
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(RevocationRegistry, "FILTER", BloomFilter(1000, 0.01))
+    monkeypatch.setattr(RevocationRegistry, "_synced", False)
+    yield
+    REDIS_BREAKER.failures = 0
+    REDIS_BREAKER.state = REDIS_BREAKER.CLOSED
+
+
+def use_redis(monkeypatch: pytest.MonkeyPatch, redis: FakeRedis) -> None:
+    monkeypatch.setattr(revocation, "Redis", lambda connection_pool: redis)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    items = [uuid4().hex for _ in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    false_positives = sum(uuid4().hex in bloom for _ in range(10000))
+    assert false_positives < 10000 * 0.05
+
+
+@pytest.mark.asyncio
+async def test_is_revoked_skips_redis_when_not_in_filter(monkeypatch: pytest.MonkeyPatch):
+    redis = FakeRedis(fail=True)
+    use_redis(monkeypatch, redis)
+    monkeypatch.setattr(RevocationRegistry, "_synced", True)
+
+    assert await RevocationRegistry.is_revoked("jti") is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("synced", [True, False])
+async def test_is_revoked_falls_back_to_synced_on_redis_error(
+    monkeypatch: pytest.MonkeyPatch, synced: bool
+):
+    """redis 장애 시 동기화 중이면 Bloom filter 결과(폐기), 동기화 전이면 통과"""
+
+    use_redis(monkeypatch, FakeRedis(fail=True))
+    monkeypatch.setattr(RevocationRegistry, "_synced", synced)
+    RevocationRegistry.add("jti")
+
+    assert await RevocationRegistry.is_revoked("jti") is synced
+
+
+@pytest.mark.asyncio
+async def test_sign_out_revokes_access_and_refresh_jti(monkeypatch: pytest.MonkeyPatch):
+    redis = FakeRedis()
+    use_redis(monkeypatch, redis)
+    user = SimpleNamespace(id="u1", is_admin=False)
+    access_token = TokenHandler.generate_access_token(user)  # type:ignore
+    refresh_token = TokenHandler.generate_refresh_token(user)  # type:ignore
+    headers = [
+        (b"authorization", f"{settings.TOKEN_TYPE} {access_token}".encode()),
+        (b"cookie", f"{settings.REFRESH_TOKEN_COOKIE_KEY}={refresh_token}".encode()),
+    ]
+    request = Request({"type": "http", "method": "POST", "path": "/", "headers": headers})
+
+    await TokenIssuer(request, Response(), redis).revoke_token()  # type:ignore
+
+    jtis = [TokenHandler.decode_token(t).jti for t in (access_token, refresh_token)]
+    assert redis.published == jtis
+    for jti in jtis:
+        assert RevocationRegistry.key(jti) in redis.store
+        assert jti in RevocationRegistry.FILTER
+        assert await RevocationRegistry.is_revoked(jti)